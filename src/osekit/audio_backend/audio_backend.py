@@ -21,7 +21,14 @@ class AudioBackend(Protocol):
         """
         ...
 
-    def read(self, path: PathLike | str, start: int, stop: int) -> np.ndarray:
+    def read(
+        self,
+        path: PathLike | str,
+        start: int,
+        stop: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         """Read the content of an audio file.
 
         If the audio file is not the current opened file,
@@ -35,6 +42,13 @@ class AudioBackend(Protocol):
             First frame to read.
         stop: int
             Frame after the last frame to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+            Floating types are scaled in ``[-1.,1.[``,
+            integer types are scaled to their full range.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
 
         Returns
         -------
@@ -50,4 +64,10 @@ class AudioBackend(Protocol):
 
     def seek(self, path: PathLike, frame: int) -> None: ...
 
-    def stream(self, path: PathLike, chunk_size: int) -> np.ndarray: ...
+    def stream(
+        self,
+        path: PathLike,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray: ...
@@ -1,39 +1,146 @@
-"""Audio File Manager which keeps an audio file open until a request in another file is made.
+"""Audio File Manager which keeps a bounded pool of audio files open.
 
-This workflow avoids closing/opening a same file repeatedly.
+This workflow avoids closing/opening a same file repeatedly,
+even when the requests alternate between several files.
 """
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from osekit.audio_backend.mseed_backend import MSeedBackend
 from osekit.audio_backend.soundfile_backend import SoundFileBackend
+from osekit.audio_backend.wav_memmap_backend import WavMemmapBackend
 
 if TYPE_CHECKING:
     from os import PathLike
 
-    import numpy as np
+    from osekit.audio_backend.block_cache import BlockCache
 
 
 class AudioFileManager:
-    """Audio File Manager which keeps an audio file open until a request in another file is made."""
+    """Audio File Manager which keeps a bounded pool of audio files open.
+
+    The least recently used file is closed when a new file is requested
+    while the pool is full.
+
+    Uncompressed PCM/float WAV files are memory-mapped rather than decoded,
+    other formats are read with ``soundfile`` (or ``obspy`` for MSEED files).
+    If a ``BlockCache`` with a non-zero size is attached to the manager,
+    the decoded frames of these other formats are read through it.
+    """
 
-    def __init__(self) -> None:
-        """Initialize an audio file manager."""
-        self._soundfile = SoundFileBackend()
+    def __init__(
+        self,
+        max_open_files: int = 8,
+        block_cache: BlockCache | None = None,
+    ) -> None:
+        """Initialize an audio file manager.
+
+        Parameters
+        ----------
+        max_open_files: int
+            Maximum number of audio files that are kept open simultaneously
+            by each backend.
+        block_cache: BlockCache | None
+            Cache of the decoded audio blocks.
+            It can be shared between several managers.
+            If ``None``, the audio files are always decoded.
+
+        """
+        self._soundfile = SoundFileBackend(max_open_files=max_open_files)
+        self._wav = WavMemmapBackend(max_open_files=max_open_files)
         self._mseed: MSeedBackend | None = None
+        self.block_cache = block_cache
+        self._positions: dict[str, int] = {}
+        self._signatures: dict[str, tuple[int, int]] = {}
+        self._prefetch_stats = dict.fromkeys(
+            (
+                "streams",
+                "produced",
+                "consumed",
+                "max_queued",
+                "consumer_waits",
+                "producer_waits",
+            ),
+            0,
+        )
+
+    @property
+    def max_open_files(self) -> int:
+        """Maximum number of audio files that are kept open simultaneously."""
+        return self._soundfile.max_open_files
+
+    @max_open_files.setter
+    def max_open_files(self, value: int) -> None:
+        self._soundfile.max_open_files = value
+        self._wav.max_open_files = value
+
+    @property
+    def stats(self) -> dict[str, dict]:
+        """Hit, miss and eviction counters of the pool of opened files, per backend.
+
+        The ``"prefetch"`` entry accumulates the counters of the prefetched
+        streams consumed in the thread of this manager.
+        The ``"cache"`` entry contains the counters of the ``BlockCache``
+        attached to the manager, if any.
+
+        >>> afm = AudioFileManager()
+        >>> afm.stats["soundfile"]
+        {'hits': 0, 'misses': 0, 'evictions': 0, 'open': 0, 'max_size': 8}
+
+        """
+        stats = {
+            "soundfile": self._soundfile.stats,
+            "wav": self._wav.stats,
+            "prefetch": dict(self._prefetch_stats),
+        }
+        if self.block_cache is not None:
+            stats["cache"] = self.block_cache.stats
+        return stats
+
+    def record_prefetch(self, stats: dict) -> None:
+        """Accumulate the counters of a prefetched stream.
+
+        Parameters
+        ----------
+        stats: dict
+            The ``Prefetcher.stats`` of the consumed stream.
+
+        """
+        self._prefetch_stats["streams"] += 1
+        for key in ("produced", "consumed", "consumer_waits", "producer_waits"):
+            self._prefetch_stats[key] += stats[key]
+        self._prefetch_stats["max_queued"] = max(
+            self._prefetch_stats["max_queued"],
+            stats["max_queued"],
+        )
 
     def close(self) -> None:
-        """Close the currently opened file."""
+        """Close all opened files.
+
+        The attached ``BlockCache`` is shared with other managers: it is not cleared.
+        """
+        self._positions.clear()
+        self._signatures.clear()
         self._soundfile.close()
+        self._wav.close()
         if self._mseed:
             self._mseed.close()
 
-    def _backend(self, path: PathLike | str) -> SoundFileBackend | MSeedBackend:
+    def _backend(
+        self,
+        path: PathLike | str,
+    ) -> SoundFileBackend | WavMemmapBackend | MSeedBackend:
         suffix = Path(path).suffix.lower()
 
+        if suffix == ".wav" and self._wav.supports(path):
+            return self._wav
+
         if suffix == ".mseed":
             if self._mseed is None:
                 self._mseed = MSeedBackend()
@@ -55,6 +162,7 @@ class AudioFileManager:
             Sample rate, number of frames and channels of the audio file.
 
         """
+        self._refresh(path)
         return self._backend(path).info(path)
 
     def read(
@@ -62,11 +170,13 @@ class AudioFileManager:
         path: PathLike | str,
         start: int = 0,
         stop: int | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
     ) -> np.ndarray:
         """Read the content of an audio file.
 
-        If the audio file is not the current opened file,
-        the current opened file is switched.
+        If the audio file is not opened yet, it is added to the pool
+        of opened files.
 
         Parameters
         ----------
@@ -76,6 +186,13 @@ class AudioFileManager:
             First frame to read.
         stop: int | None
             Frame after the last frame to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+            Floating types are scaled in ``[-1.,1.[``,
+            integer types are scaled to their full range.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
 
         Returns
         -------
@@ -83,7 +200,9 @@ class AudioFileManager:
             A ``(channel * frames)`` array containing the audio data.
 
         """
-        _, frames, _ = self.info(path)
+        self._refresh(path)
+        backend = self._backend(path)
+        _, frames, _ = backend.info(path)
 
         if stop is None:
             stop = frames
@@ -98,10 +217,131 @@ class AudioFileManager:
             msg = "Start should be inferior to Stop."
             raise ValueError(msg)
 
-        return self._backend(path).read(path=path, start=start, stop=stop)
+        if self._is_cached(backend):
+            return self._read_cached(
+                path=path,
+                start=start,
+                stop=stop,
+                dtype=dtype,
+                channels=channels,
+            )
+
+        return backend.read(
+            path=path,
+            start=start,
+            stop=stop,
+            dtype=dtype,
+            channels=channels,
+        )
 
     def seek(self, path: Path, frame: int) -> None:
+        self._refresh(path)
+        self._positions[str(path)] = frame
         self._backend(path=path).seek(path=path, frame=frame)
 
-    def stream(self, path: Path, chunk_size: int) -> np.ndarray:
-        return self._backend(path=path).stream(path=path, chunk_size=chunk_size)
+    def stream(
+        self,
+        path: Path,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
+        backend = self._backend(path=path)
+        if not self._is_cached(backend):
+            return backend.stream(
+                path=path,
+                chunk_size=chunk_size,
+                dtype=dtype,
+                channels=channels,
+            )
+
+        _, frames, _ = backend.info(path)
+        start = self._positions.get(str(path), 0)
+        stop = min(start + chunk_size, frames)
+        self._positions[str(path)] = stop
+        return self._read_cached(
+            path=path,
+            start=start,
+            stop=stop,
+            dtype=dtype,
+            channels=channels,
+        )
+
+    def _refresh(self, path: PathLike | str) -> tuple[int, int]:
+        """Record the size and modification time of the file.
+
+        The file is only checked once per read or stream, rather than for each
+        streamed chunk. What the backends kept from a file that changed since
+        it was last checked is released.
+        """
+        file_stat = Path(path).stat()
+        signature = (file_stat.st_size, file_stat.st_mtime_ns)
+        self._signatures[str(path)] = signature
+        self._wav.refresh(path, signature)
+        if self._mseed is not None:
+            self._mseed.refresh(path, signature)
+        return signature
+
+    def _is_cached(
+        self,
+        backend: SoundFileBackend | WavMemmapBackend | MSeedBackend,
+    ) -> bool:
+        # Memory-mapped WAV files are not decoded: caching them would only
+        # duplicate the mapped data.
+        return (
+            self.block_cache is not None
+            and self.block_cache.max_bytes > 0
+            and backend is not self._wav
+        )
+
+    def _read_cached(
+        self,
+        path: PathLike | str,
+        start: int,
+        stop: int,
+        dtype: np.typing.DTypeLike,
+        channels: list[int] | None,
+    ) -> np.ndarray:
+        """Read the frames from the blocks of the attached ``BlockCache``.
+
+        The blocks are keyed by the path, size and modification time of the
+        file when it was last checked, so that a file that is written again
+        is decoded again.
+        """
+        backend = self._backend(path)
+        if start >= stop:
+            return backend.read(
+                path=path,
+                start=start,
+                stop=stop,
+                dtype=dtype,
+                channels=channels,
+            )
+
+        _, frames, _ = backend.info(path)
+        size, mtime = self._signatures.get(str(path)) or self._refresh(path)
+        block_frames = self.block_cache.block_frames
+        key = (
+            str(path),
+            size,
+            mtime,
+            np.dtype(dtype).str,
+            None if channels is None else tuple(channels),
+        )
+
+        blocks = []
+        for index in range(start // block_frames, (stop - 1) // block_frames + 1):
+            block_start = index * block_frames
+            block = self.block_cache.get(
+                key=(*key, index),
+                decode=partial(
+                    backend.read,
+                    path=path,
+                    start=block_start,
+                    stop=min(block_start + block_frames, frames),
+                    dtype=dtype,
+                    channels=channels,
+                ),
+            )
+            blocks.append(block[max(start - block_start, 0) : stop - block_start])
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
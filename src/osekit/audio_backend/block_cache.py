@@ -0,0 +1,144 @@
+"""Size-bounded cache of decoded audio blocks.
+
+Overlapping audio data (e.g. datasets created with an ``overlap``) read the same
+frames of the audio files several times.
+Decoding compressed files (FLAC, MP3, MSEED...) is costly: the ``BlockCache``
+keeps the decoded frames in fixed-size blocks aligned on the file frames,
+so that the blocks shared by overlapping reads are only decoded once.
+The least recently used blocks are evicted when the cached data exceed
+``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    import numpy as np
+
+
+class BlockCache:
+    """Thread-safe, size-bounded LRU cache of decoded audio blocks."""
+
+    def __init__(self, max_bytes: int = 0, block_frames: int = 65_536) -> None:
+        """Initialize an empty ``BlockCache``.
+
+        Parameters
+        ----------
+        max_bytes: int
+            Maximum size in bytes of the cached blocks.
+            ``0`` disables the cache.
+        block_frames: int
+            Number of frames of each cached block.
+
+        """
+        if block_frames < 1:
+            msg = f"A block must have at least 1 frame. Got {block_frames}."
+            raise ValueError(msg)
+        self.block_frames = block_frames
+        self._blocks: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.reset_stats()
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum size in bytes of the cached blocks, ``0`` disables the cache."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if value < 0:
+            msg = f"The cache size can't be negative. Got {value}."
+            raise ValueError(msg)
+        self._max_bytes = value
+        with self._lock:
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """Access counters of the cache.
+
+        ``"hits"``: Number of blocks found in the cache.
+        ``"misses"``: Number of blocks that had to be decoded.
+        ``"evictions"``: Number of blocks evicted to make room for another one.
+        ``"hit_rate"``: Ratio of the accessed blocks that were found in the cache.
+        ``"blocks"``: Number of cached blocks.
+        ``"bytes"``: Size in bytes of the cached blocks.
+        ``"max_bytes"``: Maximum size in bytes of the cached blocks.
+
+        """
+        accesses = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / accesses if accesses else 0.0,
+            "blocks": len(self._blocks),
+            "bytes": self._nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss and eviction counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, decode: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the cached block, decoding and caching it if needed.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of the block.
+        decode: Callable[[], np.ndarray]
+            Function that decodes the block.
+            It is called outside the lock of the cache, so that threads
+            can decode different blocks simultaneously.
+
+        Returns
+        -------
+        np.ndarray:
+            The read-only decoded block.
+
+        """
+        with self._lock:
+            if key in self._blocks:
+                self._hits += 1
+                self._blocks.move_to_end(key)
+                return self._blocks[key]
+            self._misses += 1
+
+        block = decode()
+        block.flags.writeable = False
+        if block.nbytes > self.max_bytes:
+            return block
+
+        with self._lock:
+            if key not in self._blocks:
+                self._blocks[key] = block
+                self._nbytes += block.nbytes
+                self._evict()
+        return block
+
+    def clear(self) -> None:
+        """Remove all cached blocks."""
+        with self._lock:
+            self._blocks.clear()
+            self._nbytes = 0
+
+    def _evict(self) -> None:
+        while self._nbytes > self.max_bytes:
+            _, block = self._blocks.popitem(last=False)
+            self._nbytes -= block.nbytes
+            self._evictions += 1
+
+    def __len__(self) -> int:
+        """Return the number of cached blocks."""
+        return len(self._blocks)
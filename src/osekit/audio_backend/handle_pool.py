@@ -0,0 +1,145 @@
+"""Bounded pool of open file handles with a least-recently-used eviction policy.
+
+Opening an audio file has a cost (header parsing, filesystem latency...).
+The pool keeps up to ``max_size`` handles open, so that reads that alternate
+between a few files don't have to reopen them each time.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from os import PathLike
+
+
+class HandlePool[THandle]:
+    """Bounded pool of open file handles with a least-recently-used eviction policy."""
+
+    def __init__(
+        self,
+        open_handle: Callable[[str], THandle],
+        close_handle: Callable[[THandle], None],
+        max_size: int = 8,
+    ) -> None:
+        """Initialize an empty ``HandlePool``.
+
+        Parameters
+        ----------
+        open_handle: Callable[[str], THandle]
+            Function that opens the file at the given path and returns its handle.
+        close_handle: Callable[[THandle], None]
+            Function that closes a handle returned by ``open_handle``.
+        max_size: int
+            Maximum number of handles that are kept open simultaneously.
+            When a new file is opened while the pool is full, the least recently
+            used handle is closed.
+
+        """
+        self._open_handle = open_handle
+        self._close_handle = close_handle
+        self._handles: OrderedDict[str, THandle] = OrderedDict()
+        self.max_size = max_size
+        self.reset_stats()
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of handles that are kept open simultaneously."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 1:
+            msg = f"The pool size must be at least 1. Got {value}."
+            raise ValueError(msg)
+        self._max_size = value
+        self._evict()
+
+    @property
+    def most_recent(self) -> THandle | None:
+        """Handle that has been accessed last, ``None`` if the pool is empty."""
+        return next(reversed(self._handles.values()), None)
+
+    @property
+    def stats(self) -> dict:
+        """Access counters of the pool.
+
+        ``"hits"``: Number of accesses to an already opened handle.
+        ``"misses"``: Number of accesses that required opening the file.
+        ``"evictions"``: Number of handles closed to make room for another one.
+        ``"open"``: Number of currently opened handles.
+        ``"max_size"``: Maximum number of handles that are kept open.
+
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "open": len(self._handles),
+            "max_size": self.max_size,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss and eviction counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, path: PathLike | str) -> THandle:
+        """Return the handle of the file, opening it if needed.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the file.
+
+        Returns
+        -------
+        THandle:
+            The opened handle.
+
+        """
+        key = str(path)
+        if key in self._handles:
+            self._hits += 1
+            self._handles.move_to_end(key)
+            return self._handles[key]
+
+        self._misses += 1
+        handle = self._open_handle(key)
+        self._handles[key] = handle
+        self._evict()
+        return handle
+
+    def close(self, path: PathLike | str | None = None) -> None:
+        """Close the handle of the given file, or all handles if ``path`` is ``None``.
+
+        Parameters
+        ----------
+        path: PathLike | str | None
+            Path to the file which handle should be closed.
+
+        """
+        if path is not None:
+            if (handle := self._handles.pop(str(path), None)) is not None:
+                self._close_handle(handle)
+            return
+        while self._handles:
+            _, handle = self._handles.popitem(last=False)
+            self._close_handle(handle)
+
+    def _evict(self) -> None:
+        while len(self._handles) > self.max_size:
+            _, handle = self._handles.popitem(last=False)
+            self._close_handle(handle)
+            self._evictions += 1
+
+    def __contains__(self, path: PathLike | str) -> bool:
+        """Return ``True`` if the file has an opened handle in the pool."""
+        return str(path) in self._handles
+
+    def __len__(self) -> int:
+        """Return the number of opened handles."""
+        return len(self._handles)
@@ -1,7 +1,15 @@
-from os import PathLike
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from os import PathLike
+
 
 def _require_obspy() -> None:
     try:
@@ -13,16 +21,154 @@ def _require_obspy() -> None:
         raise ImportError(msg) from e
 
 
+@dataclass(frozen=True)
+class MSeedRecordIndex:
+    """Index of the records of a MSEED file.
+
+    The samples of the file are indexed in the order of the records.
+    ``first_frames`` has one more element than there are records:
+    the last element is the total number of frames in the file.
+    """
+
+    offsets: np.ndarray
+    lengths: np.ndarray
+    first_frames: np.ndarray
+    start_times: np.ndarray
+    sample_rates: np.ndarray
+
+    @property
+    def frames(self) -> int:
+        """Total number of frames in the MSEED file."""
+        return int(self.first_frames[-1])
+
+    @classmethod
+    def from_file(cls, path: PathLike | str) -> MSeedRecordIndex:
+        """Scan the record headers of a MSEED file.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the MSEED file.
+
+        Returns
+        -------
+        MSeedRecordIndex:
+            The index of the records of the file.
+
+        """
+        _require_obspy()
+        from obspy.io.mseed.util import (  # type: ignore[import-not-found]  # noqa: PLC0415
+            get_record_information,
+        )
+
+        file_size = Path(path).stat().st_size
+        offsets, lengths, npts, start_times, sample_rates = [], [], [], [], []
+        with Path(path).open("rb") as f:
+            offset = 0
+            while offset < file_size:
+                record = get_record_information(f, offset=offset)
+                offsets.append(offset)
+                lengths.append(record["record_length"])
+                npts.append(record["npts"])
+                start_times.append(record["starttime"].timestamp)
+                sample_rates.append(record["samp_rate"])
+                offset += record["record_length"]
+
+        return cls(
+            offsets=np.array(offsets, dtype=np.int64),
+            lengths=np.array(lengths, dtype=np.int64),
+            first_frames=np.concatenate(([0], np.cumsum(npts, dtype=np.int64))),
+            start_times=np.array(start_times, dtype=np.float64),
+            sample_rates=np.array(sample_rates, dtype=np.float64),
+        )
+
+    def records(self, start: int, stop: int) -> tuple[int, int]:
+        """Return the range of records that cover the ``[start, stop)`` frames.
+
+        Parameters
+        ----------
+        start: int
+            First frame of the range.
+        stop: int
+            Frame after the last frame of the range.
+
+        Returns
+        -------
+        tuple[int, int]:
+            Index of the first record and index after the last record
+            covering the frame range.
+
+        """
+        first = int(np.searchsorted(self.first_frames, start, side="right")) - 1
+        last = int(np.searchsorted(self.first_frames, stop, side="left"))
+        return max(first, 0), max(last, first + 1)
+
+
 class MSeedBackend:
-    """Backend for reading sismology MSEED files."""
+    """Backend for reading sismology MSEED files.
+
+    The record headers of each file are scanned once and kept in an index,
+    so that only the records covering the requested frames are decoded.
+    The last decoded block of records is kept, so that streaming a file
+    chunk by chunk doesn't decode the same records repeatedly.
+    ``refresh`` releases the index and the block of a file that changed.
+    """
 
     def __init__(self) -> None:
         """Initialize the MSEED backend."""
         _require_obspy()
         self.seeked_frame = 0
+        self._indexes: dict[str, tuple[tuple[int, int], MSeedRecordIndex]] = {}
+        self._block: tuple[str, int, np.ndarray] | None = None
 
     def close(self) -> None:
-        """Close the currently opened file. No use in MSEED files."""
+        """Clear the record indexes and the last decoded block."""
+        self._indexes.clear()
+        self._block = None
+
+    def refresh(self, path: PathLike | str, signature: tuple[int, int]) -> None:
+        """Release the index and the decoded block of the file if it changed.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the MSEED file.
+        signature: tuple[int, int]
+            Current size and modification time (in nanoseconds) of the file.
+
+        """
+        key = str(path)
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] != signature:
+            del self._indexes[key]
+            if self._block is not None and self._block[0] == key:
+                self._block = None
+
+    def index(self, path: PathLike | str) -> MSeedRecordIndex:
+        """Return the record index of the MSEED file.
+
+        The index is computed on the first call and cached afterward,
+        along with the size and modification time of the indexed file.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the MSEED file.
+
+        Returns
+        -------
+        MSeedRecordIndex:
+            The index of the records of the file.
+
+        """
+        key = str(path)
+        if key not in self._indexes:
+            file_stat = Path(path).stat()
+            self._indexes[key] = (
+                (file_stat.st_size, file_stat.st_mtime_ns),
+                MSeedRecordIndex.from_file(path),
+            )
+        return self._indexes[key][1]
 
     def info(self, path: PathLike | str) -> tuple[int, int, int]:
         """Return the sample rate, number of frames and channels of the MSEED file.
@@ -38,19 +184,15 @@ class MSeedBackend:
             Sample rate, number of frames and channels of the MSEED file.
 
         """
-        _require_obspy()
-        import obspy  # type: ignore[import-not-found]
-
-        metadata = obspy.read(pathname_or_url=path, headonly=True)
-        sample_rate = {trace.meta.sampling_rate for trace in metadata.traces}
+        index = self.index(path)
+        sample_rate = set(index.sample_rates[np.diff(index.first_frames) > 0])
         if len(sample_rate) != 1:
             msg = "Inconsistent sampling rates in MSEED file."
             raise ValueError(msg)
 
-        frames = sum(trace.meta.npts for trace in metadata.traces)
         return (
             int(sample_rate.pop()),
-            frames,
+            index.frames,
             1,
         )
 
@@ -59,9 +201,14 @@ class MSeedBackend:
         path: PathLike | str,
         start: int = 0,
         stop: int | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
     ) -> np.ndarray:
         """Read the content of a MSEED file.
 
+        Only the records that cover the requested frames are decoded.
+        MSEED samples are raw counts: they are cast to ``dtype`` without scaling.
+
         Parameters
         ----------
         path: PathLike | str
@@ -70,6 +217,12 @@ class MSeedBackend:
             First frame to read.
         stop: int
             Frame after the last frame to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            MSEED files are single-channel: this only selects or repeats
+            the unique channel.
 
         Returns
         -------
@@ -77,13 +230,25 @@ class MSeedBackend:
             A ``(channel * frames)`` array containing the MSEED data.
 
         """
-        _require_obspy()
-        import obspy  # type: ignore[import-not-found]  # noqa: PLC0415
+        index = self.index(path)
+        stop = index.frames if stop is None else min(stop, index.frames)
 
-        file_content = obspy.read(path)
+        if self._block is not None:
+            block_path, block_start, block = self._block
+            if (
+                block_path == str(path)
+                and block_start <= start
+                and stop <= block_start + len(block)
+            ):
+                data = block[start - block_start : stop - block_start]
+                return self._select(data=data, dtype=dtype, channels=channels)
 
-        data = np.concatenate([trace.data for trace in file_content])
-        return data[start:stop]
+        first_record, last_record = index.records(start=start, stop=stop)
+        block_start = int(index.first_frames[first_record])
+        block = self._decode(path, index, first_record, last_record)
+        self._block = (str(path), block_start, block)
+        data = block[start - block_start : stop - block_start]
+        return self._select(data=data, dtype=dtype, channels=channels)
 
     def seek(self, path: PathLike, frame: int) -> None:
         """Set the seeked_frame of the backend.
@@ -100,21 +265,74 @@ class MSeedBackend:
         """
         self.seeked_frame = frame
 
-    def stream(self, path: PathLike, chunk_size: int) -> np.ndarray:
+    def stream(
+        self,
+        path: PathLike,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         """Stream the content of the MSEED file from the seeked frame.
 
+        The seeked frame is moved to the end of the streamed chunk.
+
         Parameters
         ----------
         path: PathLike
             Path to the mseed file.
         chunk_size: int
             Number of frames to stream.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+        channels: list[int] | None
+            Indexes of the channels to read.
 
         Returns
         -------
         np.ndarray:
             Streamed data of length ``chunk_size`` from ``self.seeked_frame``.
         """
-        return self.read(
-            path=path, start=self.seeked_frame, stop=self.seeked_frame + chunk_size
+        data = self.read(
+            path=path,
+            start=self.seeked_frame,
+            stop=self.seeked_frame + chunk_size,
+            dtype=dtype,
+            channels=channels,
+        )
+        self.seeked_frame += len(data)
+        return data
+
+    @staticmethod
+    def _select(
+        data: np.ndarray,
+        dtype: np.typing.DTypeLike,
+        channels: list[int] | None,
+    ) -> np.ndarray:
+        data = data.astype(dtype, copy=False)
+        return data if channels is None else data[:, None][:, channels]
+
+    @staticmethod
+    def _decode(
+        path: PathLike | str,
+        index: MSeedRecordIndex,
+        first_record: int,
+        last_record: int,
+    ) -> np.ndarray:
+        _require_obspy()
+        import obspy  # type: ignore[import-not-found]  # noqa: PLC0415
+
+        if first_record >= last_record:
+            return np.array([], dtype=np.int32)
+
+        begin = int(index.offsets[first_record])
+        end = int(index.offsets[last_record - 1] + index.lengths[last_record - 1])
+        with Path(path).open("rb") as f:
+            f.seek(begin)
+            records = f.read(end - begin)
+
+        traces = obspy.read(io.BytesIO(records), format="MSEED").traces
+        block = np.concatenate(
+            [trace.data for trace in traces] or [np.array([], dtype=np.int32)],
         )
+        block.flags.writeable = False
+        return block
@@ -0,0 +1,129 @@
+"""Background read-ahead of the items of an iterator.
+
+Reading audio chunks synchronously stalls the downstream computations
+(resampling, STFT...) on the I/O latency, which can be high on network
+filesystems.
+The ``Prefetcher`` runs the iterator in a background I/O thread which keeps up
+to ``depth`` items ahead of the consumer in a bounded queue, so that I/O and
+computations overlap.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_ITEM, _DONE, _ERROR = range(3)
+
+
+class Prefetcher[TItem]:
+    """Iterate over an iterator in a background thread, keeping items ahead."""
+
+    poll_interval = 0.1
+
+    def __init__(self, produce: Callable[[], Iterator[TItem]], depth: int) -> None:
+        """Initialize a ``Prefetcher``.
+
+        The background thread is started when the iteration starts.
+
+        Parameters
+        ----------
+        produce: Callable[[], Iterator[TItem]]
+            Function returning the iterator to prefetch.
+            It is called in the background thread, so that the iterator
+            can use thread-local resources.
+        depth: int
+            Maximum number of items that are read ahead of the consumer.
+
+        """
+        if depth < 1:
+            msg = f"The prefetch depth must be at least 1. Got {depth}."
+            raise ValueError(msg)
+        self.depth = depth
+        self._produce = produce
+        self._queue: queue.Queue[tuple[int, TItem | BaseException | None]] = (
+            queue.Queue(maxsize=depth)
+        )
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="osekit-prefetch",
+            daemon=True,
+        )
+        self._produced = 0
+        self._consumed = 0
+        self._max_queued = 0
+        self._consumer_waits = 0
+        self._producer_waits = 0
+
+    @property
+    def stats(self) -> dict:
+        """Counters of the prefetched items.
+
+        ``"depth"``: Maximum number of items read ahead of the consumer.
+        ``"produced"``: Number of items read by the background thread.
+        ``"consumed"``: Number of items yielded to the consumer.
+        ``"max_queued"``: Maximum number of items that were waiting in the queue.
+        ``"consumer_waits"``: Number of times the consumer found the queue empty.
+        ``"producer_waits"``: Number of times the background thread found
+        the queue full.
+
+        """
+        return {
+            "depth": self.depth,
+            "produced": self._produced,
+            "consumed": self._consumed,
+            "max_queued": self._max_queued,
+            "consumer_waits": self._consumer_waits,
+            "producer_waits": self._producer_waits,
+        }
+
+    def __iter__(self) -> Iterator[TItem]:
+        """Yield the items read by the background thread."""
+        self._thread.start()
+        try:
+            while True:
+                if self._queue.empty():
+                    self._consumer_waits += 1
+                kind, item = self._queue.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise item
+                self._consumed += 1
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the background thread and wait for it to finish."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            for item in self._produce():
+                if not self._put(_ITEM, item):
+                    return
+                self._produced += 1
+        except BaseException as e:  # noqa: BLE001
+            self._put(_ERROR, e)
+            return
+        self._put(_DONE, None)
+
+    def _put(self, kind: int, item: TItem | BaseException | None) -> bool:
+        if self._queue.full():
+            self._producer_waits += 1
+        while not self._stop.is_set():
+            try:
+                self._queue.put((kind, item), timeout=self.poll_interval)
+            except queue.Full:
+                continue
+            self._max_queued = max(self._max_queued, self._queue.qsize())
+            return True
+        return False
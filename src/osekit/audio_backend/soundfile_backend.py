@@ -3,20 +3,61 @@ from os import PathLike
 import numpy as np
 import soundfile as sf
 
+from osekit.audio_backend.handle_pool import HandlePool
+
 
 class SoundFileBackend:
-    """Backend for reading conventional audio files (WAV, FLAC, MP3...)."""
+    """Backend for reading conventional audio files (WAV, FLAC, MP3...).
+
+    Opened files are kept in a bounded pool of handles: reading alternately
+    from several files doesn't require closing and reopening them,
+    as long as they fit in the pool.
+    The least recently used file is closed when the pool is full.
+
+    libsndfile decodes all the channels of a frame at once: when only some
+    channels are requested, the frames are decoded by blocks of ``block_size``
+    frames, and only the requested channels are kept.
+    """
+
+    block_size = 65_536
+
+    def __init__(self, max_open_files: int = 8) -> None:
+        """Instantiate a SoundFileBackend.
+
+        Parameters
+        ----------
+        max_open_files: int
+            Maximum number of audio files that are kept open simultaneously.
+
+        """
+        self._pool: HandlePool[sf.SoundFile] = HandlePool(
+            open_handle=lambda path: self._open(path),
+            close_handle=sf.SoundFile.close,
+            max_size=max_open_files,
+        )
 
-    def __init__(self) -> None:
-        """Instantiate a SoundFileBackend."""
-        self._file: sf.SoundFile | None = None
+    @property
+    def max_open_files(self) -> int:
+        """Maximum number of audio files that are kept open simultaneously."""
+        return self._pool.max_size
+
+    @max_open_files.setter
+    def max_open_files(self, value: int) -> None:
+        self._pool.max_size = value
+
+    @property
+    def stats(self) -> dict:
+        """Hit, miss and eviction counters of the pool of opened files."""
+        return self._pool.stats
+
+    @property
+    def _file(self) -> sf.SoundFile | None:
+        """Most recently accessed audio file, ``None`` if no file is opened."""
+        return self._pool.most_recent
 
     def close(self) -> None:
-        """Close the currently opened file."""
-        if self._file is None:
-            return
-        self._file.close()
-        self._file = None
+        """Close all opened files."""
+        self._pool.close()
 
     def info(self, path: PathLike | str) -> tuple[int, int, int]:
         """Return the sample rate, number of frames and channels of the audio file.
@@ -32,11 +73,11 @@ class SoundFileBackend:
             Sample rate, number of frames and channels of the audio file.
 
         """
-        self._switch(path)
+        file = self._switch(path)
         return (
-            self._file.samplerate,
-            self._file.frames,
-            self._file.channels,
+            file.samplerate,
+            file.frames,
+            file.channels,
         )
 
     def read(
@@ -44,11 +85,13 @@ class SoundFileBackend:
         path: PathLike | str,
         start: int = 0,
         stop: int | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
     ) -> np.ndarray:
         """Read the content of an audio file.
 
-        If the audio file is not the current opened file,
-        the current opened file is switched.
+        If the audio file is not opened yet, it is added to the pool
+        of opened files.
 
         Parameters
         ----------
@@ -58,6 +101,13 @@ class SoundFileBackend:
             First frame to read.
         stop: int
             Frame after the last frame to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+            Floating types are scaled in ``[-1.,1.[``,
+            integer types are scaled to their full range.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
 
         Returns
         -------
@@ -65,27 +115,50 @@ class SoundFileBackend:
             A ``(channel * frames)`` array containing the audio data.
 
         """
-        self.seek(path=path, frame=start)
-        return self._file.read(stop - start)
+        file = self._switch(path)
+        file.seek(start)
+        return self._read(
+            file=file, frames=stop - start, dtype=dtype, channels=channels
+        )
 
     def seek(self, path: PathLike, frame: int) -> None:
-        self._switch(path=path)
-        self._file.seek(frame)
-
-    def stream(self, path: PathLike, chunk_size: int) -> np.ndarray:
-        self._switch(path=path)
-        return self._file.read(frames=chunk_size)
-
-    def _close(self) -> None:
-        if self._file is None:
-            return
-        self._file.close()
-        self._file = None
-
-    def _open(self, path: PathLike | str) -> None:
-        self._file = sf.SoundFile(path, "r")
-
-    def _switch(self, path: PathLike | str) -> None:
-        if self._file is None or self._file.name != str(path):
-            self._close()
-            self._open(path)
+        self._switch(path=path).seek(frame)
+
+    def stream(
+        self,
+        path: PathLike,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
+        return self._read(
+            file=self._switch(path=path),
+            frames=chunk_size,
+            dtype=dtype,
+            channels=channels,
+        )
+
+    def _read(
+        self,
+        file: sf.SoundFile,
+        frames: int,
+        dtype: np.typing.DTypeLike,
+        channels: list[int] | None,
+    ) -> np.ndarray:
+        dtype = np.dtype(dtype).name
+        if channels is None:
+            return file.read(frames, dtype=dtype)
+
+        frames = min(frames, file.frames - file.tell())
+        data = np.empty((frames, len(channels)), dtype=dtype)
+        block = np.empty((min(frames, self.block_size), file.channels), dtype=dtype)
+        for block_start in range(0, frames, self.block_size):
+            read = file.read(out=block[: frames - block_start])
+            data[block_start : block_start + len(read)] = read[:, channels]
+        return data
+
+    def _open(self, path: PathLike | str) -> sf.SoundFile:
+        return sf.SoundFile(path, "r")
+
+    def _switch(self, path: PathLike | str) -> sf.SoundFile:
+        return self._pool.get(path)
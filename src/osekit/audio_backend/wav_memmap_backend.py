@@ -0,0 +1,356 @@
+"""Backend serving uncompressed WAV files through memory maps.
+
+The samples of uncompressed PCM/float WAV files are stored contiguously in the
+``data`` chunk of the file.
+Mapping this chunk with ``np.memmap`` gives access to any frame range without
+decoding it: the requested frames are returned as views over the mapped file,
+and are only converted if they are not stored in the requested type.
+
+WAV files that can't be mapped (24-bit PCM, compressed formats, big-endian
+``RIFX`` files...) are left to the ``SoundFileBackend``.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from osekit.audio_backend.handle_pool import HandlePool
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_PCM_DTYPES = {8: np.dtype("u1"), 16: np.dtype("<i2"), 32: np.dtype("<i4")}
+_FLOAT_DTYPES = {32: np.dtype("<f4"), 64: np.dtype("<f8")}
+
+
+@dataclass(frozen=True)
+class WavLayout:
+    """Layout of the samples in the ``data`` chunk of a WAV file."""
+
+    sample_rate: int
+    channels: int
+    frames: int
+    dtype: np.dtype
+    offset: int
+
+    @property
+    def zero(self) -> float:
+        """Value of the stored samples that maps to ``0.``."""
+        return 128.0 if self.dtype == np.uint8 else 0.0
+
+    @property
+    def scale(self) -> float:
+        """Value by which the stored samples are divided to fit in ``[-1.,1.[``."""
+        if self.dtype.kind == "f":
+            return 1.0
+        return float(2 ** (8 * self.dtype.itemsize - 1))
+
+
+def parse_wav_header(path: PathLike | str) -> WavLayout | None:
+    """Parse the header of a WAV file.
+
+    Parameters
+    ----------
+    path: PathLike | str
+        Path to the WAV file.
+
+    Returns
+    -------
+    WavLayout | None:
+        The layout of the samples in the file, or ``None`` if the samples
+        can't be memory-mapped.
+
+    """
+    file_size = Path(path).stat().st_size
+    with Path(path).open("rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+            return None
+
+        fmt = None
+        while (chunk_header := f.read(8)) and len(chunk_header) == 8:
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                if chunk_size % 2:
+                    f.seek(1, 1)
+                continue
+            if chunk_id == b"data":
+                if fmt is None:
+                    return None
+                offset = f.tell()
+                # Streamed WAV files might not have their data size set.
+                data_size = min(chunk_size, file_size - offset)
+                return _layout_from_fmt(fmt=fmt, offset=offset, data_size=data_size)
+            f.seek(chunk_size + chunk_size % 2, 1)
+    return None
+
+
+def _layout_from_fmt(fmt: bytes, offset: int, data_size: int) -> WavLayout | None:
+    if len(fmt) < 16:
+        return None
+    format_tag, channels, sample_rate, _, block_align, bits_per_sample = struct.unpack(
+        "<HHIIHH", fmt[:16]
+    )
+    if format_tag == WAVE_FORMAT_EXTENSIBLE:
+        if len(fmt) < 26:
+            return None
+        # The two first bytes of the SubFormat GUID hold the actual format tag.
+        (format_tag,) = struct.unpack("<H", fmt[24:26])
+
+    dtypes = {WAVE_FORMAT_PCM: _PCM_DTYPES, WAVE_FORMAT_IEEE_FLOAT: _FLOAT_DTYPES}
+    dtype = dtypes.get(format_tag, {}).get(bits_per_sample)
+    if dtype is None or channels == 0 or block_align != channels * dtype.itemsize:
+        return None
+
+    frames = data_size // block_align
+    if frames == 0:
+        # Empty files can't be mapped.
+        return None
+
+    return WavLayout(
+        sample_rate=sample_rate,
+        channels=channels,
+        frames=frames,
+        dtype=dtype,
+        offset=offset,
+    )
+
+
+def _convert(data: np.ndarray, layout: WavLayout, dtype: np.dtype) -> np.ndarray:
+    if data.dtype == dtype:
+        return data
+
+    if dtype.kind == "f":
+        data = data.astype(dtype)
+        if layout.zero:
+            data -= layout.zero
+        if layout.scale != 1.0:
+            data /= layout.scale
+        return data
+
+    if data.dtype.kind == "f":
+        # As libsndfile, floating samples are rounded without rescaling.
+        info = np.iinfo(dtype)
+        return np.clip(np.rint(data), info.min, info.max).astype(dtype)
+
+    # Integer samples are left-justified in the requested type.
+    data = data.astype(np.int64) - int(layout.zero)
+    shift = 8 * (dtype.itemsize - layout.dtype.itemsize)
+    data = data << shift if shift >= 0 else data >> -shift
+    return data.astype(dtype)
+
+
+class WavMemmapBackend:
+    """Backend serving uncompressed PCM/float WAV files through memory maps.
+
+    The layouts of the last ``max_open_files`` parsed files are cached by path:
+    ``refresh`` releases the layout and the map of a file that changed.
+    """
+
+    def __init__(self, max_open_files: int = 8) -> None:
+        """Instantiate a WavMemmapBackend.
+
+        Parameters
+        ----------
+        max_open_files: int
+            Maximum number of WAV files that are kept mapped simultaneously.
+            A mapping is released once it is evicted from the pool and no
+            array returned by the backend references it anymore.
+
+        """
+        self._layouts: OrderedDict[str, tuple[tuple[int, int], WavLayout | None]] = (
+            OrderedDict()
+        )
+        self._positions: dict[str, int] = {}
+        self._pool: HandlePool[np.memmap] = HandlePool(
+            open_handle=self._map,
+            close_handle=lambda _: None,
+            max_size=max_open_files,
+        )
+
+    @property
+    def max_open_files(self) -> int:
+        """Maximum number of WAV files that are kept mapped simultaneously."""
+        return self._pool.max_size
+
+    @max_open_files.setter
+    def max_open_files(self, value: int) -> None:
+        self._pool.max_size = value
+        self._evict_layouts()
+
+    @property
+    def stats(self) -> dict:
+        """Hit, miss and eviction counters of the pool of mapped files."""
+        return self._pool.stats
+
+    def supports(self, path: PathLike | str) -> bool:
+        """Return ``True`` if the samples of the WAV file can be memory-mapped.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the WAV file.
+
+        Returns
+        -------
+        bool:
+            ``True`` if the file can be served by this backend.
+
+        """
+        return self._layout(path) is not None
+
+    def close(self) -> None:
+        """Release all mapped files."""
+        self._pool.close()
+        self._layouts.clear()
+        self._positions.clear()
+
+    def refresh(self, path: PathLike | str, signature: tuple[int, int]) -> None:
+        """Release the layout and the map of the file if it changed since it was parsed.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the WAV file.
+        signature: tuple[int, int]
+            Current size and modification time (in nanoseconds) of the file.
+
+        """
+        key = str(path)
+        cached = self._layouts.get(key)
+        if cached is not None and cached[0] != signature:
+            del self._layouts[key]
+            self._pool.close(key)
+
+    def info(self, path: PathLike | str) -> tuple[int, int, int]:
+        """Return the sample rate, number of frames and channels of the WAV file.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the WAV file.
+
+        Returns
+        -------
+        tuple[int,int,int]:
+            Sample rate, number of frames and channels of the WAV file.
+
+        """
+        layout = self._layout(path)
+        return layout.sample_rate, layout.frames, layout.channels
+
+    def read(
+        self,
+        path: PathLike | str,
+        start: int = 0,
+        stop: int | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
+        """Read the content of a WAV file.
+
+        The returned array is a read-only view over the mapped file if the
+        samples are stored as ``dtype``, or a converted copy of the
+        requested frames otherwise.
+        Conversions follow the ones of ``libsndfile``, so that the data is
+        the same as if the file was read with the ``SoundFileBackend``.
+        When a subset of the channels is requested, only these channels are
+        copied out of the mapped file and converted.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the WAV file.
+        start: int
+            First frame to read.
+        stop: int | None
+            Frame after the last frame to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+            Floating types are scaled in ``[-1.,1.[``,
+            integer types are scaled to their full range.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
+
+        Returns
+        -------
+        np.ndarray:
+            A ``(channel * frames)`` array containing the audio data.
+
+        """
+        layout = self._layout(path)
+        # The map only covers the frames of the current file: slicing it past
+        # the end of a file that was truncated would crash the interpreter.
+        stop = layout.frames if stop is None else min(stop, layout.frames)
+        data = self._pool.get(path)[start:stop].view(np.ndarray)
+        if channels is not None:
+            data = data[:, channels]
+        elif layout.channels == 1:
+            data = data[:, 0]
+        return _convert(data=data, layout=layout, dtype=np.dtype(dtype))
+
+    def seek(self, path: PathLike, frame: int) -> None:
+        self._positions[str(path)] = frame
+
+    def stream(
+        self,
+        path: PathLike,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
+        start = self._positions.get(str(path), 0)
+        stop = min(start + chunk_size, self._layout(path).frames)
+        self._positions[str(path)] = stop
+        return self.read(
+            path=path,
+            start=start,
+            stop=stop,
+            dtype=dtype,
+            channels=channels,
+        )
+
+    def _layout(self, path: PathLike | str) -> WavLayout | None:
+        """Return the layout of the file, parsing it if it is not cached.
+
+        The size and modification time of the parsed file are kept with its
+        layout, so that ``refresh`` can tell if the file changed since.
+        """
+        key = str(path)
+        if key in self._layouts:
+            self._layouts.move_to_end(key)
+            return self._layouts[key][1]
+
+        # The map of a file which layout was evicted might be stale.
+        self._pool.close(key)
+        file_stat = Path(path).stat()
+        signature = (file_stat.st_size, file_stat.st_mtime_ns)
+        self._layouts[key] = (signature, parse_wav_header(path))
+        self._evict_layouts()
+        return self._layouts[key][1]
+
+    def _evict_layouts(self) -> None:
+        while len(self._layouts) > self.max_open_files:
+            self._layouts.popitem(last=False)
+
+    def _map(self, path: str) -> np.memmap:
+        layout = self._layout(path)
+        return np.memmap(
+            path,
+            dtype=layout.dtype,
+            mode="r",
+            offset=layout.offset,
+            shape=(layout.frames, layout.channels),
+        )
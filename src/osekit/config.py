@@ -22,7 +22,24 @@ resample_quality_settings = {
     "upsample": "MQ",
 }
 
+# The executor is "serial", "threads" or "processes" (default), and
+# nb_processes is its number of workers.
+# The transport of the "processes" executor is "pickle" (default) or
+# "shared_memory", in which case the large numpy arrays are sent to and from
+# the workers through shared memory (the spectra of a chunk of elements are
+# stacked in a single array).
+# The chunksize is the number of elements sent at once to a worker,
+# None lets the pool split the elements in about 4 chunks per worker.
 multiprocessing = {
     "is_active": False,
     "nb_processes": None,
+    "executor": "processes",
+    "transport": "pickle",
+    "chunksize": None,
+}
+
+# Number of audio chunks read ahead by a background I/O thread when streaming
+# audio files. 0 disables the prefetching.
+prefetch = {
+    "depth": 0,
 }
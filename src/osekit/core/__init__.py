@@ -1,3 +1,76 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from osekit.audio_backend.audio_file_manager import AudioFileManager
+from osekit.audio_backend.block_cache import BlockCache
+
+# Cache of the decoded audio blocks, shared by the managers of all threads.
+# Disabled by default: set its max_bytes to enable it.
+block_cache = BlockCache()
+audio_file_manager = AudioFileManager(block_cache=block_cache)
+_thread_local = threading.local()
+_context_audio_file_manager: ContextVar[AudioFileManager | None] = ContextVar(
+    "audio_file_manager",
+    default=None,
+)
+
+
+def get_audio_file_manager() -> AudioFileManager:
+    """Return the ``AudioFileManager`` that should be used in the current context.
+
+    The manager set by ``use_audio_file_manager`` is used if any.
+    Otherwise, the main thread uses the global ``audio_file_manager``.
+    Since the managers keep their opened files and positions in non
+    thread-safe pools, each other thread gets its own manager.
+    All managers share the same ``block_cache``.
+
+    Returns
+    -------
+    AudioFileManager:
+        The audio file manager of the current context.
+
+    """
+    if (manager := _context_audio_file_manager.get()) is not None:
+        return manager
+    if threading.current_thread() is threading.main_thread():
+        return audio_file_manager
+    if not hasattr(_thread_local, "audio_file_manager"):
+        _thread_local.audio_file_manager = AudioFileManager(block_cache=block_cache)
+    return _thread_local.audio_file_manager
+
+
+@contextmanager
+def use_audio_file_manager(
+    manager: AudioFileManager | None = None,
+) -> Iterator[AudioFileManager]:
+    """Read the audio files through a given ``AudioFileManager`` in this context.
+
+    The manager only applies to the current context (thread or asyncio task):
+    concurrent readers that each use their own manager don't share their
+    opened files nor their positions in the files.
+
+    Parameters
+    ----------
+    manager: AudioFileManager | None
+        The manager through which the audio files are read.
+        If ``None``, a new manager sharing the ``block_cache`` is used,
+        and closed when exiting the context.
+
+    Yields
+    ------
+    AudioFileManager:
+        The audio file manager of the context.
 
-audio_file_manager = AudioFileManager()
+    """
+    owned = manager is None
+    if owned:
+        manager = AudioFileManager(block_cache=block_cache)
+    token = _context_audio_file_manager.set(manager)
+    try:
+        yield manager
+    finally:
+        _context_audio_file_manager.reset(token)
+        if owned:
+            manager.close()
@@ -22,7 +22,12 @@ from osekit.core.audio_file import AudioFile
 from osekit.core.audio_item import AudioItem
 from osekit.core.base_data import BaseData
 from osekit.core.instrument import Instrument
-from osekit.utils.audio import Butterworth, Normalization, normalize
+from osekit.utils.audio import (
+    Butterworth,
+    Normalization,
+    RunningStatistics,
+    normalize,
+)
 from osekit.utils.plot import get_default_axes
 
 if TYPE_CHECKING:
@@ -37,6 +42,7 @@ class AudioData(BaseData[AudioItem, AudioFile]):
     """
 
     item_cls = AudioItem
+    supported_dtypes = (np.float64, np.float32, np.int32, np.int16)
 
     def __init__(
         self,
@@ -50,6 +56,7 @@ class AudioData(BaseData[AudioItem, AudioFile]):
         normalization_values: dict | None = None,
         butter: Butterworth | None = None,
         channels: list[int] | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
     ) -> None:
         """Initialize an ``AudioData`` from a list of ``AudioItems``.
 
@@ -76,6 +83,13 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             Butterworth filter to apply to the audio data.
         channels: list[int]
             Considered channels of the linked audio file(s).
+        dtype: np.typing.DTypeLike
+            Type in which the audio data is read, resampled and filtered.
+            Defaulted to ``float64``.
+            ``float32`` halves the memory footprint of the data.
+            Integer types (``int32``, ``int16``) read the native PCM samples,
+            and are converted to ``float64`` only if the data is normalized
+            or filtered.
 
         """
         super().__init__(items=items, begin=begin, end=end, name=name)
@@ -85,6 +99,8 @@ class AudioData(BaseData[AudioItem, AudioFile]):
         self.normalization_values = normalization_values
         self.butter = butter
         self.channels = channels
+        self.dtype = dtype
+        self._statistics_cache: tuple[tuple, RunningStatistics] | None = None
 
     @property
     def nb_channels(self) -> int:
@@ -148,6 +164,23 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             value = list(range(nb_channels_max))
         self._channels = value
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Type in which the audio data is read, resampled and filtered."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value: np.typing.DTypeLike) -> None:
+        value = np.dtype(value)
+        if value not in self.supported_dtypes:
+            msg = (
+                f"Unsupported audio dtype: {value}. "
+                f"Supported dtypes are "
+                f"{', '.join(np.dtype(d).name for d in self.supported_dtypes)}."
+            )
+            raise ValueError(msg)
+        self._dtype = value
+
     @classmethod
     def _make_item(
         cls,
@@ -193,6 +226,10 @@ class AudioData(BaseData[AudioItem, AudioFile]):
     def get_normalization_values(self) -> dict:
         """Return the values used for normalizing the audio data.
 
+        The values are computed in a single pass over the streamed audio data.
+        They are cached, and only computed again if a parameter that affects the
+        audio data (begin, end, sample rate, channels, dtype, filter) changes.
+
         Returns
         -------
         dict:
@@ -201,14 +238,33 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             "std": standard deviation used for z-score normalization
 
         """
-        values = np.array(self.get_filtered_value())
+        statistics = self._running_statistics()
         self.normalization_values = {
-            "mean": values.mean(axis=0),
-            "peak": values.max(axis=0),
-            "std": values.std(axis=0),
+            "mean": statistics.mean,
+            "peak": statistics.peak,
+            "std": statistics.std,
         }
         return self.normalization_values
 
+    def _running_statistics(self) -> RunningStatistics:
+        """Return the cached statistics of the filtered audio data."""
+        key = (
+            self.begin,
+            self.end,
+            self.sample_rate,
+            tuple(self.channels),
+            self.dtype,
+            repr(self.butter),
+        )
+        if self._statistics_cache is not None and self._statistics_cache[0] == key:
+            return self._statistics_cache[1]
+
+        statistics = RunningStatistics()
+        for chunk in self._stream_filtered_value():
+            statistics.update(chunk)
+        self._statistics_cache = (key, statistics)
+        return statistics
+
     def __eq__(self, other: AudioData) -> bool:
         """Override __eq__."""
         return self.sample_rate == other.sample_rate and super().__eq__(other)
@@ -232,18 +288,43 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             return
         self.sample_rate = None
 
-    def get_raw_value(self) -> np.ndarray:
+    def get_raw_value(self, out: np.ndarray | None = None) -> np.ndarray:
         """Return the raw value of the audio data before normalization.
 
         The data from the audio file will be resampled if necessary.
+        The streamed chunks are written in place in an array of shape
+        ``self.shape``, so that the value is never held twice in memory.
+
+        Parameters
+        ----------
+        out: np.ndarray | None
+            Array in which the value is written, e.g. a ``np.memmap`` for
+            audio data that doesn't fit in memory.
+            Its shape should be ``self.shape``.
+            If ``None``, a new array of type ``self.dtype`` is allocated.
 
         Returns
         -------
         np.ndarray:
             The value of the audio data.
+            If ``out`` is provided, this is ``out`` (or a view of its first
+            frames if the audio data is shorter than expected).
 
         """
-        return np.vstack(list(self.stream()))
+        if out is None:
+            out = np.empty(self.shape, dtype=self.dtype)
+        elif out.shape != self.shape:
+            msg = f"The output array should be of shape {self.shape}. Got {out.shape}."
+            raise ValueError(msg)
+
+        filled = 0
+        for chunk in self.stream():
+            frames = min(len(chunk), len(out) - filled)
+            out[filled : filled + frames] = chunk[:frames]
+            filled += frames
+            if filled == len(out):
+                break
+        return out if filled == len(out) else out[:filled]
 
     def get_filtered_value(self) -> np.ndarray:
         """Return the value of the audio data after filtering.
@@ -261,46 +342,74 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             else self.butter.filter(sig=output, fs=self.sample_rate)
         )
 
-    @staticmethod
+    def _stream_filtered_value(
+        self,
+        chunk_size: int = 8192,
+    ) -> Generator[np.ndarray, None, None]:
+        """Stream the audio data after filtering.
+
+        The state of the Butterworth filter is carried across the streamed chunks.
+        """
+        chunks = self.stream(chunk_size=chunk_size)
+        if self.butter is None:
+            yield from chunks
+            return
+        yield from self.butter.filter_stream(chunks=chunks, fs=self.sample_rate)
+
     def _flush(
+        self,
         resampler: soxr.ResampleStream,
         remaining_samples: int,
     ) -> np.ndarray:
-        flush = resampler.resample_chunk(np.array([]), last=True)
-        if len(flush) == 0:
-            return np.array([])[:, None]
-        if not remaining_samples:
-            return np.array([])[:, None]
+        empty = np.empty((0, self.nb_channels), dtype=self.dtype)
+        flush = resampler.resample_chunk(empty, last=True)
+        if len(flush) == 0 or not remaining_samples:
+            return empty
         flush = flush[:remaining_samples]
         return flush[:, None] if flush.ndim == 1 else flush
 
-    def stream(self, chunk_size: int = 8192) -> Generator[np.ndarray, None, None]:
+    def stream(
+        self,
+        chunk_size: int = 8192,
+        prefetch: int | None = None,
+    ) -> Generator[np.ndarray, None, None]:
         """Stream the audio data in chunks.
 
         Parameters
         ----------
         chunk_size: int
             Size of the chunks of audio yielded by the generator.
+        prefetch: int | None
+            Number of chunks read ahead from each audio file by a background
+            I/O thread, so that reading overlaps with the processing of the
+            streamed chunks.
+            Defaulted to ``osekit.config.prefetch["depth"]``.
+            If ``0``, the chunks are read synchronously.
 
         Returns
         -------
         Generator[np.ndarray, None, None]:
             Generated ``np.ndarray`` of dimensions (``chunk_size``*``self.nb_channels``)
             of the streamed audio data.
+            Chunks of silence that fill the gaps between the audio files are
+            read-only.
 
         """
         resampler = None
         input_sr = None
         produced_samples = 0
         total_samples = self.length
+        silence = None
 
         for item in self.items:
             if item.is_empty:
+                if silence is None:
+                    # Gaps are yielded as read-only views of a single zero block.
+                    silence = np.zeros((chunk_size, self.nb_channels), dtype=self.dtype)
+                    silence.flags.writeable = False
                 silence_length = round(item.duration.total_seconds() * self.sample_rate)
-                yield item.get_value().repeat(
-                    silence_length,
-                    axis=0,
-                )
+                for silence_start in range(0, silence_length, chunk_size):
+                    yield silence[: silence_length - silence_start]
                 produced_samples += silence_length
                 continue
 
@@ -311,8 +420,7 @@ class AudioData(BaseData[AudioItem, AudioFile]):
                         remaining_samples=total_samples - produced_samples,
                     )
                     yield flush
-                    if flush.size > 0:
-                        produced_samples += len(flush[0])
+                    produced_samples += len(flush)
                 input_sr = item.sample_rate
                 quality = resample_quality_settings[
                     "downsample" if input_sr > self.sample_rate else "upsample"
@@ -322,13 +430,17 @@ class AudioData(BaseData[AudioItem, AudioFile]):
                     out_rate=self.sample_rate,
                     num_channels=self.nb_channels,
                     quality=quality,
-                    dtype=np.float64,
+                    dtype=self.dtype,
                 )
 
-            for chunk in item.stream(chunk_size=chunk_size):
-                y = chunk[:, self.channels]
+            for y in item.stream(
+                chunk_size=chunk_size,
+                dtype=self.dtype,
+                channels=self.channels,
+                prefetch=prefetch,
+            ):
                 if item.sample_rate != self.sample_rate:
-                    y = resampler.resample_chunk(x=chunk)
+                    y = resampler.resample_chunk(x=y)
 
                 remaining = total_samples - produced_samples
                 y = y[:remaining]
@@ -415,15 +527,121 @@ class AudioData(BaseData[AudioItem, AudioFile]):
                 axes.xaxis_date()
                 axes.plot(time, values[:, idx], **kwargs)
 
+    def stream_value(self, chunk_size: int = 8192) -> Generator[np.ndarray, None, None]:
+        """Stream the value of the audio data in chunks.
+
+        Each chunk goes through the whole processing of the audio data:
+        only the selected channels are read from the audio files, and the
+        chunks are resampled, filtered and normalized one at a time.
+        Missing normalization values are first computed in a streaming pass
+        over the audio data, so that the whole data is never loaded in memory.
+
+        Parameters
+        ----------
+        chunk_size: int
+            Size of the chunks of audio yielded by the generator.
+
+        Returns
+        -------
+        Generator[np.ndarray, None, None]:
+            Generated ``np.ndarray`` of dimensions (``chunk_size``*``self.nb_channels``)
+            of the audio data value.
+            Their concatenation equals ``AudioData.get_value()``.
+
+        """
+        normalization, normalization_values = self._streaming_normalization()
+        for chunk in self._stream_filtered_value(chunk_size=chunk_size):
+            yield normalize(
+                values=chunk,
+                normalization=normalization,
+                **normalization_values,
+            )
+
+    def stream_value_calibrated(
+        self,
+        chunk_size: int = 8192,
+    ) -> Generator[np.ndarray, None, None]:
+        """Stream the value of the audio data accounting for the calibration factor.
+
+        If the instrument parameter of the audio data is not None, the streamed
+        values are calibrated in units of Pa.
+
+        Parameters
+        ----------
+        chunk_size: int
+            Size of the chunks of audio yielded by the generator.
+
+        Returns
+        -------
+        Generator[np.ndarray, None, None]:
+            Generated ``np.ndarray`` of dimensions (``chunk_size``*``self.nb_channels``)
+            of the calibrated audio data value.
+            Their concatenation equals ``AudioData.get_value_calibrated()``.
+
+        """
+        calibration_factor = (
+            1.0 if self.instrument is None else self.instrument.end_to_end
+        )
+        for chunk in self.stream_value(chunk_size=chunk_size):
+            yield chunk * calibration_factor
+
+    def _streaming_normalization(self) -> tuple[Normalization, dict]:
+        """Return the normalization and values to apply chunk by chunk.
+
+        The missing normalization values are taken from the statistics of the
+        whole filtered data, so that normalizing each chunk gives the same result
+        as normalizing the whole data at once.
+        """
+        normalization = self.normalization
+        values = dict(self.normalization_values)
+        if not self._requires_normalization_values():
+            return normalization, values
+
+        statistics = self._running_statistics()
+        if statistics.count == 0:
+            return normalization, values
+        if values["mean"] is None:
+            if Normalization.DC_REJECT | Normalization.ZSCORE in normalization:
+                # The z-score of the DC-rejected data is the z-score of the data.
+                normalization = Normalization.ZSCORE
+            values["mean"] = statistics.mean
+        if values["std"] is None:
+            values["std"] = statistics.std
+        if values["peak"] is None:
+            offset = values["mean"] if Normalization.DC_REJECT in normalization else 0
+            values["peak"] = np.maximum(
+                statistics.peak.astype(np.float64) - offset,
+                offset - statistics.minimum.astype(np.float64),
+            )
+        return normalization, values
+
+    def _requires_normalization_values(self) -> bool:
+        """Return ``True`` if a value required by the normalization is missing."""
+        required = {
+            Normalization.DC_REJECT: ("mean",),
+            Normalization.PEAK: ("peak",),
+            Normalization.ZSCORE: ("mean", "std"),
+        }
+        return any(
+            self.normalization_values[key] is None
+            for normalization, keys in required.items()
+            if normalization in self.normalization
+            for key in keys
+        )
+
     def write(
         self,
         folder: Path,
         *,
         subtype: str | None = None,
         link: bool = False,
+        chunk_size: int = 65_536,
     ) -> None:
         """Write the audio data to file.
 
+        The audio data is streamed to the file by chunks of ``chunk_size`` frames,
+        so that the whole data isn't loaded in memory at once.
+
         Parameters
         ----------
         folder: pathlib.Path
@@ -435,15 +653,20 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             If True, the ``AudioData`` will be bound to the written file.
             Its items will be replaced with a single item, which will match the whole
             new ``AudioFile``.
+        chunk_size: int
+            Number of frames written at once.
 
         """
         super().create_directories(path=folder)
-        sf.write(
+        with sf.SoundFile(
             folder / f"{self}.wav",
-            self.get_value(),
-            self.sample_rate,
+            mode="w",
+            samplerate=self.sample_rate,
+            channels=self.nb_channels,
             subtype=subtype,
-        )
+        ) as file:
+            for chunk in self.stream_value(chunk_size=chunk_size):
+                file.write(chunk)
         if link:
             self.link(folder=folder)
 
@@ -483,8 +706,8 @@ class AudioData(BaseData[AudioItem, AudioFile]):
         pass_normalization: bool
             If True, the normalization values (mean, std, peak) will be computed
             from the original audio data and passed to the split chunks.
-            If the original ``AudioData`` is very long, this might lead to
-            a RAM saturation.
+            The values are computed in a single pass over the streamed audio
+            data, and cached for subsequent splits.
 
         Returns
         -------
@@ -541,6 +764,8 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             instrument=self.instrument,
             normalization=self.normalization,
             normalization_values=kwargs["normalization_values"],
+            dtype=self.dtype,
+            channels=self.channels,
         )
 
     def split_frames(
@@ -561,8 +786,8 @@ class AudioData(BaseData[AudioItem, AudioFile]):
         pass_normalization: bool
             If ``True``, the normalization values (mean, std, peak) will be computed
             from the original audio data and passed to the split chunks.
-            If the original ``AudioData`` is very long, this might lead to
-            a RAM saturation.
+            The values are computed in a single pass over the streamed audio
+            data, and cached for subsequent splits.
 
         Returns
         -------
@@ -602,6 +827,8 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             instrument=self.instrument,
             normalization=self.normalization,
             normalization_values=normalization_values,
+            dtype=self.dtype,
+            channels=self.channels,
         )
 
     def to_dict(self) -> dict:
@@ -631,6 +858,7 @@ class AudioData(BaseData[AudioItem, AudioFile]):
                 "normalization": self.normalization.value,
                 "normalization_values": self.normalization_values,
                 "channels": self.channels,
+                "dtype": self.dtype.name,
             }
         )
 
@@ -687,6 +915,7 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             normalization_values=dictionary.get("normalization_values", None),
             butter=butter,
             channels=dictionary.get("channels", None),
+            dtype=dictionary.get("dtype", "float64"),
         )
 
     @classmethod
@@ -728,6 +957,9 @@ class AudioData(BaseData[AudioItem, AudioFile]):
             butter: Butterworth
             Butterworth filter to apply to the audio data.
 
+            dtype: np.typing.DTypeLike
+            Type in which the audio data is read, resampled and filtered.
+
         Returns
         -------
         Self:
@@ -9,6 +9,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Literal, Self
 
+import numpy as np
+
 from osekit.core.audio_data import AudioData
 from osekit.core.audio_file import AudioFile
 from osekit.core.base_dataset import BaseDataset
@@ -100,6 +102,17 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
         for data in self.data:
             data.butter = butter
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the most frequent dtype among those of this dataset data."""
+        dtypes = [data.dtype for data in self.data]
+        return max(set(dtypes), key=dtypes.count)
+
+    @dtype.setter
+    def dtype(self, dtype: np.typing.DTypeLike) -> None:
+        for data in self.data:
+            data.dtype = dtype
+
     @property
     def instrument(self) -> Instrument | None:
         """Instrument that can be used to get acoustic pressure from wav audio data."""
@@ -154,7 +167,7 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
         """
         last = len(self.data) if last is None else last
         self.data[first:last] = multiprocess(
-            func=self._write_audio,
+            func=type(self)._write_audio,
             enumerable=self.data[first:last],
             folder=folder,
             subtype=subtype,
@@ -199,6 +212,7 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
         instrument: Instrument | None = None,
         normalization: Normalization = Normalization.RAW,
         butter: Butterworth | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
         **kwargs,  # noqa: ANN003
     ) -> Self:
         """Return an ``AudioDataset`` from a folder containing the audio files.
@@ -254,8 +268,11 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
             The type of normalization to apply to the audio data.
         butter: Butterworth | None
             Butterworth filter to apply to the audio data.
+        dtype: np.typing.DTypeLike
+            Type in which the audio data is read, resampled and filtered.
         kwargs: any
-            Keyword arguments passed to the ``BaseDataset.from_folder()`` classmethod.
+            Keyword arguments passed to the ``BaseDataset.from_folder()`` classmethod
+            (e.g. ``first_file_begin`` or ``metadata_index``).
 
         Returns
         -------
@@ -277,6 +294,8 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
             instrument=instrument,
             normalization=normalization,
             butter=butter,
+            dtype=dtype,
+            **kwargs,
         )
 
     @classmethod
@@ -293,6 +312,7 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
         instrument: Instrument | None = None,
         normalization: Normalization = Normalization.RAW,
         butter: Butterworth | None = None,
+        dtype: np.typing.DTypeLike = np.float64,
     ) -> AudioDataset:
         """Return an AudioDataset object from a list of AudioFiles.
 
@@ -335,6 +355,8 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
             The type of normalization to apply to the audio data.
         butter: Butterworth | None
             Butterworth filter to apply to the audio data.
+        dtype: np.typing.DTypeLike
+            Type in which the audio data is read, resampled and filtered.
 
         Returns
         -------
@@ -354,6 +376,7 @@ class AudioDataset(BaseDataset[AudioData, AudioFile]):
             overlap=overlap,
             data_duration=data_duration,
             butter=butter,
+            dtype=dtype,
         )
 
     @classmethod
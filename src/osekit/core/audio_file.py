@@ -12,13 +12,14 @@ if TYPE_CHECKING:
     from os import PathLike
     from pathlib import Path
 
-    import numpy as np
     import pytz
 from math import floor
 
+import numpy as np
 from pandas import Timedelta, Timestamp
 
 from osekit.core import audio_file_manager as afm
+from osekit.core import get_audio_file_manager
 from osekit.core.base_file import BaseFile
 
 
@@ -61,6 +62,9 @@ class AudioFile(BaseFile):
             to the specified timezone.
         kwargs: dict
             Audio file info that might bypass the afm.info() call on deserialization.
+            Either ``sample_rate``, ``channels`` and ``end``,
+            or ``sample_rate``, ``channels`` and ``frames``
+            (as returned by ``AudioFile.read_header()``).
         """
         super().__init__(
             path=path,
@@ -82,10 +86,36 @@ class AudioFile(BaseFile):
                 datetime_template=TIMESTAMP_FORMATS_EXPORTED_FILES,
             )
             return kwargs["sample_rate"], kwargs["channels"], end
-        sample_rate, frames, channels = afm.info(path=path)
-        duration = frames / sample_rate
+        header_keys = ["sample_rate", "channels", "frames"]
+        header = (
+            kwargs
+            if all(key in kwargs for key in header_keys)
+            else self.read_header(path)
+        )
+        duration = header["frames"] / header["sample_rate"]
         end = self.begin + Timedelta(seconds=duration)
-        return sample_rate, channels, end
+        return header["sample_rate"], header["channels"], end
+
+    @classmethod
+    def read_header(cls, path: PathLike | str) -> dict:
+        """Return the sample rate, number of frames and channels of the audio file.
+
+        The file is read with the audio file manager of the current thread,
+        so that headers can be read concurrently.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the audio file.
+
+        Returns
+        -------
+        dict:
+            The ``sample_rate``, ``frames`` and ``channels`` of the audio file.
+
+        """
+        sample_rate, frames, channels = get_audio_file_manager().info(path=path)
+        return {"sample_rate": sample_rate, "frames": frames, "channels": channels}
 
     def _check_validity(self) -> None:
         """Raise an error if the audio file is not valid."""
@@ -96,7 +126,13 @@ class AudioFile(BaseFile):
             )
             raise ValueError(msg)
 
-    def read(self, start: Timestamp, stop: Timestamp) -> np.ndarray:
+    def read(
+        self,
+        start: Timestamp,
+        stop: Timestamp,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         """Return the audio data between start and stop from the file.
 
         Parameters
@@ -105,6 +141,13 @@ class AudioFile(BaseFile):
             Timestamp corresponding to the first data point to read.
         stop: pandas.Timestamp
             Timestamp after the last data point to read.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+            Floating types are scaled in ``[-1.,1.[``,
+            integer types are scaled to their full range.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
 
         Returns
         -------
@@ -115,7 +158,13 @@ class AudioFile(BaseFile):
 
         """
         start_sample, stop_sample = self.frames_indexes(start, stop)
-        data = afm.read(self.path, start=start_sample, stop=stop_sample)
+        data = get_audio_file_manager().read(
+            self.path,
+            start=start_sample,
+            stop=stop_sample,
+            dtype=dtype,
+            channels=channels,
+        )
         if data.ndim == 1:
             return data[:, None]  # 2D array to match the format of multichannel audio
         return data
@@ -166,23 +215,39 @@ class AudioFile(BaseFile):
             Index of the frame to be seeked.
 
         """
-        afm.seek(path=self.path, frame=frame)
+        get_audio_file_manager().seek(path=self.path, frame=frame)
 
-    def stream(self, chunk_size: int) -> np.ndarray:
+    def stream(
+        self,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         """Stream ``chunk_size`` frames from the audio file.
 
         Parameters
         ----------
         chunk_size: int
             Number of frames to stream from the audio file.
+        dtype: np.typing.DTypeLike
+            Type of the returned data.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
 
         Returns
         -------
         np.ndarray:
-            A (``chunk_size``*``self.channels``) array of frames.
+            A (``chunk_size``*``self.channels``) array of frames,
+            or (``chunk_size``*``len(channels)``) if channels are specified.
 
         """
-        data = afm.stream(path=self.path, chunk_size=chunk_size)
+        data = get_audio_file_manager().stream(
+            path=self.path,
+            chunk_size=chunk_size,
+            dtype=dtype,
+            channels=channels,
+        )
         if data.ndim == 1:
             return data[:, None]  # 2D array to match the format of multichannel audio
         return data
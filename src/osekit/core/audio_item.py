@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from osekit import config
+from osekit.audio_backend.prefetcher import Prefetcher
+from osekit.core import get_audio_file_manager
 from osekit.core.audio_file import AudioFile
 from osekit.core.base_item import BaseItem
 
@@ -66,7 +70,64 @@ class AudioItem(BaseItem[AudioFile]):
             return np.zeros((1, self.nb_channels))
         return super().get_value()
 
-    def stream(self, chunk_size: int) -> Generator[np.ndarray, None, None]:
+    def stream(
+        self,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+        prefetch: int | None = None,
+    ) -> Generator[np.ndarray, None, None]:
+        """Stream the data of the item in chunks.
+
+        Parameters
+        ----------
+        chunk_size: int
+            Number of frames of each chunk.
+        dtype: np.typing.DTypeLike
+            Type of the streamed data.
+        channels: list[int] | None
+            Indexes of the channels to read.
+            If ``None``, all channels are read.
+        prefetch: int | None
+            Number of chunks read ahead by a background I/O thread.
+            Defaulted to ``osekit.config.prefetch["depth"]``.
+            If ``0``, the chunks are read synchronously.
+
+        Returns
+        -------
+        Generator[np.ndarray, None, None]:
+            Generated (``chunk_size``*``nb_channels``) chunks of the item data.
+
+        """
+        depth = config.prefetch["depth"] if prefetch is None else prefetch
+        if not depth:
+            yield from self._read_chunks(
+                chunk_size=chunk_size,
+                dtype=dtype,
+                channels=channels,
+            )
+            return
+
+        prefetcher = Prefetcher(
+            produce=partial(
+                self._prefetch_chunks,
+                chunk_size=chunk_size,
+                dtype=dtype,
+                channels=channels,
+            ),
+            depth=depth,
+        )
+        try:
+            yield from prefetcher
+        finally:
+            get_audio_file_manager().record_prefetch(prefetcher.stats)
+
+    def _read_chunks(
+        self,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike,
+        channels: list[int] | None,
+    ) -> Generator[np.ndarray, None, None]:
         start_frame, stop_frame = self.file.frames_indexes(
             start=self.begin,
             stop=self.end,
@@ -78,5 +139,25 @@ class AudioItem(BaseItem[AudioFile]):
 
         while remaining > 0:
             frames_to_read = min(chunk_size, remaining)
-            yield self.file.stream(chunk_size=frames_to_read)
+            yield self.file.stream(
+                chunk_size=frames_to_read,
+                dtype=dtype,
+                channels=channels,
+            )
             remaining -= frames_to_read
+
+    def _prefetch_chunks(
+        self,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike,
+        channels: list[int] | None,
+    ) -> Generator[np.ndarray, None, None]:
+        # Runs in the I/O thread, which reads through its own file manager.
+        try:
+            yield from self._read_chunks(
+                chunk_size=chunk_size,
+                dtype=dtype,
+                channels=channels,
+            )
+        finally:
+            get_audio_file_manager().close()
@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 from abc import ABC, abstractmethod
 from bisect import bisect
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Self, TypeVar
 
@@ -22,6 +23,8 @@ from osekit.core.base_data import BaseData
 from osekit.core.base_file import BaseFile
 from osekit.core.event import Event
 from osekit.core.json_serializer import deserialize_json, serialize_json
+from osekit.core.metadata_index import MetadataIndex
+from osekit.utils.multiprocess import multiprocess
 from osekit.utils.timestamp import last_window_end
 
 if TYPE_CHECKING:
@@ -39,6 +42,7 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
     """
 
     file_cls: type[TFile]
+    _bypass_multiprocessing_on_dataset = False
 
     def __init__(
         self,
@@ -234,11 +238,19 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
         """
         last = len(self.data) if last is None else last
         self._check_duplicate_data_names(first_idx=first, last_idx=last)
-        for data in tqdm(
-            self.data[first:last],
-            disable=os.getenv("DISABLE_TQDM", "False").lower() in ("true", "1", "t"),
-        ):
-            data.write(folder=folder, link=link)
+        self.data[first:last] = multiprocess(
+            func=type(self)._write_data,
+            enumerable=self.data[first:last],
+            bypass_multiprocessing=type(self)._bypass_multiprocessing_on_dataset,
+            folder=folder,
+            link=link,
+        )
+
+    @staticmethod
+    def _write_data(data: TData, folder: Path, *, link: bool = False) -> TData:
+        """Write a data object to disk."""
+        data.write(folder=folder, link=link)
+        return data
 
     def to_dict(self) -> dict:
         """Serialize a ``BaseDataset`` to a dictionary.
@@ -522,6 +534,9 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
         data_duration: Timedelta | None = None,
         first_file_begin: Timestamp | None = None,
         name: str | None = None,
+        *,
+        metadata_index: bool = False,
+        scan_workers: int = 1,
         **kwargs,  # noqa: ANN003
     ) -> Self:
         """Return a Dataset from a folder containing the base files.
@@ -569,6 +584,15 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
             Will be ignored if ``striptime_format`` is specified.
         name: str|None
             Name of the dataset.
+        metadata_index: bool
+            If ``True``, the header metadata of the files are read from
+            (and stored in) a ``MetadataIndex`` file written in the folder,
+            so that only the new or modified files are opened the next time
+            the folder is parsed.
+        scan_workers: int
+            Number of threads used for reading the file headers.
+            If greater than ``1``, the headers are read concurrently before the
+            files are instantiated in the folder order.
         kwargs:
             Keyword arguments to pass to the ``cls.from_files()`` method.
 
@@ -580,9 +604,16 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
         """
         valid_files = []
         rejected_files = []
+        index = MetadataIndex(folder) if metadata_index else None
         first_file_begin = first_file_begin or Timestamp("2020-01-01 00:00:00")
+        files = sorted(folder.iterdir())
+        headers = cls._scan_headers(
+            files=files,
+            index=index,
+            scan_workers=scan_workers,
+        )
         for file in tqdm(
-            sorted(folder.iterdir()),
+            files,
             disable=os.getenv("DISABLE_TQDM", "False").lower() in ("true", "1", "t"),
         ):
             is_file_ok = cls._parse_file(
@@ -592,10 +623,15 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
                 begin_timestamp=first_file_begin,
                 valid_files=valid_files,
                 rejected_files=rejected_files,
+                header=headers.get(file, {}),
             )
             if is_file_ok:
                 first_file_begin += valid_files[-1].duration
 
+        if index is not None:
+            index.prune(files)
+            index.write()
+
         if rejected_files:
             rejected_files = "\n\t".join(f.name for f in rejected_files)
             glc.logger.warning(
@@ -617,6 +653,61 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
             **kwargs,
         )
 
+    @classmethod
+    def _scan_headers(
+        cls: type[Self],
+        files: list[Path],
+        index: MetadataIndex | None,
+        scan_workers: int,
+    ) -> dict[Path, dict | ValueError | LibsndfileError]:
+        """Read the headers of the supported files.
+
+        Headers are read from the index if possible, else from the files
+        themselves (concurrently if ``scan_workers > 1``).
+        Errors are captured so that the corresponding files can be rejected
+        when parsed.
+        No header is read if there is no index and a single worker: the files
+        then read their own header when instantiated.
+        """
+        if index is None and scan_workers <= 1:
+            return {}
+
+        files = [
+            file
+            for file in files
+            if file.suffix.lower() in cls.file_cls.supported_extensions
+        ]
+
+        def read_header(
+            file: Path,
+        ) -> tuple[dict | ValueError | LibsndfileError, bool]:
+            if index is not None and (header := index.get(file)) is not None:
+                return header, False
+            try:
+                return cls.file_cls.read_header(file), True
+            except (ValueError, LibsndfileError) as e:
+                return e, False
+
+        if scan_workers > 1:
+            with ThreadPoolExecutor(max_workers=scan_workers) as executor:
+                results = list(
+                    tqdm(
+                        executor.map(read_header, files),
+                        total=len(files),
+                        disable=os.getenv("DISABLE_TQDM", "False").lower()
+                        in ("true", "1", "t"),
+                    ),
+                )
+        else:
+            results = [read_header(file) for file in files]
+
+        headers = {}
+        for file, (header, is_read_from_file) in zip(files, results, strict=True):
+            headers[file] = header
+            if index is not None and is_read_from_file:
+                index.update(file, header)
+        return headers
+
     @classmethod
     def _parse_file(
         cls: type[Self],
@@ -626,17 +717,28 @@ class BaseDataset[TData: BaseData, TFile: BaseFile](Event, ABC):
         begin_timestamp: Timestamp,
         valid_files: list[TFile],
         rejected_files: list[Path],
+        header: dict | ValueError | LibsndfileError | None = None,
     ) -> bool:
         if file.suffix.lower() not in cls.file_cls.supported_extensions:
             return False
+        if isinstance(header, (ValueError, LibsndfileError)):
+            rejected_files.append(file)
+            return False
+        header = header or {}
         try:
             if strptime_format is None:
-                f = cls.file_cls(file, begin=begin_timestamp, timezone=timezone)
+                f = cls.file_cls(
+                    file,
+                    begin=begin_timestamp,
+                    timezone=timezone,
+                    **header,
+                )
             else:
                 f = cls.file_cls(
                     file,
                     strptime_format=strptime_format,
                     timezone=timezone,
+                    **header,
                 )
             valid_files.append(f)
         except (ValueError, LibsndfileError):
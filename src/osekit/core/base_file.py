@@ -116,6 +116,29 @@ class BaseFile(Event, ABC):
         """
         ...
 
+    @classmethod
+    def read_header(cls, path: PathLike | str) -> dict:
+        """Return the metadata read from the header of the file.
+
+        The returned metadata can be passed as keyword arguments to the
+        constructor to spare it from reading the header again.
+        They are stored in the ``MetadataIndex`` when building a dataset
+        from a folder.
+
+        Parameters
+        ----------
+        path: PathLike | str
+            Path to the file.
+
+        Returns
+        -------
+        dict:
+            ``json``-serializable metadata of the file.
+            Empty for files that don't have any header metadata.
+
+        """
+        return {}
+
     def to_dict(self) -> dict:
         """Serialize a File to a dictionary.
 
@@ -25,7 +25,7 @@ import numpy as np
 from scipy.signal import ShortTimeFFT
 
 from osekit.core.spectro_data import SpectroData
-from osekit.utils.multiprocess import multiprocess
+from osekit.utils.multiprocess import multiprocess_stacked
 
 if TYPE_CHECKING:
     from pandas import Timestamp
@@ -149,9 +149,7 @@ class LTASData(SpectroData):
                 [self.mean_value_part(sub_spectro) for sub_spectro in sub_spectros],
             ).T
 
-        return np.vstack(
-            list(multiprocess(self.mean_value_part, sub_spectros)),
-        ).T
+        return multiprocess_stacked(self.mean_value_part, sub_spectros).T
 
     @classmethod
     def from_spectro_data(
@@ -183,7 +181,7 @@ class LTASData(SpectroData):
         db_ref = spectro_data.db_ref
         v_lim = spectro_data.v_lim
         colormap = spectro_data.colormap
-        return cls(
+        ltas_data = cls(
             items=items,
             audio_data=audio_data,
             begin=begin,
@@ -194,6 +192,8 @@ class LTASData(SpectroData):
             v_lim=v_lim,
             colormap=colormap,
         )
+        ltas_data.storage_precision = spectro_data.storage_precision
+        return ltas_data
 
     @classmethod
     def from_audio_data(
@@ -0,0 +1,126 @@
+"""On-disk index of the header metadata of the files of a folder.
+
+Reading the header of each file of a large folder (sample rate, number of
+frames...) can take a long time, especially on network filesystems.
+The ``MetadataIndex`` stores these metadata in a ``json`` file in the folder,
+keyed by the file name, size and modification time, so that only new or
+modified files have to be opened when the folder is parsed again.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+class MetadataIndex:
+    """On-disk index of the header metadata of the files of a folder."""
+
+    filename = ".osekit_metadata_index.json"
+    version = 1
+
+    def __init__(self, folder: Path) -> None:
+        """Load the metadata index of a folder.
+
+        An empty index is created if the folder has no index yet,
+        or if the index file can't be read.
+
+        Parameters
+        ----------
+        folder: Path
+            Folder in which the indexed files are located.
+
+        """
+        self.folder = folder
+        self._entries: dict[str, dict] = {}
+        self._modified = False
+        if not self.path.exists():
+            return
+        try:
+            content = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if content.get("version") == self.version:
+            self._entries = content.get("files", {})
+
+    @property
+    def path(self) -> Path:
+        """Path to the index file."""
+        return self.folder / self.filename
+
+    def get(self, file: Path) -> dict | None:
+        """Return the indexed metadata of a file.
+
+        Parameters
+        ----------
+        file: Path
+            Path to the file.
+
+        Returns
+        -------
+        dict | None:
+            The indexed metadata of the file, or ``None`` if the file isn't
+            indexed or has been modified since it was indexed.
+
+        """
+        entry = self._entries.get(file.name)
+        if entry is None:
+            return None
+        stat = file.stat()
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return entry["metadata"]
+
+    def update(self, file: Path, metadata: dict) -> None:
+        """Index the metadata of a file.
+
+        Parameters
+        ----------
+        file: Path
+            Path to the file.
+        metadata: dict
+            ``json``-serializable metadata of the file.
+
+        """
+        stat = file.stat()
+        self._entries[file.name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "metadata": metadata,
+        }
+        self._modified = True
+
+    def prune(self, files: Iterable[Path]) -> None:
+        """Remove the entries of the files that are not in ``files``.
+
+        Parameters
+        ----------
+        files: Iterable[Path]
+            Files which entries should be kept.
+
+        """
+        names = {file.name for file in files}
+        for name in set(self._entries) - names:
+            del self._entries[name]
+            self._modified = True
+
+    def write(self) -> None:
+        """Write the index file if it has been modified."""
+        if not self._modified:
+            return
+        self.path.write_text(
+            json.dumps({"version": self.version, "files": self._entries}),
+        )
+        self._modified = False
+
+    def __contains__(self, file: Path) -> bool:
+        """Return ``True`` if the file is indexed and has not been modified since."""
+        return self.get(file) is not None
+
+    def __len__(self) -> int:
+        """Return the number of indexed files."""
+        return len(self._entries)
@@ -22,16 +22,19 @@ from scipy.signal import ShortTimeFFT, welch
 
 from osekit.core.audio_data import AudioData
 from osekit.core.base_data import BaseData, TFile
-from osekit.core.spectro_file import SpectroFile
+from osekit.core.spectro_file import STORAGE_PRECISIONS, SpectroFile
 from osekit.core.spectro_item import SpectroItem
+from osekit.utils.audio import stft_stream
 from osekit.utils.plot import get_default_axes
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
     from pandas import Timestamp
 
     from osekit.core.frequency_scale import Scale
+    from osekit.core.spectro_file import StoragePrecision
 
 
 class SpectroData(BaseData[SpectroItem, SpectroFile]):
@@ -96,6 +99,7 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         self.audio_channel = audio_channel
         self.fft = fft
         self._sx_dtype = complex
+        self.storage_precision = "double"
         self._db_ref = db_ref
         self.v_lim = v_lim
         self.colormap = "viridis" if colormap is None else colormap
@@ -152,7 +156,12 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
 
     @property
     def nb_bytes(self) -> int:
-        """Total bytes consumed by the spectro values."""
+        """Total bytes consumed by the computed spectro values.
+
+        This is the size of the values in memory, which are computed in full
+        precision: the size of the written ``npz`` files depends on the
+        ``storage_precision``.
+        """
         nb_bytes_per_cell = 16 if self.sx_dtype is complex else 8
         return self.shape[0] * self.shape[1] * nb_bytes_per_cell
 
@@ -174,6 +183,31 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
             raise ValueError(msg)
         self._sx_dtype = dtype
 
+    @property
+    def storage_precision(self) -> StoragePrecision:
+        """Precision in which the sx values are written in ``npz`` files.
+
+        ``"double"``: The sx values are written as ``complex128`` or ``float64``.
+        ``"single"``: The sx values are written as ``complex64`` or ``float32``.
+        ``"uint16"``, ``"uint8"``: The absolute square of the sx values is
+        written in ``dB``, quantized as unsigned integers.
+        The phase info is lost.
+
+        The written values are read back transparently from the ``SpectroFile``.
+
+        """
+        return self._storage_precision
+
+    @storage_precision.setter
+    def storage_precision(self, precision: StoragePrecision) -> None:
+        if precision not in STORAGE_PRECISIONS:
+            msg = (
+                f"Unknown storage precision: {precision}. "
+                f"Should be one of {STORAGE_PRECISIONS}."
+            )
+            raise ValueError(msg)
+        self._storage_precision = precision
+
     @property
     def db_ref(self) -> float:
         """Reference value for computing sx values in decibel.
@@ -243,6 +277,8 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         """Return the Sx spectrum of the spectrogram.
 
         The Sx spectrum contains the absolute square of the STFT.
+        The STFT is computed on the audio data streamed chunk by chunk,
+        so that the audio data is never loaded at once in memory.
         """
         if not all(item.is_empty for item in self.items):
             return self._get_value_from_items(self.items)
@@ -250,15 +286,145 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
             msg = "SpectroData should have either items or audio_data."
             raise ValueError(msg)
 
-        sx = self.fft.stft(
-            x=self.audio_data.get_value_calibrated()[
-                :,
-                self.audio_data.channels.index(self.audio_channel),
-            ],
-            padding="zeros",
+        return self._sx_from_stft(self._get_stft())
+
+    def get_channel_values(self, channels: list[int] | None = None) -> np.ndarray:
+        """Return the Sx spectra of several channels of the audio data.
+
+        The STFTs of all channels are computed from a single pass over the
+        audio data, which is read, resampled and filtered only once.
+        Each spectrum is the same as the one returned by ``get_value()``
+        with the ``audio_channel`` set to the corresponding channel.
+
+        Parameters
+        ----------
+        channels: list[int] | None
+            Channels of the audio **file** for which the spectra are computed.
+            Defaulted to all the channels of the ``AudioData``.
+
+        Returns
+        -------
+        np.ndarray:
+            The (``channels``*``frequencies``*``time slices``) Sx spectra,
+            in the order of ``channels``.
+
+        """
+        if not self._is_computed_from_audio():
+            msg = "Channel values can only be computed from an audio_data."
+            raise ValueError(msg)
+        channels = self.audio_data.channels if channels is None else channels
+        for channel in channels:
+            if channel not in self.audio_data.channels:
+                msg = (
+                    f"Can't target audio channel {channel}: AudioData only targets "
+                    f"channels {self.audio_data.channels}."
+                )
+                raise ValueError(msg)
+        return self._sx_from_stft(self._get_stft(channels=channels), channels=channels)
+
+    def channel_data(self, channel: int) -> SpectroData:
+        """Return a ``SpectroData`` targeting another channel of the audio data.
+
+        The returned ``SpectroData`` shares the audio data and the properties
+        of this ``SpectroData``, and is named after the targeted channel so
+        that the spectra of several channels can be exported side by side.
+
+        Parameters
+        ----------
+        channel: int
+            Channel of the audio **file** targeted by the returned ``SpectroData``.
+
+        Returns
+        -------
+        SpectroData:
+            The ``SpectroData`` of the channel.
+
+        """
+        sd = SpectroData.from_audio_data(
+            data=self.audio_data,
+            fft=self.fft,
+            v_lim=self.v_lim,
+            colormap=self.colormap,
+            audio_channel=channel,
+            name=f"{self}_ch{channel}",
+            db_ref=self._db_ref,
         )
+        sd.sx_dtype = self.sx_dtype
+        sd.storage_precision = self.storage_precision
+        sd.previous_data = self.previous_data
+        sd.next_data = self.next_data
+        return sd
+
+    def _get_stft(self, channels: list[int] | None = None) -> np.ndarray:
+        """Compute the STFT of the audio data, streamed chunk by chunk.
 
-        sx = self._merge_with_previous(sx)
+        Parameters
+        ----------
+        channels: list[int] | None
+            Channels of the audio file for which the STFTs are computed
+            from the same chunks.
+            If ``None``, only the STFT of the ``audio_channel`` is computed.
+
+        Returns
+        -------
+        np.ndarray:
+            The (``frequencies``*``time slices``) STFT of the ``audio_channel``,
+            or the (``channels``*``frequencies``*``time slices``) STFTs of the
+            ``channels``.
+
+        """
+        if channels is None:
+            chunks = self._stream_audio_channel(
+                channel_index=self.audio_data.channels.index(self.audio_channel),
+            )
+            shape = ()
+        else:
+            indexes = [self.audio_data.channels.index(c) for c in channels]
+            chunks = (
+                chunk[:, indexes]
+                for chunk in self.audio_data.stream_value_calibrated(
+                    chunk_size=65_536,
+                )
+            )
+            shape = (len(channels),)
+
+        sx = np.empty(
+            (*shape, self.fft.f_pts, self.fft.p_num(self.audio_data.shape[0])),
+            dtype=complex,
+        )
+        filled = 0
+        for block in stft_stream(fft=self.fft, chunks=chunks):
+            sx[..., filled : filled + block.shape[-1]] = block
+            filled += block.shape[-1]
+        return sx[..., :filled]
+
+    def _is_computed_from_audio(self) -> bool:
+        """Return ``True`` if the Sx spectrum is computed from the audio data."""
+        return all(item.is_empty for item in self.items) and bool(
+            self.audio_data and self.fft,
+        )
+
+    def _get_audio_channel_value(self) -> np.ndarray:
+        """Return the calibrated value of the channel of the audio data."""
+        return np.concatenate(
+            list(
+                self._stream_audio_channel(
+                    channel_index=self.audio_data.channels.index(self.audio_channel),
+                ),
+            ),
+        )
+
+    def _sx_from_stft(
+        self,
+        sx: np.ndarray,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
+        """Merge the STFT of the audio data with the neighbours into the Sx spectrum.
+
+        ``channels`` are the channels of the STFTs if they were computed
+        for several channels, as in ``_get_stft()``.
+        """
+        sx = self._merge_with_previous(sx, channels=channels)
         sx = self._remove_overlap_with_next(sx)
 
         if self.sx_dtype is float:
@@ -266,17 +432,93 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
 
         return sx
 
-    def _merge_with_previous(self, data: np.ndarray) -> np.ndarray:
+    def _merge_with_previous(
+        self,
+        data: np.ndarray,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         if self.previous_data is None:
             return data
-        olap = SpectroData.get_overlapped_bins(self.previous_data, self)
-        return np.hstack((olap, data[:, olap.shape[1] :]))
+        # The first overlapped bins of this data are the first bins of its
+        # STFT: only the last bins of the previous data have to be computed.
+        # The previous data might target another channel (e.g. with channel_data()).
+        nb_bins = SpectroData._nb_overlapped_bins(self.previous_data.fft)
+        last_bins = self.previous_data._get_last_bins(  # noqa: SLF001
+            channels=[self.audio_channel] if channels is None else channels,
+        )
+        if channels is None:
+            last_bins = last_bins[0]
+        olap = last_bins[..., -nb_bins:] + data[..., :nb_bins]
+        return np.concatenate((olap, data[..., olap.shape[-1] :]), axis=-1)
 
     def _remove_overlap_with_next(self, data: np.ndarray) -> np.ndarray:
         if self.next_data is None:
             return data
-        olap = SpectroData.get_overlapped_bins(self, self.next_data)
-        return data[:, : -olap.shape[1]]
+        return data[..., : -SpectroData._nb_overlapped_bins(self.fft)]
+
+    @staticmethod
+    def _nb_overlapped_bins(fft: ShortTimeFFT) -> int:
+        """Return the number of bins that overflow between consecutive spectro data."""
+        return fft.lower_border_end[1] - fft.p_min
+
+    def _get_last_audio_data(self) -> AudioData:
+        """Return the end of the audio data, from the upper border."""
+        upper_border = self.fft.upper_border_begin(self.audio_data.shape[0])
+        bin_start = self.fft.nearest_k_p(k=upper_border[0], left=True)
+        return self.audio_data.split_frames(start_frame=bin_start)
+
+    def _get_first_audio_data(self) -> AudioData:
+        """Return the start of the audio data, up to the lower border."""
+        bin_stop = self.fft.nearest_k_p(k=self.fft.lower_border_end[0], left=False)
+        return self.audio_data.split_frames(stop_frame=bin_stop)
+
+    def _get_last_bins(self, channels: list[int] | None = None) -> np.ndarray:
+        """Compute the STFT of the end of the audio data, from the upper border."""
+        sd = SpectroData.from_audio_data(
+            self._get_last_audio_data(),
+            fft=self.fft,
+            audio_channel=self.audio_channel,
+        )
+        return sd._get_stft(channels=channels)  # noqa: SLF001
+
+    def _get_first_bins(self, channels: list[int] | None = None) -> np.ndarray:
+        """Compute the STFT of the start of the audio data, up to the lower border."""
+        sd = SpectroData.from_audio_data(
+            self._get_first_audio_data(),
+            fft=self.fft,
+            audio_channel=self.audio_channel,
+        )
+        return sd._get_stft(channels=channels)  # noqa: SLF001
+
+    def __getstate__(self) -> dict:
+        """Return the state of the spectro data, with lightweight neighbours.
+
+        Only the audio data of the neighbours that overflows on this data
+        is needed to merge the overlapped bins: pickling the neighbours
+        themselves would recursively pickle the whole chain of split data
+        (e.g. when a part is sent to a worker process).
+
+        Returns
+        -------
+        dict:
+            The state of the spectro data, in which the neighbours are
+            replaced with spectro data of their overflowing audio data.
+
+        """
+        state = self.__dict__.copy()
+        if self.previous_data is not None:
+            state["previous_data"] = SpectroData.from_audio_data(
+                self.previous_data._get_last_audio_data(),  # noqa: SLF001
+                fft=self.previous_data.fft,
+                audio_channel=self.previous_data.audio_channel,
+            )
+        if self.next_data is not None:
+            state["next_data"] = SpectroData.from_audio_data(
+                self.next_data._get_first_audio_data(),  # noqa: SLF001
+                fft=self.next_data.fft,
+                audio_channel=self.next_data.audio_channel,
+            )
+        return state
 
     def get_welch(
         self,
@@ -293,6 +535,12 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         The window, sample rate, overlap and mfft are taken from the
         ``SpectroData.fft`` property.
 
+        With ``mean`` averaging, the audio data is streamed and the periodograms
+        are accumulated block by block, so that the whole audio data is never
+        loaded in memory.
+        ``median`` averaging requires all periodograms at once, and is computed
+        on the whole audio data.
+
         Parameters
         ----------
         nperseg: int|None
@@ -330,25 +578,71 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         noverlap = self.fft.hop
         if noverlap == window.shape[0]:
             noverlap //= 2
-        nfft = self.fft.mfft
-
-        _, sx = welch(
-            self.audio_data.get_value_calibrated()[
-                :,
-                0,
-            ],  # Only considers the 1rst channel
-            fs=self.audio_data.sample_rate,
-            window=window,
-            nperseg=nperseg,
-            noverlap=noverlap,
-            nfft=nfft,
-            detrend=detrend,
-            return_onesided=return_onesided,
-            scaling=scaling,
-            average=average,
-        )
+        welch_kwargs = {
+            "fs": self.audio_data.sample_rate,
+            "window": window,
+            "nperseg": nperseg,
+            "noverlap": noverlap,
+            "nfft": self.fft.mfft,
+            "detrend": detrend,
+            "return_onesided": return_onesided,
+            "scaling": scaling,
+            "average": average,
+        }
 
-        return sx
+        # Only considers the 1rst channel
+        chunks = self._stream_audio_channel(channel_index=0)
+
+        if average != "mean":
+            _, sx = welch(np.concatenate(list(chunks)), **welch_kwargs)
+            return sx
+
+        nperseg = window.shape[0] if nperseg is None else nperseg
+        step = nperseg - noverlap
+        sx, nb_segments, buffer = None, 0, None
+        for chunk in chunks:
+            buffer = chunk if buffer is None else np.concatenate((buffer, chunk))
+            block_segments = (len(buffer) - nperseg) // step + 1
+            if block_segments < 1:
+                continue
+            _, block_sx = welch(
+                buffer[: (block_segments - 1) * step + nperseg],
+                **welch_kwargs,
+            )
+            block_sx *= block_segments
+            sx = block_sx if sx is None else sx + block_sx
+            nb_segments += block_segments
+            buffer = buffer[block_segments * step :]
+
+        if sx is None:
+            # The audio data is shorter than a segment.
+            _, sx = welch(buffer, **welch_kwargs)
+            return sx
+
+        return sx / nb_segments
+
+    def _stream_audio_channel(
+        self,
+        channel_index: int,
+        chunk_size: int = 65_536,
+    ) -> Generator[np.ndarray, None, None]:
+        """Stream one channel of the calibrated value of the audio data.
+
+        Parameters
+        ----------
+        channel_index: int
+            Index of the channel in the value of the audio data.
+        chunk_size: int
+            Size of the chunks of audio yielded by the generator.
+
+        Returns
+        -------
+        Generator[np.ndarray, None, None]:
+            Generated ``np.ndarray`` of the calibrated values of the channel.
+
+        """
+        for chunk in self.audio_data.stream_value_calibrated(chunk_size=chunk_size):
+            yield chunk[:, channel_index]
 
     def write_welch(
         self,
@@ -534,9 +828,15 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
 
         """
         super().create_directories(path=folder)
+        # The default figure is not created through pyplot, so that
+        # spectrograms can be saved from threads.
+        ax = ax if ax is not None else get_default_axes(pyplot=False)
         self.plot(ax=ax, sx=sx, scale=scale)
-        plt.savefig(f"{folder / str(self)}", bbox_inches="tight", pad_inches=0)
-        plt.close()
+        figure = ax.figure
+        figure.savefig(f"{folder / str(self)}", bbox_inches="tight", pad_inches=0)
+        if figure.canvas.manager is not None:
+            # The figure of a given axes might be registered in pyplot.
+            plt.close(figure)
         gc.collect()
 
     def write(
@@ -548,6 +848,11 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
     ) -> None:
         """Write the Spectro data to file.
 
+        The sx values are written in the ``storage_precision``.
+        If the values are quantized, the absolute square of complex values
+        is written, and the ``sx_dtype`` of a linked ``SpectroData`` is set to
+        ``float``.
+
         Parameters
         ----------
         folder: pathlib.Path
@@ -571,6 +876,8 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         db_ref = [self.db_ref]
         v_lim = self.v_lim
         timestamps = (str(t) for t in (self.begin, self.end))
+        if self.storage_precision in ("uint16", "uint8") and np.iscomplexobj(sx):
+            sx = abs(sx) ** 2
         np.savez(
             file=folder / f"{self}.npz",
             fs=fs,
@@ -578,7 +885,7 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
             freq=freq,
             window=window,
             hop=hop,
-            sx=sx,
+            **SpectroFile.encode_sx(sx=sx, precision=self.storage_precision),
             mfft=mfft,
             db_ref=db_ref,
             v_lim=v_lim,
@@ -586,6 +893,8 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
         )
         if link:
             self.link(file=folder / f"{self}.npz")
+            if not np.iscomplexobj(sx):
+                self.sx_dtype = float
 
     def link(self, file: Path) -> None:
         """Link the ``SpectroData`` to a ``SpectroFile``.
@@ -668,6 +977,7 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
                 fft=self.fft,
                 v_lim=self.v_lim,
                 colormap=self.colormap,
+                audio_channel=self.audio_channel,
             )
             for ad in ad_split
         ]
@@ -722,20 +1032,8 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
             ``np.hstack(sd1[:,:-p], result, sd2[:,p:])``
 
         """
-        fft = sd1.fft
-        sd1_ub = fft.upper_border_begin(sd1.audio_data.shape[0])
-        sd1_bin_start = fft.nearest_k_p(k=sd1_ub[0], left=True)
-        sd2_lb = fft.lower_border_end
-        sd2_bin_stop = fft.nearest_k_p(k=sd2_lb[0], left=False)
-
-        ad1 = sd1.audio_data.split_frames(start_frame=sd1_bin_start)
-        ad2 = sd2.audio_data.split_frames(stop_frame=sd2_bin_stop)
-
-        sd_part1 = SpectroData.from_audio_data(ad1, fft=fft).get_value()
-        sd_part2 = SpectroData.from_audio_data(ad2, fft=fft).get_value()
-
-        p1_le = fft.lower_border_end[1] - fft.p_min
-        return sd_part1[:, -p1_le:] + sd_part2[:, :p1_le]
+        nb_bins = cls._nb_overlapped_bins(sd1.fft)
+        return sd1._get_last_bins()[:, -nb_bins:] + sd2._get_first_bins()[:, :nb_bins]
 
     @classmethod
     def _make_file(cls, file_dict: dict) -> SpectroFile:
@@ -986,6 +1284,7 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
                 "v_lim": self.v_lim,
                 "colormap": self.colormap,
                 "audio_channel": self.audio_channel,
+                "storage_precision": self.storage_precision,
             }
         )
 
@@ -1035,6 +1334,7 @@ class SpectroData(BaseData[SpectroItem, SpectroFile]):
             colormap=dictionary["colormap"],
             audio_channel=dictionary.get("audio_channel", 0),
         )
+        spectro_data.storage_precision = dictionary.get("storage_precision", "double")
 
         if dictionary["files"]:
             spectro_files = [
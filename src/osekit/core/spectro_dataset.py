@@ -19,14 +19,16 @@ from osekit.core.frequency_scale import Scale
 from osekit.core.json_serializer import deserialize_json
 from osekit.core.spectro_data import SpectroData
 from osekit.core.spectro_file import SpectroFile
+from osekit.utils.audio import stft_batch
 from osekit.utils.core import locked
-from osekit.utils.multiprocess import multiprocess
+from osekit.utils.multiprocess import multiprocess, multiprocess_stacked
 
 if TYPE_CHECKING:
     import pytz
     from pandas import Timedelta, Timestamp
 
     from osekit.core.audio_dataset import AudioDataset
+    from osekit.core.spectro_file import StoragePrecision
 
 
 class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
@@ -38,7 +40,6 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
     """
 
     sentinel_value = object()
-    _bypass_multiprocessing_on_dataset = False
     data_cls = SpectroData
     file_cls = SpectroFile
 
@@ -105,6 +106,28 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
         for d in self.data:
             d.v_lim = v_lim
 
+    @property
+    def storage_precision(self) -> StoragePrecision:
+        """Return the most frequent ``storage_precision`` of the spectro dataset."""
+        return max(
+            {d.storage_precision for d in self.data},
+            key=[d.storage_precision for d in self.data].count,
+        )
+
+    @storage_precision.setter
+    def storage_precision(self, precision: StoragePrecision) -> None:
+        """Set the precision in which the sx values are written in ``npz`` files.
+
+        Parameters
+        ----------
+        precision: StoragePrecision
+            Precision in which the sx values are written.
+            See ``SpectroData.storage_precision`` for more info.
+
+        """
+        for d in self.data:
+            d.storage_precision = precision
+
     @property
     def folder(self) -> Path:
         """Folder in which the dataset files are located."""
@@ -125,9 +148,107 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
         for file in self.files:
             file.move(folder)
 
-    def _save_spectrogram(self, sd: SpectroData, folder: Path) -> None:
+    def get_values(
+        self,
+        first: int = 0,
+        last: int | None = None,
+        batch_size: int = 32,
+        workers: int | None = None,
+    ) -> list[np.ndarray]:
+        """Return the Sx spectra of the ``SpectroData``, computed by batches.
+
+        The ``SpectroData`` that share the same ``fft`` and the same number of
+        audio samples are grouped in batches of ``batch_size`` data, which
+        STFTs are computed at once by ``osekit.utils.audio.stft_batch``.
+        The other ``SpectroData`` are computed one by one.
+        Each returned spectrum matches the one returned by
+        ``SpectroData.get_value()`` up to floating-point rounding errors.
+
+        Parameters
+        ----------
+        first: int
+            Index of the first ``SpectroData`` object to compute.
+        last: int | None
+            Index after the last ``SpectroData`` object to compute.
+        batch_size: int
+            Maximum number of ``SpectroData`` which STFTs are computed at once.
+            The audio data of a whole batch is loaded in memory.
+        workers: int | None
+            Maximum number of workers used by ``scipy.fft`` to compute the FFTs.
+            If ``None``, the current ``scipy.fft`` default is used.
+
+        Returns
+        -------
+        list[np.ndarray]:
+            The Sx spectra of the ``SpectroData``, in the order of the dataset.
+
+        """
+        if batch_size < 1:
+            msg = f"The batch size must be at least 1. Got {batch_size}."
+            raise ValueError(msg)
+
+        data = self.data[first:last]
+        values: list[np.ndarray | None] = [None] * len(data)
+
+        groups: dict[tuple[int, int], list[int]] = {}
+        for index, sd in enumerate(data):
+            if not sd._is_computed_from_audio():  # noqa: SLF001
+                values[index] = sd.get_value()
+                continue
+            key = (id(sd.fft), sd.audio_data.shape[0])
+            groups.setdefault(key, []).append(index)
+
+        for indexes in groups.values():
+            for batch_start in range(0, len(indexes), batch_size):
+                batch = indexes[batch_start : batch_start + batch_size]
+                for index, sx in zip(
+                    batch,
+                    type(self)._get_batch_values(
+                        [data[index] for index in batch],
+                        workers=workers,
+                    ),
+                    strict=True,
+                ):
+                    values[index] = sx
+
+        return values
+
+    @staticmethod
+    def _get_batch_values(
+        batch: list[SpectroData],
+        workers: int | None = None,
+    ) -> list[np.ndarray]:
+        """Compute the Sx spectra of data sharing the same fft and number of samples.
+
+        The audio data that streams fewer samples than its shape (e.g. if
+        a file is truncated) is batched with the data of the same streamed
+        length, so that its STFT covers the same samples as in ``get_value()``.
+        """
+        audio_values = [sd._get_audio_channel_value() for sd in batch]  # noqa: SLF001
+
+        lengths: dict[int, list[int]] = {}
+        for index, audio_value in enumerate(audio_values):
+            lengths.setdefault(len(audio_value), []).append(index)
+
+        sxs: list[np.ndarray | None] = [None] * len(batch)
+        for indexes in lengths.values():
+            stfts = stft_batch(
+                fft=batch[0].fft,
+                x=np.stack([audio_values[index] for index in indexes]),
+                workers=workers,
+            )
+            for index, stft in zip(indexes, stfts, strict=True):
+                sxs[index] = batch[index]._sx_from_stft(stft)  # noqa: SLF001
+        return sxs
+
+    @staticmethod
+    def _save_spectrogram(
+        sd: SpectroData,
+        folder: Path,
+        scale: Scale | None = None,
+    ) -> None:
         """Save the spectrogram data."""
-        sd.save_spectrogram(folder=folder, scale=self.scale)
+        sd.save_spectrogram(folder=folder, scale=scale)
 
     def save_spectrogram(
         self,
@@ -150,14 +271,15 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
         last = len(self.data) if last is None else last
         self._check_duplicate_data_names(first_idx=first, last_idx=last)
         multiprocess(
-            self._save_spectrogram,
+            type(self)._save_spectrogram,
             self.data[first:last],
             bypass_multiprocessing=type(self)._bypass_multiprocessing_on_dataset,
             folder=folder,
+            scale=self.scale,
         )
 
+    @staticmethod
     def _get_welch(
-        self,
         sd: SpectroData,
         nperseg: int | None = None,
         detrend: str | callable | False = "constant",
@@ -165,9 +287,9 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
         average: Literal["mean", "median"] = "mean",
         *,
         return_onesided: bool = True,
-    ) -> tuple[SpectroData, np.ndarray]:
+    ) -> np.ndarray:
         """Get the welch value of each ``SpectroData``."""
-        return sd, sd.get_welch(
+        return sd.get_welch(
             nperseg=nperseg,
             detrend=detrend,
             return_onesided=return_onesided,
@@ -225,18 +347,20 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
             If True, return a one-sided spectrum for real data. If False return a two-sided spectrum. Defaults to True, but for complex data, a two-sided spectrum is always returned.
 
         """
-        output = {}
-        for data, welch in multiprocess(
-            self._get_welch,
-            self.data[first:last],
+        data = self.data[first:last]
+        welches = multiprocess_stacked(
+            type(self)._get_welch,
+            data,
             bypass_multiprocessing=type(self)._bypass_multiprocessing_on_dataset,
             nperseg=nperseg,
             detrend=detrend,
             return_onesided=return_onesided,
             scaling=scaling,
             average=average,
-        ):
-            timestamp = f"{data.begin!s}_{data.end!s}"
+        )
+        output = {}
+        for sd, welch in zip(data, welches, strict=True):
+            timestamp = f"{sd.begin!s}_{sd.end!s}"
             output[timestamp] = welch
         return DataFrame(output)
 
@@ -320,18 +444,19 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
             freq=self.fft.f,
         )
 
+    @staticmethod
     def _save_all_(
-        self,
         data: SpectroData,
         spectrum_folder: Path,
         spectrogram_folder: Path,
+        scale: Scale | None = None,
         *,
         link: bool,
     ) -> SpectroData:
         """Save the data spectrum and spectrogram to disk."""
         sx = data.get_value()
         data.write(folder=spectrum_folder, sx=sx, link=link)
-        data.save_spectrogram(folder=spectrogram_folder, sx=sx, scale=self.scale)
+        data.save_spectrogram(folder=spectrogram_folder, sx=sx, scale=scale)
         return data
 
     def save_all(
@@ -364,14 +489,77 @@ class SpectroDataset(BaseDataset[SpectroData, SpectroFile]):
         last = len(self.data) if last is None else last
         self._check_duplicate_data_names(first_idx=first, last_idx=last)
         self.data[first:last] = multiprocess(
-            func=self._save_all_,
+            func=type(self)._save_all_,
             enumerable=self.data[first:last],
             bypass_multiprocessing=type(self)._bypass_multiprocessing_on_dataset,
             spectrum_folder=spectrum_folder,
             spectrogram_folder=spectrogram_folder,
+            scale=self.scale,
             link=link,
         )
 
+    @staticmethod
+    def _save_all_channels_(
+        data: SpectroData,
+        spectrum_folder: Path,
+        spectrogram_folder: Path,
+        channels: list[int] | None = None,
+        scale: Scale | None = None,
+    ) -> None:
+        """Save the spectra and spectrograms of several channels of the data."""
+        channels = data.audio_data.channels if channels is None else channels
+        sxs = data.get_channel_values(channels=channels)
+        for channel, sx in zip(channels, sxs, strict=True):
+            channel_data = data.channel_data(channel)
+            channel_data.write(folder=spectrum_folder, sx=sx)
+            channel_data.save_spectrogram(
+                folder=spectrogram_folder,
+                sx=sx,
+                scale=scale,
+            )
+
+    def save_all_channels(
+        self,
+        spectrum_folder: Path,
+        spectrogram_folder: Path,
+        channels: list[int] | None = None,
+        first: int = 0,
+        last: int | None = None,
+    ) -> None:
+        """Export the Sx matrices and spectrograms of several channels for each data.
+
+        The audio of each data is read only once for all channels:
+        the STFTs of all channels are computed on the same audio chunks.
+        The files of each channel are named after the data and the channel,
+        e.g. ``<data>_ch<channel>.npz``.
+
+        Parameters
+        ----------
+        spectrum_folder: Path
+            Path to the folder in which the Sx matrices ``npz`` files will be saved.
+        spectrogram_folder: Path
+            Path to the folder in which the spectrograms ``png`` files will be saved.
+        channels: list[int] | None
+            Channels of the audio **files** to export.
+            Defaulted to all the channels of the ``AudioData`` of each data.
+        first: int
+            Index of the first ``SpectroData`` object to export.
+        last: int|None
+            Index after the last ``SpectroData`` object to export.
+
+        """
+        last = len(self.data) if last is None else last
+        self._check_duplicate_data_names(first_idx=first, last_idx=last)
+        multiprocess(
+            func=type(self)._save_all_channels_,
+            enumerable=self.data[first:last],
+            bypass_multiprocessing=type(self)._bypass_multiprocessing_on_dataset,
+            spectrum_folder=spectrum_folder,
+            spectrogram_folder=spectrogram_folder,
+            channels=channels,
+            scale=self.scale,
+        )
+
     def link_audio_dataset(
         self,
         audio_dataset: AudioDataset,
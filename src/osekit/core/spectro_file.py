@@ -2,12 +2,16 @@
 
 Spectro files are ``npz`` files with ``Time`` and ``Sxx`` arrays.
 Metadata (``time_resolution``) are stored as separate arrays.
+
+The ``Sxx`` values can be stored in full or single precision, or quantized
+in ``dB`` as unsigned integers with the ``scale`` and ``offset`` needed
+to read them back.
 """
 
 from __future__ import annotations
 
 import typing
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 from pandas import Timestamp
@@ -20,6 +24,9 @@ if TYPE_CHECKING:
 
     import pytz
 
+StoragePrecision = Literal["double", "single", "uint16", "uint8"]
+STORAGE_PRECISIONS = ("double", "single", "uint16", "uint8")
+
 
 class SpectroFile(BaseFile):
     """Spectro file associated with timestamps.
@@ -130,7 +137,77 @@ class SpectroFile(BaseFile):
             start_bin = np.searchsorted(time, start_seconds, side="left")
             stop_bin = np.searchsorted(time, stop_seconds, side="left")
 
-            return data["sx"][:, start_bin:stop_bin]
+            sx = data["sx"][:, start_bin:stop_bin]
+            if "sx_scale" in data:
+                sx = SpectroFile._dequantize(
+                    sx,
+                    scale=data["sx_scale"][0],
+                    offset=data["sx_offset"][0],
+                )
+            return sx
+
+    @staticmethod
+    def encode_sx(
+        sx: np.ndarray,
+        precision: StoragePrecision = "double",
+    ) -> dict[str, np.ndarray]:
+        """Encode the ``sx`` values in the arrays to store in a ``npz`` file.
+
+        Parameters
+        ----------
+        sx: np.ndarray
+            The ``sx`` values to store.
+        precision: StoragePrecision
+            Precision in which the values are stored:
+
+            ``"double"``: The values are stored as is.
+
+            ``"single"``: The values are stored as ``complex64`` or ``float32``.
+
+            ``"uint16"``, ``"uint8"``: The power values are stored in ``dB``,
+            quantized on ``2**16`` or ``2**8`` levels evenly spread between
+            the lowest and highest non-zero values.
+            ``0`` values are kept as ``0``.
+            Complex values can't be quantized: their absolute square
+            should be stored instead.
+
+        Returns
+        -------
+        dict[str, np.ndarray]:
+            The ``"sx"`` array to store, plus the ``"sx_scale"`` and ``"sx_offset"``
+            arrays needed to read the quantized values back.
+
+        """
+        if precision not in STORAGE_PRECISIONS:
+            msg = (
+                f"Unknown storage precision: {precision}. "
+                f"Should be one of {STORAGE_PRECISIONS}."
+            )
+            raise ValueError(msg)
+        if precision == "double":
+            return {"sx": sx}
+        if precision == "single":
+            return {
+                "sx": sx.astype(np.complex64 if np.iscomplexobj(sx) else np.float32),
+            }
+        if np.iscomplexobj(sx):
+            msg = "Complex sx values can't be quantized."
+            raise TypeError(msg)
+
+        dtype = np.dtype(precision)
+        positive = sx > 0
+        db = 10 * np.log10(sx[positive])
+        low, high = (db.min(), db.max()) if db.size else (0.0, 0.0)
+        # The 0 level is kept for the 0 values.
+        scale = (high - low) / (np.iinfo(dtype).max - 1) or 1.0
+        quantized = np.zeros(sx.shape, dtype=dtype)
+        quantized[positive] = np.round((db - low) / scale) + 1
+        return {"sx": quantized, "sx_scale": [scale], "sx_offset": [low - scale]}
+
+    @staticmethod
+    def _dequantize(sx: np.ndarray, scale: float, offset: float) -> np.ndarray:
+        """Return the power values of ``dB``-quantized ``sx`` values."""
+        return np.where(sx > 0, 10 ** ((sx * scale + offset) / 10), 0.0)
 
     def get_fft(self) -> ShortTimeFFT:
         """Return the ``ShortTimeFFT`` used for computing the spectrogram.
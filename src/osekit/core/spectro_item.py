@@ -51,7 +51,9 @@ class SpectroItem(BaseItem[SpectroFile]):
     ) -> np.ndarray:
         """Get the values from the File between the ``begin`` and ``stop`` timestamps.
 
-        If the Item is empty, return a single ``0.``.
+        If the Item is empty, return a read-only matrix of ``0.`` that spans the
+        duration of the item, broadcast from a single value so that no memory
+        is allocated for it.
         """
         if not self.is_empty:
             sx = self.file.read(start=self.begin, stop=self.end)
@@ -68,10 +70,10 @@ class SpectroItem(BaseItem[SpectroFile]):
 
             return sx
 
-        return np.zeros(
+        return np.broadcast_to(
+            np.zeros(1, dtype=sx_dtype),
             (
                 fft.f.shape[0],
                 fft.p_num(int(self.duration.total_seconds() * fft.fs)),
             ),
-            dtype=sx_dtype,
         )
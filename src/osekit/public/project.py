@@ -141,12 +141,22 @@ class Project:
 
     def build(
         self,
+        *,
+        metadata_index: bool = False,
     ) -> None:
         """Build the ``Project``.
 
         Building a ``Project`` moves the original audio files to a specific folder
         and creates serialized ``json`` files used by APLOSE.
 
+        Parameters
+        ----------
+        metadata_index: bool
+            If ``True``, the header metadata of the original audio files are
+            stored in a ``MetadataIndex`` file (moved to the ``other`` folder with
+            the other non-audio files), so that rebuilding the project after a
+            reset doesn't require reopening all audio files.
+
         """
         self._create_logger()
 
@@ -161,6 +171,7 @@ class Project:
             timezone=self.timezone,
             name="original",
             instrument=self.instrument,
+            metadata_index=metadata_index,
         )
 
         self.outputs[ads.name] = {
@@ -384,6 +395,8 @@ class Project:
                 nb_time_bins=transform.nb_ltas_time_bins,
             )
 
+        sds.storage_precision = transform.storage_precision
+
         return sds
 
     def run(
@@ -3,6 +3,7 @@ from __future__ import annotations
 from enum import Flag, auto
 from typing import TYPE_CHECKING, Literal
 
+from osekit.core.spectro_file import STORAGE_PRECISIONS
 from osekit.utils.audio import Butterworth, Normalization
 
 if TYPE_CHECKING:
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
     from scipy.signal import ShortTimeFFT
 
     from osekit.core.frequency_scale import Scale
+    from osekit.core.spectro_file import StoragePrecision
 
 
 class OutputType(Flag):
@@ -81,6 +83,7 @@ class Transform:
         colormap: str | None = None,
         scale: Scale | None = None,
         nb_ltas_time_bins: int | None = None,
+        storage_precision: StoragePrecision = "double",
     ) -> None:
         """Initialize an ``Transform`` object.
 
@@ -146,6 +149,12 @@ class Transform:
             If ``None``, the spectrogram will be computed regularly.
             If specified, the spectrogram will be computed as LTAS, with the value
             representing the maximum number of averaged time bins.
+        storage_precision: StoragePrecision
+            Precision in which the spectra are written in the ``npz`` files:
+            ``"double"``, ``"single"``, or quantized in ``dB`` as ``"uint16"``
+            or ``"uint8"``.
+            See ``SpectroData.storage_precision`` for more info.
+            Has no effect if ``Transform.SPECTRUM`` is not in transform.
 
         """
         self._validate_sample_rate(sample_rate=sample_rate, fft=fft)
@@ -167,6 +176,14 @@ class Transform:
         self.scale = scale
         self.nb_ltas_time_bins = nb_ltas_time_bins
 
+        if storage_precision not in STORAGE_PRECISIONS:
+            msg = (
+                f"Unknown storage precision: {storage_precision}. "
+                f"Should be one of {STORAGE_PRECISIONS}."
+            )
+            raise ValueError(msg)
+        self.storage_precision = storage_precision
+
         if self.is_spectro and fft is None:
             msg = "FFT parameter should be given if spectra outputs are selected."
             raise ValueError(msg)
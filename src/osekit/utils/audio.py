@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import dataclasses
 import enum
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Literal, Self
 
 import numpy as np
+import scipy.fft
 import soxr
+from numpy.lib.stride_tricks import sliding_window_view
 from pandas import Timedelta
 from scipy import signal
 
@@ -158,6 +162,73 @@ def normalize_zscore(
     return (values - mean) / std
 
 
+class RunningStatistics:
+    """Per-channel mean, standard deviation and extrema of chunked data.
+
+    The statistics are updated chunk by chunk with the parallel variant of
+    Welford's algorithm, so that they can be computed over streamed audio data
+    with a memory footprint bounded by the size of the chunks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty running statistics."""
+        self.count = 0
+        self._mean: np.ndarray | None = None
+        self._m2: np.ndarray | None = None
+        self._peak: np.ndarray | None = None
+        self._minimum: np.ndarray | None = None
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Update the statistics with a chunk of data.
+
+        Parameters
+        ----------
+        chunk: np.ndarray
+            A (``frames``*``channels``) array of data.
+
+        """
+        if len(chunk) == 0:
+            return
+        chunk_count = len(chunk)
+        chunk_mean = chunk.mean(axis=0, dtype=np.float64)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+        chunk_peak = chunk.max(axis=0)
+        chunk_minimum = chunk.min(axis=0)
+
+        if self.count == 0:
+            self.count, self._mean, self._m2 = chunk_count, chunk_mean, chunk_m2
+            self._peak, self._minimum = chunk_peak, chunk_minimum
+            return
+
+        count = self.count + chunk_count
+        delta = chunk_mean - self._mean
+        self._mean = self._mean + delta * chunk_count / count
+        self._m2 = self._m2 + chunk_m2 + delta**2 * self.count * chunk_count / count
+        self._peak = np.maximum(self._peak, chunk_peak)
+        self._minimum = np.minimum(self._minimum, chunk_minimum)
+        self.count = count
+
+    @property
+    def mean(self) -> np.ndarray | None:
+        """Per-channel mean of the data, ``None`` if no data has been seen."""
+        return self._mean
+
+    @property
+    def std(self) -> np.ndarray | None:
+        """Per-channel standard deviation of the data, ``None`` if no data has been seen."""
+        return None if self.count == 0 else np.sqrt(self._m2 / self.count)
+
+    @property
+    def peak(self) -> np.ndarray | None:
+        """Per-channel maximum of the data, ``None`` if no data has been seen."""
+        return self._peak
+
+    @property
+    def minimum(self) -> np.ndarray | None:
+        """Per-channel minimum of the data, ``None`` if no data has been seen."""
+        return self._minimum
+
+
 class NormalizationValider(enum.EnumMeta):
     """Metaclass used for validating the normalization flag.
 
@@ -208,7 +279,18 @@ def normalize(
     peak: float | list[float] | None = None,
     std: float | list[float] | None = None,
 ) -> np.ndarray:
-    """Normalize the audio data."""
+    """Normalize the audio data.
+
+    Floating values keep their type: the normalization values are cast to it.
+    Integer values are normalized in ``float64``.
+    """
+    if normalization == Normalization.RAW:
+        return values
+    if np.issubdtype(values.dtype, np.floating):
+        mean, peak, std = (
+            None if value is None else np.asarray(value, dtype=values.dtype)
+            for value in (mean, peak, std)
+        )
     if Normalization.DC_REJECT in normalization:
         values = normalize_dc_reject(values=values, dc_component=mean)
     if Normalization.PEAK in normalization:
@@ -218,6 +300,159 @@ def normalize(
     return values
 
 
+def stft_stream(
+    fft: signal.ShortTimeFFT,
+    chunks: Iterable[np.ndarray],
+) -> Generator[np.ndarray, None, None]:
+    """Compute the STFT of a signal streamed in chunks.
+
+    The last ``fft.m_num`` samples are carried from one chunk to the next,
+    so that each time slice is computed as soon as all its samples are
+    streamed.
+    The concatenated blocks are identical to
+    ``fft.stft(x=np.concatenate(chunks).T, padding="zeros")``.
+
+    Multichannel signals are streamed as (``frames``*``channels``) chunks:
+    the STFTs of all channels are computed from the same chunks.
+
+    Parameters
+    ----------
+    fft: signal.ShortTimeFFT
+        The short-time Fourier transform to compute.
+    chunks: Iterable[np.ndarray]
+        Consecutive (``frames``) or (``frames``*``channels``) chunks
+        of the input signal.
+
+    Returns
+    -------
+    Generator[np.ndarray, None, None]
+        Consecutive blocks of time slices of the STFT, of shape
+        (``frequencies``*``time slices``) for 1D chunks, or
+        (``channels``*``frequencies``*``time slices``) for multichannel chunks.
+
+    """
+    # The buffer starts at the sample buffer_slice * hop of the signal,
+    # so that the slices of the buffer are the slices of the signal shifted
+    # by buffer_slice. The first slice of the signal can start before t=0.
+    buffer = None
+    buffer_slice = 0
+    next_slice = fft.p_min
+
+    def compute_slices(last_slice: int) -> np.ndarray:
+        nonlocal buffer, buffer_slice, next_slice
+        sx = fft.stft(
+            x=buffer.T,
+            p0=next_slice - buffer_slice,
+            p1=last_slice - buffer_slice,
+            padding="zeros",
+        )
+        next_slice = last_slice
+        # At least m_num samples are kept, which are needed by the last slices
+        first_sample = min(
+            next_slice * fft.hop - fft.m_num_mid,
+            buffer_slice * fft.hop + len(buffer) - fft.m_num,
+        )
+        first_sample = max(0, first_sample - first_sample % fft.hop)
+        buffer = buffer[first_sample - buffer_slice * fft.hop :]
+        buffer_slice = first_sample // fft.hop
+        return sx
+
+    for chunk in chunks:
+        buffer = chunk if buffer is None else np.concatenate((buffer, chunk))
+        buffer_end = buffer_slice * fft.hop + len(buffer)
+        # Slices of which all samples have been streamed
+        last_slice = (buffer_end + fft.m_num_mid - fft.m_num) // fft.hop + 1
+        if last_slice > next_slice and len(buffer) >= fft.m_num - fft.m_num_mid:
+            yield compute_slices(last_slice)
+
+    if buffer is None or (buffer_end := buffer_slice * fft.hop + len(buffer)) == 0:
+        return
+    # The last slices are padded with zeros after the end of the signal
+    last_slice = fft.p_max(buffer_end)
+    if last_slice > next_slice:
+        yield compute_slices(last_slice)
+
+
+def stft_batch(
+    fft: signal.ShortTimeFFT,
+    x: np.ndarray,
+    workers: int | None = None,
+) -> np.ndarray:
+    """Compute the STFT of a batch of signals of equal length at once.
+
+    ``ShortTimeFFT.stft`` runs one FFT per time slice.
+    Here, the windowed time slices of all signals are framed in a single
+    array and transformed in a single FFT call, which removes the per-slice
+    overhead on large batches.
+    The result matches the stacked ``fft.stft(x=s, padding="zeros")`` of each
+    signal ``s`` of the batch up to floating-point rounding errors, since the
+    FFT of a batch of slices might not sum the terms in the same order.
+
+    Parameters
+    ----------
+    fft: signal.ShortTimeFFT
+        The short-time Fourier transform to compute.
+    x: np.ndarray
+        The ``(signals * samples)`` batch of signals.
+    workers: int | None
+        Maximum number of workers used by ``scipy.fft``.
+        If ``None``, the current ``scipy.fft`` default is used.
+
+    Returns
+    -------
+    np.ndarray
+        The ``(signals * frequencies * time slices)`` STFT of the signals.
+
+    """
+    nb_samples = x.shape[-1]
+    first_slice, last_slice = fft.p_range(nb_samples)
+    first_sample = first_slice * fft.hop - fft.m_num_mid
+    last_sample = (last_slice - 1) * fft.hop - fft.m_num_mid + fft.m_num
+    padded = np.pad(
+        x,
+        [(0, 0), (-first_sample, max(last_sample - nb_samples, 0))],
+    )
+    frames = sliding_window_view(padded, fft.m_num, axis=-1)[:, :: fft.hop]
+    frames = frames[:, : last_slice - first_slice] * fft.win.conj()
+
+    workers_context = (
+        nullcontext() if workers is None else scipy.fft.set_workers(workers)
+    )
+    with workers_context:
+        sx = _fft_slices(fft=fft, slices=frames.reshape(-1, fft.m_num))
+
+    return np.moveaxis(sx.reshape(*frames.shape[:2], -1), -1, -2)
+
+
+def _fft_slices(fft: signal.ShortTimeFFT, slices: np.ndarray) -> np.ndarray:
+    """Compute the FFT of windowed time slices as ``ShortTimeFFT`` does.
+
+    The FFT follows the public ``fft_mode``, ``mfft``, ``scaling`` and
+    ``phase_shift`` parameters of the ``ShortTimeFFT``.
+    """
+    if fft.phase_shift is not None:
+        if slices.shape[-1] < fft.mfft:
+            slices = np.pad(slices, [(0, 0), (0, fft.mfft - slices.shape[-1])])
+        slices = np.roll(
+            slices,
+            -((fft.phase_shift + fft.m_num_mid) % fft.m_num),
+            axis=-1,
+        )
+
+    if fft.fft_mode == "twosided":
+        return scipy.fft.fft(slices, n=fft.mfft, axis=-1)
+    if fft.fft_mode == "centered":
+        return scipy.fft.fftshift(scipy.fft.fft(slices, n=fft.mfft, axis=-1), axes=-1)
+
+    sx = scipy.fft.rfft(slices, n=fft.mfft, axis=-1)
+    if fft.fft_mode == "onesided2X":
+        # The unpaired bins (zero and, for even mfft, Nyquist) are not doubled.
+        sx[..., 1 : -1 if fft.mfft % 2 == 0 else None] *= (
+            np.sqrt(2) if fft.scaling == "psd" else 2
+        )
+    return sx
+
+
 @dataclasses.dataclass
 class Butterworth:
     """Class that represent a Butterworth sos filter.
@@ -300,17 +535,94 @@ class Butterworth:
         Returns
         -------
         np.typing.NDArray
-            Filtered signal
+            Filtered signal.
+            ``float32`` signals are filtered in single precision, other signals
+            are filtered in ``float64``.
 
         """
-        sos = signal.butter(
+        sos = self.sos(fs=fs, dtype=sig.dtype)
+        return signal.sosfilt(sos=sos, x=sig, axis=0)
+
+    def filter_stream(
+        self,
+        chunks: Iterable[np.typing.NDArray],
+        fs: float,
+    ) -> Generator[np.typing.NDArray, None, None]:
+        """Filter a signal streamed in chunks with the Butterworth sos filter.
+
+        The state of the filter is carried from one chunk to the next, so that
+        the filtered chunks are the same as the chunks of the signal
+        filtered at once with ``Butterworth.filter()``.
+
+        Parameters
+        ----------
+        chunks: Iterable[np.typing.NDArray]
+            Consecutive (``frames``*``channels``) chunks of the input signal.
+        fs: float
+            Sampling frequency of the signal
+
+        Returns
+        -------
+        Generator[np.typing.NDArray, None, None]
+            Filtered chunks.
+
+        """
+        sos, zi = None, None
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            if sos is None:
+                sos = self.sos(fs=fs, dtype=chunk.dtype)
+                zi = np.zeros(
+                    (sos.shape[0], 2, *chunk.shape[1:]),
+                    dtype=np.result_type(sos, chunk),
+                )
+            filtered, zi = signal.sosfilt(sos=sos, x=chunk, axis=0, zi=zi)
+            yield filtered
+
+    def sos(self, fs: float, dtype: np.typing.DTypeLike = np.float64) -> np.ndarray:
+        """Return the second-order sections of the filter.
+
+        The design is cached per ``(N, Wn, btype, fs)``.
+
+        Parameters
+        ----------
+        fs: float
+            Sampling frequency of the signal
+        dtype: np.typing.DTypeLike
+            Type of the filtered signal.
+            ``float32`` signals are filtered with single precision sections,
+            other signals with ``float64`` sections.
+
+        Returns
+        -------
+        np.ndarray
+            The second-order sections of the filter.
+
+        """
+        wn = tuple(self.Wn) if isinstance(self.Wn, Iterable) else self.Wn
+        return _butter_sos(
             N=self.N,
-            Wn=self.Wn,
+            Wn=wn,
             btype=self.btype,
             fs=fs,
-            output="sos",
-        )
-        return signal.sosfilt(sos=sos, x=sig, axis=0)
+            single_precision=np.dtype(dtype) == np.float32,
+        ).copy()
 
     def __hash__(self) -> int:
         return hash((self.N, self.Wn, self.btype))
+
+
+@lru_cache(maxsize=64)
+def _butter_sos(
+    N: int,  # noqa: N803
+    Wn: tuple[float, ...] | float,  # noqa: N803
+    btype: str,
+    fs: float,
+    *,
+    single_precision: bool,
+) -> np.ndarray:
+    sos = signal.butter(N=N, Wn=Wn, btype=btype, fs=fs, output="sos")
+    if single_precision:
+        sos = sos.astype(np.float32)
+    return sos
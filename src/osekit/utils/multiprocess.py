@@ -1,25 +1,281 @@
 """Multiprocessing module that helps running functions on collections using multiple threads."""
 
+from __future__ import annotations
+
 import multiprocessing as mp
 import os
+import secrets
+import tempfile
+from dataclasses import dataclass
 from functools import partial
-from typing import Any
+from math import ceil
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from tqdm import tqdm
 
 from osekit import config
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+EXECUTORS = ("serial", "threads", "processes")
+TRANSPORTS = ("pickle", "shared_memory")
+
+# Arrays smaller than this number of bytes are pickled whatever the transport:
+# creating a shared memory block has a fixed cost, which is only paid off from
+# about 64 kB per array.
+SHARED_MEMORY_MIN_BYTES = 1 << 16
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Lightweight handle of a ``np.ndarray`` stored in a shared memory block.
+
+    Only the handle is pickled when it is sent to or from a worker process.
+    The shared memory block is released when the array is restored:
+    each handle should be restored exactly once.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def from_array(
+        cls,
+        array: np.ndarray,
+        names: list[str] | _SharedMemoryRegistry | None = None,
+    ) -> SharedArray:
+        """Copy an array in a new shared memory block.
+
+        Parameters
+        ----------
+        array: np.ndarray
+            The array to share.
+        names: list[str] | _SharedMemoryRegistry | None
+            If provided, the name of the block is appended to ``names``
+            before the block is created, so that the block can be released
+            even if the array is never restored.
+
+        Returns
+        -------
+        SharedArray:
+            The handle of the shared array.
+
+        """
+        name = f"psm_{secrets.token_hex(8)}"
+        if names is not None:
+            names.append(name)
+        shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=max(array.nbytes, 1),
+        )
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        handle = cls(name=shm.name, shape=array.shape, dtype=array.dtype.str)
+        shm.close()
+        # The block is released by the process that restores the array, which
+        # might not share the resource tracker of this process.
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001
+        return handle
+
+    def to_array(self) -> np.ndarray:
+        """Copy the shared array out of its block, and release the block.
+
+        Returns
+        -------
+        np.ndarray:
+            The shared array.
+
+        """
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            return np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def share_arrays(
+    value: Any,
+    names: list[str] | _SharedMemoryRegistry | None = None,
+) -> Any:
+    """Replace the large arrays of a value with ``SharedArray`` handles.
+
+    Arrays are looked for in the value itself and in nested tuples,
+    lists and dicts.
+
+    Parameters
+    ----------
+    value: Any
+        The value which arrays should be shared.
+    names: list[str] | _SharedMemoryRegistry | None
+        If provided, the names of the created shared memory blocks are
+        appended to ``names``.
+
+    Returns
+    -------
+    Any:
+        The value in which the arrays of at least ``SHARED_MEMORY_MIN_BYTES``
+        bytes are replaced by their handles.
+
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject or value.nbytes < SHARED_MEMORY_MIN_BYTES:
+            return value
+        return SharedArray.from_array(value, names=names)
+    if isinstance(value, tuple):
+        return tuple(share_arrays(v, names=names) for v in value)
+    if isinstance(value, list):
+        return [share_arrays(v, names=names) for v in value]
+    if isinstance(value, dict):
+        return {k: share_arrays(v, names=names) for k, v in value.items()}
+    return value
+
+
+def restore_arrays(value: Any) -> Any:
+    """Replace the ``SharedArray`` handles of a value with the arrays they share.
+
+    This is the inverse of ``share_arrays``.
+
+    Parameters
+    ----------
+    value: Any
+        The value which arrays should be restored.
+
+    Returns
+    -------
+    Any:
+        The value in which the handles are replaced by the shared arrays.
+
+    """
+    if isinstance(value, SharedArray):
+        return value.to_array()
+    if isinstance(value, tuple):
+        return tuple(restore_arrays(v) for v in value)
+    if isinstance(value, list):
+        return [restore_arrays(v) for v in value]
+    if isinstance(value, dict):
+        return {k: restore_arrays(v) for k, v in value.items()}
+    return value
+
+
+def _call_with_shared_arrays(
+    element: Any,
+    func: callable,
+    names: _SharedMemoryRegistry,
+) -> Any:
+    return share_arrays(func(restore_arrays(element)), names=names)
+
+
+def _stack_results(elements: list, task: callable) -> np.ndarray:
+    return np.stack([task(element) for element in elements])
+
+
+@dataclass(frozen=True)
+class _SharedMemoryRegistry:
+    """Names of shared memory blocks, recorded in a file by any process.
+
+    The file is only created when the first name is recorded.
+    """
+
+    path: Path
+
+    @classmethod
+    def new(cls) -> _SharedMemoryRegistry:
+        return cls(
+            path=Path(tempfile.gettempdir()) / f"osekit_shm_{secrets.token_hex(8)}",
+        )
+
+    def append(self, name: str) -> None:
+        with self.path.open("a") as file:
+            file.write(f"{name}\n")
+
+    def release(self) -> None:
+        """Release the recorded blocks that were not restored."""
+        if not self.path.exists():
+            return
+        _unlink_shared_memory(self.path.read_text().split())
+        self.path.unlink()
+
+
+def _unlink_shared_memory(names: list[str]) -> None:
+    """Release the shared memory blocks that were not restored."""
+    for name in names:
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+# Function run on each element by the worker processes, set by the pool initializer.
+_task: callable | None = None
+
+
+def _initialize_worker(task: callable) -> None:
+    global _task  # noqa: PLW0603
+    _task = task
+
+
+def _run_task(element: Any) -> Any:
+    return _task(element)
+
+
+def _chunksize(nb_elements: int, chunksize: int | None = None) -> int:
+    if chunksize is not None:
+        return chunksize
+    chunksize = config.multiprocessing["chunksize"]
+    if chunksize is not None:
+        return chunksize
+    nb_processes = config.multiprocessing["nb_processes"] or os.cpu_count() or 1
+    # Same heuristic as multiprocessing.Pool.map
+    return max(1, ceil(nb_elements / (4 * nb_processes)))
+
 
 def multiprocess(
     func: callable,
     enumerable: list,
     *args: Any,
     bypass_multiprocessing: bool = False,
+    chunksize: int | None = None,
     **kwargs: Any,
 ) -> list[Any]:
     """Run a given callable function on an enumerable.
 
-    The function is run through ``osekit.config.nb_processes`` threads.
+    The function is run by ``osekit.config.multiprocessing["nb_processes"]``
+    workers of the ``osekit.config.multiprocessing["executor"]``:
+
+    ``"serial"``: The function is run in the calling thread.
+
+    ``"threads"``: The function is run by a pool of threads.
+    Reading, resampling, filtering and computing FFTs release the GIL, and
+    threads don't have to copy the inputs and outputs of the function.
+
+    ``"processes"``: The function is run by a pool of processes.
+
+    The elements are sent to the workers by chunks of ``chunksize`` elements,
+    which defaults to ``osekit.config.multiprocessing["chunksize"]``,
+    or in about 4 chunks per worker if it is ``None``.
+    The function and the additional arguments are sent once to each worker
+    process when the pool starts: only the elements of the enumerable are
+    sent with the tasks.
+
+    The inputs and outputs of the function are sent to and from the worker
+    processes according to ``osekit.config.multiprocessing["transport"]``:
+
+    ``"pickle"``: Everything is pickled through the pipes of the pool.
+
+    ``"shared_memory"``: Large ``np.ndarray`` (even nested in tuples, lists
+    or dicts) are copied in shared memory blocks, and only their handles
+    are pickled.
+    The blocks that are not restored (e.g. if a task fails) are released
+    when the call returns.
 
     Parameters
     ----------
@@ -29,6 +285,9 @@ def multiprocess(
         The list of input to the function.
     bypass_multiprocessing: bool
         If ``True``, multiprocessing will be bypassed whatever the config value.
+    chunksize: int | None
+        Number of elements sent at once to a worker.
+        If ``None``, ``osekit.config.multiprocessing["chunksize"]`` is used.
     args:
         Additional positional arguments to pass to the function.
     kwargs:
@@ -40,7 +299,16 @@ def multiprocess(
         Returned values of the function.
 
     """
-    if bypass_multiprocessing or not config.multiprocessing["is_active"]:
+    executor = config.multiprocessing["executor"]
+    if executor not in EXECUTORS:
+        msg = f"Unknown executor: {executor}. Should be one of {EXECUTORS}."
+        raise ValueError(msg)
+
+    if (
+        bypass_multiprocessing
+        or not config.multiprocessing["is_active"]
+        or executor == "serial"
+    ):
         return [
             func(element, *args, **kwargs)
             for element in tqdm(
@@ -50,14 +318,119 @@ def multiprocess(
             )
         ]
 
-    partial_func = partial(func, *args, **kwargs)
+    transport = config.multiprocessing["transport"]
+    if transport not in TRANSPORTS:
+        msg = f"Unknown transport: {transport}. Should be one of {TRANSPORTS}."
+        raise ValueError(msg)
 
-    with mp.Pool(config.multiprocessing["nb_processes"]) as pool:
-        return list(
-            tqdm(
-                pool.imap(partial_func, enumerable),
-                total=len(list(enumerable)),
-                disable=os.getenv("DISABLE_TQDM", "False").lower()
-                in ("true", "1", "t"),
+    task = partial(func, *args, **kwargs)
+    nb_elements = len(list(enumerable))
+
+    if executor == "threads":
+        with ThreadPool(config.multiprocessing["nb_processes"]) as pool:
+            return list(
+                tqdm(
+                    pool.imap(
+                        task,
+                        enumerable,
+                        chunksize=_chunksize(nb_elements, chunksize),
+                    ),
+                    total=nb_elements,
+                    disable=os.getenv("DISABLE_TQDM", "False").lower()
+                    in ("true", "1", "t"),
+                ),
+            )
+
+    if transport == "pickle":
+        return _run_pool(
+            task=task,
+            elements=enumerable,
+            nb_elements=nb_elements,
+            chunksize=chunksize,
+        )
+
+    # The names of the blocks are recorded as they are created, so that the
+    # blocks that are never restored can be released.
+    registry = _SharedMemoryRegistry.new()
+    try:
+        return _run_pool(
+            task=partial(_call_with_shared_arrays, func=task, names=registry),
+            elements=(share_arrays(element, names=registry) for element in enumerable),
+            nb_elements=nb_elements,
+            chunksize=chunksize,
+            restore=True,
+        )
+    finally:
+        registry.release()
+
+
+def _run_pool(
+    task: callable,
+    elements: Iterable,
+    nb_elements: int,
+    chunksize: int | None = None,
+    *,
+    restore: bool = False,
+) -> list[Any]:
+    with mp.Pool(
+        config.multiprocessing["nb_processes"],
+        initializer=_initialize_worker,
+        initargs=(task,),
+    ) as pool:
+        results = tqdm(
+            pool.imap(
+                _run_task,
+                elements,
+                chunksize=_chunksize(nb_elements, chunksize),
             ),
+            total=nb_elements,
+            disable=os.getenv("DISABLE_TQDM", "False").lower() in ("true", "1", "t"),
         )
+        if restore:
+            results = map(restore_arrays, results)
+        return list(results)
+
+
+def multiprocess_stacked(
+    func: callable,
+    enumerable: list,
+    *args: Any,
+    bypass_multiprocessing: bool = False,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Run a callable function that returns arrays on an enumerable, and stack them.
+
+    The arrays returned for a chunk of elements are stacked by the worker
+    that computes them, so that a single array is sent back per chunk.
+    With the ``"shared_memory"`` transport, this array goes through a shared
+    memory block even if the array of each element is small
+    (e.g. the Welch spectra of a ``SpectroDataset``).
+
+    Parameters
+    ----------
+    func: callable
+        The function to run. It should return arrays of the same shape.
+    enumerable: list
+        The list of input to the function.
+    bypass_multiprocessing: bool
+        If ``True``, multiprocessing will be bypassed whatever the config value.
+    args:
+        Additional positional arguments to pass to the function.
+    kwargs:
+        Additional keyword arguments to pass to the function.
+
+    Returns
+    -------
+    np.ndarray:
+        Returned arrays of the function, stacked along a new first axis.
+
+    """
+    size = _chunksize(len(enumerable))
+    stacks = multiprocess(
+        _stack_results,
+        [enumerable[start : start + size] for start in range(0, len(enumerable), size)],
+        bypass_multiprocessing=bypass_multiprocessing,
+        chunksize=1,
+        task=partial(func, *args, **kwargs),
+    )
+    return np.concatenate(stacks) if stacks else np.empty(0)
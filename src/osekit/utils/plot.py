@@ -1,13 +1,32 @@
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
 
-def get_default_axes(nb_rows: int = 1, nb_cols: int = 1) -> plt.Axes | np.ndarray:
+def get_default_axes(
+    nb_rows: int = 1,
+    nb_cols: int = 1,
+    *,
+    pyplot: bool = True,
+) -> plt.Axes | np.ndarray:
     """Return a default-formatted ``Axes`` on a new figure.
 
     By default, OSEkit plots on wide, borderless figures.
     This method set the default figure and axes parameters.
 
+    Parameters
+    ----------
+    nb_rows: int
+        Number of rows of axes in the figure.
+    nb_cols: int
+        Number of columns of axes in the figure.
+    pyplot: bool
+        If ``True``, the figure is created through ``pyplot``, so that it can be
+        shown with ``plt.show()``.
+        If ``False``, the figure is not registered in the global ``pyplot``
+        figure manager, which is not thread-safe: it can be created and saved
+        from any thread, and is released once it is not referenced anymore.
+
     Returns
     -------
     plt.Axes | np.ndarray:
@@ -16,12 +35,17 @@ def get_default_axes(nb_rows: int = 1, nb_cols: int = 1) -> plt.Axes | np.ndarra
 
     """
     # Legacy OSEkit behaviour.
-    _, axs = plt.subplots(
-        nrows=nb_rows,
-        ncols=nb_cols,
-        figsize=(1813 / 100, 512 / 100),
-        dpi=100,
-    )
+    figsize, dpi = (1813 / 100, 512 / 100), 100
+    if pyplot:
+        figure, axs = plt.subplots(
+            nrows=nb_rows,
+            ncols=nb_cols,
+            figsize=figsize,
+            dpi=dpi,
+        )
+    else:
+        figure = Figure(figsize=figsize, dpi=dpi)
+        axs = figure.subplots(nrows=nb_rows, ncols=nb_cols)
 
     # Skim through both 1D and 2D ax arrays
     axs_array = axs if type(axs) is np.ndarray else [axs]
@@ -35,8 +59,8 @@ def get_default_axes(nb_rows: int = 1, nb_cols: int = 1) -> plt.Axes | np.ndarra
             ax.spines["left"].set_visible(False)
             ax.spines["bottom"].set_visible(False)
             ax.spines["top"].set_visible(False)
-    plt.axis("off")
-    plt.subplots_adjust(
+    figure.gca().axis("off")
+    figure.subplots_adjust(
         top=1,
         bottom=0,
         right=1,
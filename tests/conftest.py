@@ -184,9 +184,9 @@ def patch_afm_open(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
     opened_files = []
     open_func = SoundFileBackend._open
 
-    def mock_open(self: SoundFileBackend, path: Path) -> None:
-        opened_files.append(path)
-        open_func(self, path)
+    def mock_open(self: SoundFileBackend, path: Path) -> sf.SoundFile:
+        opened_files.append(Path(path))
+        return open_func(self, path)
 
     monkeypatch.setattr(SoundFileBackend, "_open", mock_open)
     return opened_files
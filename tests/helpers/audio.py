@@ -1,4 +1,5 @@
 import typing
+from collections.abc import Generator
 from pathlib import Path
 
 import numpy as np
@@ -36,18 +37,35 @@ class MockedAudioFile(AudioFile):
         )
         self.pointer = 0
 
-    def read(self, start: Timestamp, stop: Timestamp) -> np.ndarray:
+    def read(
+        self,
+        start: Timestamp,
+        stop: Timestamp,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         start_sample, stop_sample = self.frames_indexes(start, stop)
         pointer = self.pointer
         self.seek(start_sample)
-        vs = self.stream(chunk_size=stop_sample - start_sample)
+        vs = self.stream(
+            chunk_size=stop_sample - start_sample,
+            dtype=dtype,
+            channels=channels,
+        )
         self.pointer = pointer
         return vs
 
-    def stream(self, chunk_size: int) -> np.ndarray:
+    def stream(
+        self,
+        chunk_size: int,
+        dtype: np.typing.DTypeLike = np.float64,
+        channels: list[int] | None = None,
+    ) -> np.ndarray:
         values = self.mocked_value[self.pointer : self.pointer + chunk_size]
         self.pointer += chunk_size
-        return values
+        if channels is not None:
+            values = values[:, channels]
+        return values.astype(dtype, copy=False)
 
     def seek(self, frame: int) -> None:
         self.pointer = frame
@@ -82,5 +100,16 @@ class MockedAudioData(AudioData):
     def length(self) -> int:
         return len(self.mocked_value)
 
-    def get_raw_value(self) -> np.ndarray:
-        return self.mocked_value
+    def get_raw_value(self, out: np.ndarray | None = None) -> np.ndarray:
+        if out is None:
+            return self.mocked_value
+        out[:] = self.mocked_value
+        return out
+
+    def stream(
+        self,
+        chunk_size: int = 8192,
+        prefetch: int | None = None,
+    ) -> Generator[np.ndarray, None, None]:
+        for start in range(0, len(self.mocked_value), chunk_size):
+            yield self.mocked_value[start : start + chunk_size]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import importlib
+import itertools
 import logging
+import tracemalloc
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any, Literal
@@ -28,10 +30,12 @@ from osekit.core.audio_dataset import AudioDataset
 from osekit.core.audio_file import AudioFile
 from osekit.core.audio_item import AudioItem
 from osekit.core.instrument import Instrument
+from osekit.core.metadata_index import MetadataIndex
 from osekit.utils import audio
 from osekit.utils.audio import (
     Butterworth,
     Normalization,
+    RunningStatistics,
     generate_sample_audio,
     normalize,
 )
@@ -334,6 +338,30 @@ def test_multitchannel_audio_data() -> None:
     assert np.array_equal(ad.get_value(), np.array([[2, 3] for _ in range(10)]))
 
 
+@pytest.mark.parametrize(
+    "sample_rate",
+    [
+        pytest.param(1_000, id="original_sample_rate"),
+        pytest.param(500, id="downsampled"),
+        pytest.param(1_500, id="upsampled"),
+    ],
+)
+def test_multichannel_audio_data_channel_selection(
+    tmp_path: Path,
+    sample_rate: int,
+) -> None:
+    path = tmp_path / "multichannel.wav"
+    rng = np.random.default_rng(seed=0)
+    sf.write(path, rng.uniform(-1, 1, size=(1_000, 4)), samplerate=1_000)
+    af = AudioFile(path, begin=Timestamp("2000-01-01 00:00:00"))
+
+    all_channels = AudioData.from_files([af], sample_rate=sample_rate).get_value()
+    ad = AudioData.from_files([af], sample_rate=sample_rate, channels=[3, 1])
+
+    assert ad.get_value().shape == (sample_rate, 2)
+    assert np.allclose(ad.get_value(), all_channels[:, [3, 1]])
+
+
 @pytest.mark.parametrize(
     ("audio_files", "start", "stop", "expected"),
     [
@@ -1586,6 +1614,169 @@ def test_audio_dataset_from_folder_errors_warnings(
         assert all(f in caplog.text for f in corrupted_audio_files)
 
 
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 3,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            id="three_files",
+        ),
+    ],
+    indirect=True,
+)
+def test_audio_dataset_from_folder_metadata_index(
+    tmp_path: Path,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "corrupted.wav").open("a").close()
+    afs, _ = audio_files
+
+    ads = AudioDataset.from_folder(
+        tmp_path,
+        strptime_format=TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+        mode="files",
+    )
+    assert not (tmp_path / MetadataIndex.filename).exists()
+
+    indexed_ads = AudioDataset.from_folder(
+        tmp_path,
+        strptime_format=TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+        mode="files",
+        metadata_index=True,
+    )
+    assert indexed_ads == ads
+    assert len(MetadataIndex(tmp_path)) == len(afs)
+
+    info = afm.info
+    opened_files = []
+
+    def count_info(path: Path) -> tuple[int, int, int]:
+        opened_files.append(Path(path).name)
+        return info(path)
+
+    monkeypatch.setattr(afm, "info", count_info)
+
+    assert (
+        AudioDataset.from_folder(
+            tmp_path,
+            strptime_format=TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+            mode="files",
+            metadata_index=True,
+        )
+        == ads
+    )
+    # Only the file that couldn't be indexed is opened again
+    assert opened_files == ["corrupted.wav"]
+
+    # Modified files are read again
+    opened_files.clear()
+    afm.close()
+    sf.write(afs[1].path, np.zeros(500), samplerate=1_000, subtype="DOUBLE")
+    ads = AudioDataset.from_folder(
+        tmp_path,
+        strptime_format=TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+        mode="files",
+        metadata_index=True,
+    )
+    assert sorted(opened_files) == sorted([afs[1].path.name, "corrupted.wav"])
+    assert ads.data[1].duration == Timedelta(seconds=0.5)
+
+    # Removed files are pruned from the index
+    afs[2].path.unlink()
+    AudioDataset.from_folder(
+        tmp_path,
+        strptime_format=TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+        mode="files",
+        metadata_index=True,
+    )
+    assert len(MetadataIndex(tmp_path)) == len(afs) - 1
+
+
+@pytest.mark.parametrize(
+    ("audio_files", "strptime_format", "scan_workers", "metadata_index"),
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 10,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+            4,
+            False,
+            id="timestamped_files",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 10,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            None,
+            4,
+            False,
+            id="non_timestamped_files",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 10,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            TIMESTAMP_FORMAT_EXPORTED_FILES_UNLOCALIZED,
+            3,
+            True,
+            id="with_metadata_index",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_audio_dataset_from_folder_scan_workers(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    strptime_format: str | None,
+    scan_workers: int,
+    metadata_index: bool,
+) -> None:
+    for corrupted_file in ("corrupted_1.wav", "corrupted_2.flac"):
+        (tmp_path / corrupted_file).open("a").close()
+    (tmp_path / "notes.txt").touch()
+
+    with caplog.at_level(logging.WARNING):
+        ads = AudioDataset.from_folder(
+            tmp_path,
+            strptime_format=strptime_format,
+            mode="files",
+        )
+    sequential_warnings = caplog.text
+    caplog.clear()
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(2):
+            assert (
+                AudioDataset.from_folder(
+                    tmp_path,
+                    strptime_format=strptime_format,
+                    mode="files",
+                    scan_workers=scan_workers,
+                    metadata_index=metadata_index,
+                )
+                == ads
+            )
+    assert sequential_warnings
+    assert caplog.text.count("corrupted_1.wav\n\tcorrupted_2.flac") == 2
+
+
 def test_audio_dataset_instrument() -> None:
     ad = [
         MockedAudioData(
@@ -1723,6 +1914,98 @@ def test_write_files(
             assert str(next(iter(data.files)).path) == str(output_path / f"{data}.wav")
 
 
+@pytest.mark.parametrize(
+    ("audio_files", "normalization", "normalization_values", "butter"),
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            Normalization.RAW,
+            None,
+            None,
+            id="raw_data_is_streamed",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            Normalization.DC_REJECT | Normalization.PEAK,
+            {"mean": 0.1, "peak": 2.0, "std": None},
+            None,
+            id="known_normalization_values_are_streamed",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            Normalization.ZSCORE,
+            None,
+            None,
+            id="missing_normalization_values_are_streamed",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            Normalization.RAW,
+            None,
+            Butterworth(N=2, Wn=1_000, btype="highpass"),
+            id="filtered_data_is_streamed",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_write_audio_data_by_chunks(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    normalization: Normalization,
+    normalization_values: dict | None,
+    butter: Butterworth | None,
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(
+        files,
+        sample_rate=24_000,
+        normalization=normalization,
+        normalization_values=normalization_values,
+        butter=butter,
+    )
+    expected = ad.get_value()
+
+    written_chunks = []
+    sf_write = sf.SoundFile.write
+
+    def count_chunks(self: sf.SoundFile, data: np.ndarray) -> None:
+        written_chunks.append(len(data))
+        sf_write(self, data)
+
+    monkeypatch.setattr(sf.SoundFile, "write", count_chunks)
+    monkeypatch.setattr(AudioData, "get_value", lambda _: pytest.fail())
+
+    ad.write(tmp_path / "output", subtype="DOUBLE", chunk_size=5_000)
+
+    assert max(written_chunks) <= 5_000
+    assert sum(written_chunks) == len(expected)
+    assert np.allclose(
+        sf.read(tmp_path / "output" / f"{ad}.wav", always_2d=True)[0],
+        expected,
+    )
+
+
 @pytest.mark.parametrize(
     ("audio_files", "nb_subdata", "instrument", "normalization", "original_audio_data"),
     [
@@ -1891,6 +2174,84 @@ def test_split_data_normalization_pass() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("shape", "chunk_sizes"),
+    [
+        pytest.param((1_000, 1), [1_000], id="single_chunk"),
+        pytest.param((1_000, 1), [1] * 1_000, id="one_frame_chunks"),
+        pytest.param((1_000, 3), [10, 490, 7, 493], id="uneven_chunks"),
+        pytest.param((1_000, 2), [0, 500, 0, 500], id="empty_chunks"),
+    ],
+)
+def test_running_statistics(shape: tuple[int, int], chunk_sizes: list[int]) -> None:
+    rng = np.random.default_rng(seed=0)
+    data = rng.normal(loc=0.3, scale=2.0, size=shape)
+
+    statistics = RunningStatistics()
+    assert statistics.mean is None
+    assert statistics.std is None
+    assert statistics.peak is None
+
+    start = 0
+    for chunk_size in chunk_sizes:
+        statistics.update(data[start : start + chunk_size])
+        start += chunk_size
+
+    assert statistics.count == shape[0]
+    assert np.allclose(statistics.mean, data.mean(axis=0), rtol=1e-12)
+    assert np.allclose(statistics.std, data.std(axis=0), rtol=1e-12)
+    assert np.array_equal(statistics.peak, data.max(axis=0))
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            id="files_with_gap",
+        ),
+    ],
+    indirect=True,
+)
+def test_normalization_values_are_streamed_and_cached(
+    monkeypatch: pytest.MonkeyPatch,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files, sample_rate=24_000)
+    value = ad.get_value()
+
+    stream_calls = []
+    stream = AudioData.stream
+
+    def count_stream(self: AudioData, *args: Any, **kwargs: Any) -> Generator:
+        stream_calls.append(self)
+        return stream(self, *args, **kwargs)
+
+    monkeypatch.setattr(AudioData, "stream", count_stream)
+
+    normalization_values = ad.get_normalization_values()
+    assert np.allclose(normalization_values["mean"], value.mean(axis=0))
+    assert np.allclose(normalization_values["std"], value.std(axis=0))
+    assert np.array_equal(normalization_values["peak"], value.max(axis=0))
+    assert len(stream_calls) == 1
+
+    ad.normalization_values = None
+    ad.split(nb_subdata=2)
+    ad.normalization_values = None
+    ad.split_frames(start_frame=10, stop_frame=100)
+    assert stream_calls == [ad]
+
+    ad.sample_rate = 12_000
+    ad.get_normalization_values()
+    assert stream_calls == [ad, ad]
+
+
 def test_multichannel_data_normalization() -> None:
     ad = MockedAudioData(mocked_value=np.array([[1, 2] for _ in range(10)]))
 
@@ -2037,6 +2398,7 @@ def test_split_frames_errors() -> None:
                 "duration": 1,
                 "sample_rate": 48_000,
                 "nb_files": 1,
+                "format": "flac",
                 "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
             },
             id="move_one_audio_file",
@@ -2307,6 +2669,313 @@ def test_butter_audiodataset() -> None:
     assert ads.butter == butter2
 
 
+@pytest.mark.parametrize(
+    ("butter", "dtype", "chunk_sizes"),
+    [
+        pytest.param(
+            Butterworth(N=4, Wn=1_000, btype="lowpass"),
+            np.float64,
+            [10_000],
+            id="single_chunk",
+        ),
+        pytest.param(
+            Butterworth(N=4, Wn=1_000, btype="lowpass"),
+            np.float64,
+            [1, 999, 0, 3_000, 6_000],
+            id="uneven_chunks",
+        ),
+        pytest.param(
+            Butterworth(N=2, Wn=[1_000, 2_000], btype="bandpass"),
+            np.float64,
+            [2_500] * 4,
+            id="bandpass",
+        ),
+        pytest.param(
+            Butterworth(N=2, Wn=[1_000, 2_000], btype="bandpass"),
+            np.float32,
+            [2_500] * 4,
+            id="float32",
+        ),
+    ],
+)
+def test_butter_filter_stream(
+    butter: Butterworth,
+    dtype: type,
+    chunk_sizes: list[int],
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    sig = rng.uniform(-1, 1, size=(10_000, 2)).astype(dtype)
+    bounds = np.cumsum([0, *chunk_sizes])
+    chunks = [sig[start:stop] for start, stop in itertools.pairwise(bounds)]
+
+    filtered = np.vstack(list(butter.filter_stream(chunks=chunks, fs=48_000)))
+
+    assert filtered.dtype == dtype
+    assert np.array_equal(filtered, butter.filter(sig=sig, fs=48_000))
+
+
+def test_butter_sos_is_cached() -> None:
+    butter = Butterworth(N=3, Wn=[1_234, 2_345], btype="bandstop")
+    butter.sos(fs=44_100)
+    hits = audio._butter_sos.cache_info().hits
+
+    sos = Butterworth(N=3, Wn=[1_234, 2_345], btype="bandstop").sos(fs=44_100)
+
+    assert audio._butter_sos.cache_info().hits == hits + 1
+    assert np.array_equal(
+        sos,
+        signal.butter(
+            N=3, Wn=[1_234, 2_345], btype="bandstop", fs=44_100, output="sos"
+        ),
+    )
+    assert butter.sos(fs=44_100, dtype=np.float32).dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            id="files_with_gap",
+        ),
+    ],
+    indirect=True,
+)
+def test_filtered_audio_data_normalization_values(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(
+        files,
+        butter=Butterworth(N=2, Wn=[1_000, 2_000], btype="bandpass"),
+    )
+    filtered = ad.get_filtered_value()
+    normalization_values = ad.get_normalization_values()
+
+    assert np.allclose(normalization_values["mean"], filtered.mean(axis=0))
+    assert np.allclose(normalization_values["std"], filtered.std(axis=0))
+    assert np.array_equal(normalization_values["peak"], filtered.max(axis=0))
+
+
+@pytest.mark.parametrize(
+    ("audio_files", "normalization", "normalization_values", "butter"),
+    [
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.RAW,
+            None,
+            None,
+            id="raw",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.DC_REJECT,
+            None,
+            None,
+            id="dc_reject",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.PEAK,
+            None,
+            None,
+            id="peak",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.DC_REJECT | Normalization.PEAK,
+            None,
+            None,
+            id="dc_reject_and_peak",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.DC_REJECT | Normalization.ZSCORE,
+            None,
+            None,
+            id="dc_reject_and_zscore",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.DC_REJECT | Normalization.ZSCORE,
+            {"mean": None, "peak": None, "std": 0.5},
+            None,
+            id="dc_reject_and_zscore_with_std",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.DC_REJECT | Normalization.PEAK,
+            {"mean": 0.1, "peak": None, "std": None},
+            None,
+            id="dc_reject_and_peak_with_mean",
+        ),
+        pytest.param(
+            {"duration": 1, "sample_rate": 48_000, "series_type": "noise"},
+            Normalization.ZSCORE,
+            None,
+            Butterworth(N=2, Wn=[1_000, 2_000], btype="bandpass"),
+            id="filtered_zscore",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_audio_data_stream_value(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    normalization: Normalization,
+    normalization_values: dict | None,
+    butter: Butterworth | None,
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(
+        files,
+        normalization=normalization,
+        normalization_values=normalization_values,
+        butter=butter,
+        instrument=Instrument(end_to_end_db=150.0),
+    )
+
+    streamed = np.vstack(list(ad.stream_value(chunk_size=5_000)))
+    streamed_calibrated = np.vstack(
+        list(ad.stream_value_calibrated(chunk_size=5_000)),
+    )
+
+    assert np.allclose(streamed, ad.get_value())
+    assert np.allclose(streamed_calibrated, ad.get_value_calibrated())
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+                "series_type": "noise",
+            },
+            id="files_with_gap",
+        ),
+    ],
+    indirect=True,
+)
+def test_audio_data_raw_value_is_preallocated(
+    tmp_path: Path,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files, sample_rate=24_000)
+    expected = np.vstack(list(ad.stream()))
+
+    tracemalloc.start()
+    value = ad.get_raw_value()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert np.array_equal(value, expected)
+    assert peak < 1.5 * expected.nbytes
+
+    out = np.memmap(
+        tmp_path / "raw_value.dat",
+        dtype=ad.dtype,
+        mode="w+",
+        shape=ad.shape,
+    )
+    assert ad.get_raw_value(out=out) is out
+    assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError, match="The output array should be of shape"):
+        ad.get_raw_value(out=np.empty((ad.length + 1, ad.nb_channels)))
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 2,
+                "inter_file_duration": 10,
+            },
+            id="long_gap",
+        ),
+    ],
+    indirect=True,
+)
+def test_audio_data_gap_is_streamed_without_allocation(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files, channels=[0, 0])
+    gap_begin, gap_end = 48_000, 11 * 48_000
+
+    chunks = list(ad.stream(chunk_size=30_000))
+    bounds = np.cumsum([0] + [len(chunk) for chunk in chunks])
+    silences = [
+        chunk
+        for chunk, start in zip(chunks, bounds, strict=False)
+        if gap_begin <= start < gap_end
+    ]
+
+    assert max(len(chunk) for chunk in chunks) <= 30_000
+    assert sum(len(silence) for silence in silences) == gap_end - gap_begin
+    assert all(silence.shape[1] == ad.nb_channels for silence in silences)
+    assert all(not silence.any() for silence in silences)
+    assert all(not silence.flags.writeable for silence in silences)
+    assert all(np.shares_memory(silence, silences[0]) for silence in silences)
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 4,
+                "sample_rate": 48_000,
+                "nb_files": 1,
+                "format": "flac",
+            },
+            id="flac_file",
+        ),
+    ],
+    indirect=True,
+)
+def test_overlapping_audio_data_are_decoded_once(
+    monkeypatch: pytest.MonkeyPatch,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ads = AudioDataset.from_files(
+        files,
+        mode="timedelta_total",
+        data_duration=Timedelta(seconds=1),
+        overlap=0.5,
+    )
+    expected = [ad.get_value() for ad in ads.data]
+
+    block_cache = osekit.core.block_cache
+    monkeypatch.setattr(block_cache, "max_bytes", 10**8)
+    block_cache.clear()
+    block_cache.reset_stats()
+
+    assert all(
+        np.array_equal(ad.get_value(), value)
+        for ad, value in zip(ads.data, expected, strict=True)
+    )
+
+    decoded_frames = block_cache.stats["misses"] * block_cache.block_frames
+    assert block_cache.stats["hits"] > 0
+    assert decoded_frames < 1.2 * 4 * 48_000
+
+    block_cache.clear()
+
+
 plot_calls_args = []
 plot_calls_kwargs = []
 
@@ -2413,3 +3082,193 @@ def test_plot_with_value(patch_plot: None, monkeypatch: pytest.Monke) -> None:
     # Values are provided and shouldn't be fetched again
     assert get_value_calls[0] == 1
     assert np.array_equal(kwargs, {"the": "voidz"})
+
+
+@pytest.mark.parametrize(
+    ("audio_files", "dtype", "sample_rate", "normalization"),
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            np.float32,
+            None,
+            Normalization.RAW,
+            id="float32",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            np.float32,
+            500,
+            Normalization.RAW,
+            id="float32_resampled",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+            },
+            np.float32,
+            None,
+            Normalization.ZSCORE,
+            id="float32_normalized",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+                "format": "flac",
+            },
+            np.int32,
+            None,
+            Normalization.RAW,
+            id="int32",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 2,
+                "inter_file_duration": 1,
+                "format": "flac",
+            },
+            np.int16,
+            None,
+            Normalization.RAW,
+            id="int16",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_audio_data_dtype(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    dtype: type,
+    sample_rate: int | None,
+    normalization: Normalization,
+) -> None:
+    files, _ = audio_files
+    expected = AudioData.from_files(
+        files,
+        sample_rate=sample_rate,
+        normalization=normalization,
+    ).get_value()
+
+    ad = AudioData.from_files(
+        files,
+        sample_rate=sample_rate,
+        normalization=normalization,
+        dtype=dtype,
+    )
+    value = ad.get_value()
+
+    assert ad.dtype == dtype
+    assert value.dtype == dtype
+    assert value.shape == expected.shape
+    if np.issubdtype(dtype, np.integer):
+        expected = expected * 2 ** (8 * np.dtype(dtype).itemsize - 1)
+        assert np.allclose(value, expected, atol=1)
+    else:
+        assert np.allclose(value, expected, atol=1e-4)
+
+    assert AudioData.from_dict(ad.to_dict()).dtype == dtype
+
+
+@pytest.mark.parametrize(
+    ("audio_files", "prefetch"),
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 3,
+                "inter_file_duration": 1,
+                "format": "flac",
+            },
+            1,
+            id="depth_1",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 48_000,
+                "nb_files": 3,
+                "format": "wav",
+            },
+            4,
+            id="depth_4",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_audio_data_stream_prefetch(
+    monkeypatch: pytest.MonkeyPatch,
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    prefetch: int,
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files, sample_rate=24_000)
+    expected = list(ad.stream(chunk_size=4_096))
+
+    prefetch_stats = afm.stats["prefetch"]
+    streamed = list(ad.stream(chunk_size=4_096, prefetch=prefetch))
+
+    assert len(streamed) == len(expected)
+    assert all(
+        np.array_equal(chunk, expected_chunk)
+        for chunk, expected_chunk in zip(streamed, expected, strict=True)
+    )
+    assert afm.stats["prefetch"]["streams"] == prefetch_stats["streams"] + len(files)
+    assert afm.stats["prefetch"]["max_queued"] <= max(
+        prefetch,
+        prefetch_stats["max_queued"],
+    )
+
+    # The prefetch depth is defaulted to the config value
+    monkeypatch.setitem(osekit.config.prefetch, "depth", prefetch)
+    assert np.array_equal(ad.get_value(), np.vstack(expected))
+    assert afm.stats["prefetch"]["streams"] == prefetch_stats["streams"] + 2 * len(
+        files
+    )
+
+
+def test_audio_data_unsupported_dtype() -> None:
+    with pytest.raises(ValueError, match="Unsupported audio dtype: uint8"):
+        MockedAudioData(mocked_value=[1, 2, 3], dtype=np.uint8)
+
+
+def test_audio_dataset_dtype() -> None:
+    ads = AudioDataset([MockedAudioData(mocked_value=[1, 2, 3]) for _ in range(2)])
+    assert ads.dtype == np.float64
+
+    ads.dtype = np.float32
+    assert all(ad.dtype == np.float32 for ad in ads.data)
+    assert ads.dtype == np.float32
+
+
+def test_split_audio_data_keeps_channels() -> None:
+    af = MockedAudioFile(
+        mocked_value=np.arange(3_000, dtype=float).reshape(-1, 3),
+        sample_rate=100,
+    )
+    ad = AudioData.from_files(files=[af])
+    ad.channels = [0, 2]
+    parts = ad.split(2)
+
+    assert [part.channels for part in parts] == [[0, 2], [0, 2]]
+    assert np.array_equal(
+        np.concatenate([part.get_value() for part in parts]),
+        ad.get_value(),
+    )
+    assert ad.split_frames(start_frame=100).channels == [0, 2]
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import itertools
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
+import soundfile as sf
 
 from osekit.audio_backend.audio_file_manager import AudioFileManager
+from osekit.audio_backend.block_cache import BlockCache
+from osekit.audio_backend.prefetcher import Prefetcher
+from osekit.audio_backend.soundfile_backend import SoundFileBackend
+from osekit.audio_backend.wav_memmap_backend import WavMemmapBackend
+from osekit.core import (
+    audio_file_manager,
+    block_cache,
+    get_audio_file_manager,
+    use_audio_file_manager,
+)
 from osekit.utils.audio import generate_sample_audio
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from osekit.core.audio_file import AudioFile
 
 
@@ -156,14 +171,16 @@ def test_read_errors(
 
 
 @pytest.mark.parametrize(
-    ("audio_files", "file_openings", "expected_opened_files"),
+    ("audio_files", "max_open_files", "file_openings", "expected_opened_files"),
     [
         pytest.param(
             {
                 "duration": 1,
                 "sample_rate": 10,
+                "format": "flac",
                 "nb_files": 1,
             },
+            1,
             [0],
             [0],
             id="one_single_file_opening",
@@ -172,8 +189,10 @@ def test_read_errors(
             {
                 "duration": 1,
                 "sample_rate": 10,
+                "format": "flac",
                 "nb_files": 1,
             },
+            1,
             [0, 0, 0, 0, 0],
             [0],
             id="repeated_file_openings",
@@ -182,8 +201,10 @@ def test_read_errors(
             {
                 "duration": 1,
                 "sample_rate": 10,
+                "format": "flac",
                 "nb_files": 5,
             },
+            1,
             [0, 1, 2, 3, 4],
             [0, 1, 2, 3, 4],
             id="different_file_openings",
@@ -192,22 +213,61 @@ def test_read_errors(
             {
                 "duration": 1,
                 "sample_rate": 10,
+                "format": "flac",
                 "nb_files": 5,
             },
+            1,
             [0, 0, 0, 1, 1, 1, 1, 2, 3, 3, 4, 4, 4, 2, 2, 1, 1],
             [0, 1, 2, 3, 4, 2, 1],
             id="multiple_repeated_file_openings",
         ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "format": "flac",
+                "nb_files": 5,
+            },
+            8,
+            [0, 0, 0, 1, 1, 1, 1, 2, 3, 3, 4, 4, 4, 2, 2, 1, 1],
+            [0, 1, 2, 3, 4],
+            id="repeated_file_openings_fitting_in_the_pool",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "format": "flac",
+                "nb_files": 5,
+            },
+            2,
+            [0, 1, 0, 2, 0, 1],
+            [0, 1, 2, 1],
+            id="least_recently_used_file_is_evicted",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "format": "flac",
+                "nb_files": 3,
+            },
+            2,
+            [0, 1, 2, 0, 1, 2],
+            [0, 1, 2, 0, 1, 2],
+            id="cycling_over_more_files_than_the_pool_size",
+        ),
     ],
     indirect=["audio_files"],
 )
 def test_switch(
     audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    max_open_files: int,
     file_openings: list[int],
     patch_afm_open: list[Path],
     expected_opened_files: list[int],
 ) -> None:
-    afm = AudioFileManager()
+    afm = AudioFileManager(max_open_files=max_open_files)
     sf_back = afm._soundfile
     audio_files, _ = audio_files
     audio_files = [af.path for af in audio_files]
@@ -215,6 +275,60 @@ def test_switch(
         afm.read(path=audio_files[file])
     assert [audio_files.index(f) for f in patch_afm_open] == expected_opened_files
     assert audio_files.index(Path(sf_back._file.name)) == file_openings[-1]
+    assert afm.stats["soundfile"]["open"] <= max_open_files
+
+
+@pytest.mark.parametrize(
+    ("audio_files", "max_open_files", "file_openings", "expected_stats"),
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "nb_files": 1,
+            },
+            8,
+            [],
+            {"hits": 0, "misses": 0, "evictions": 0, "open": 0, "max_size": 8},
+            id="no_access",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "nb_files": 3,
+            },
+            8,
+            [0, 1, 2, 0, 1, 2],
+            {"hits": 3, "misses": 3, "evictions": 0, "open": 3, "max_size": 8},
+            id="all_files_fit_in_the_pool",
+        ),
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "nb_files": 3,
+            },
+            2,
+            [0, 1, 0, 2, 1],
+            {"hits": 1, "misses": 4, "evictions": 2, "open": 2, "max_size": 2},
+            id="evictions",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_pool_stats(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    max_open_files: int,
+    file_openings: list[int],
+    expected_stats: dict,
+) -> None:
+    afm = AudioFileManager(max_open_files=max_open_files)
+    audio_files, _ = audio_files
+    for file in file_openings:
+        # AudioFileManager.read first accesses the file info
+        afm._soundfile.read(path=audio_files[file].path, start=0, stop=1)
+    assert afm.stats["soundfile"] == expected_stats
 
 
 @pytest.mark.parametrize(
@@ -224,6 +338,45 @@ def test_switch(
             {
                 "duration": 1,
                 "sample_rate": 10,
+                "format": "flac",
+                "nb_files": 5,
+            },
+            id="multiple_files",
+        ),
+    ],
+    indirect=True,
+)
+def test_pool_resize(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    afm = AudioFileManager(max_open_files=5)
+    audio_files, _ = audio_files
+    for file in audio_files:
+        afm.info(file.path)
+    assert afm.stats["soundfile"]["open"] == 5
+
+    afm.max_open_files = 2
+    assert afm.max_open_files == 2
+    assert afm.stats["soundfile"]["open"] == 2
+    assert afm.stats["soundfile"]["evictions"] == 3
+    assert Path(afm._soundfile._file.name) == audio_files[-1].path
+
+    with pytest.raises(ValueError, match="The pool size must be at least 1"):
+        afm.max_open_files = 0
+
+    afm.close()
+    assert afm.stats["soundfile"]["open"] == 0
+    assert afm._soundfile._file is None
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 10,
+                "format": "flac",
                 "nb_files": 1,
             },
             id="one_single_file_opening",
@@ -267,3 +420,471 @@ def test_info(audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest]) -
         assert request.param["sample_rate"] == sample_rate
         assert request.param["duration"] * request.param["sample_rate"] == frames
         assert channels == 1
+
+
+@pytest.mark.parametrize(
+    ("subtype", "channels", "expected_backend"),
+    [
+        pytest.param("PCM_U8", 1, WavMemmapBackend, id="pcm_u8"),
+        pytest.param("PCM_16", 1, WavMemmapBackend, id="pcm_16"),
+        pytest.param("PCM_32", 1, WavMemmapBackend, id="pcm_32"),
+        pytest.param("FLOAT", 1, WavMemmapBackend, id="float"),
+        pytest.param("DOUBLE", 1, WavMemmapBackend, id="double"),
+        pytest.param("PCM_16", 3, WavMemmapBackend, id="multichannel_pcm_16"),
+        pytest.param("DOUBLE", 2, WavMemmapBackend, id="multichannel_double"),
+        pytest.param("PCM_24", 1, SoundFileBackend, id="pcm_24_falls_back"),
+        pytest.param("ULAW", 1, SoundFileBackend, id="compressed_falls_back"),
+    ],
+)
+def test_wav_memmap_backend(
+    tmp_path: Path,
+    subtype: str,
+    channels: int,
+    expected_backend: type,
+) -> None:
+    path = tmp_path / "audio.wav"
+    rng = np.random.default_rng(seed=0)
+    sf.write(
+        path,
+        rng.uniform(-1, 1, size=(1_000, channels)),
+        samplerate=1_000,
+        subtype=subtype,
+    )
+
+    afm = AudioFileManager()
+    assert type(afm._backend(path)) is expected_backend
+    assert afm.info(path) == (1_000, 1_000, channels)
+
+    expected = sf.read(path, start=100, stop=600)[0]
+    data = afm.read(path, start=100, stop=600)
+    assert data.dtype == np.float64
+    assert data.shape == expected.shape
+    assert np.array_equal(data, expected)
+
+    afm.seek(path, 100)
+    streamed = np.concatenate([afm.stream(path, chunk_size=200) for _ in range(5)])
+    assert np.array_equal(streamed, sf.read(path, start=100)[0])
+
+
+@pytest.mark.parametrize(
+    "subtype",
+    [
+        pytest.param("PCM_U8", id="pcm_u8"),
+        pytest.param("PCM_16", id="pcm_16"),
+        pytest.param("PCM_32", id="pcm_32"),
+        pytest.param("FLOAT", id="float"),
+        pytest.param("DOUBLE", id="double"),
+        pytest.param("PCM_24", id="pcm_24"),
+    ],
+)
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        pytest.param(np.float64, id="float64"),
+        pytest.param(np.float32, id="float32"),
+        pytest.param(np.int32, id="int32"),
+        pytest.param(np.int16, id="int16"),
+    ],
+)
+def test_read_dtype(tmp_path: Path, subtype: str, dtype: type) -> None:
+    path = tmp_path / "audio.wav"
+    rng = np.random.default_rng(seed=0)
+    sf.write(
+        path,
+        rng.uniform(-1, 1, size=(1_000, 2)),
+        samplerate=1_000,
+        subtype=subtype,
+    )
+
+    afm = AudioFileManager()
+    expected = sf.read(path, start=100, stop=600, dtype=np.dtype(dtype).name)[0]
+    data = afm.read(path, start=100, stop=600, dtype=dtype)
+    assert data.dtype == dtype
+    assert np.array_equal(data, expected)
+
+    afm.seek(path, 100)
+    streamed = np.concatenate(
+        [afm.stream(path, chunk_size=100, dtype=dtype) for _ in range(5)],
+    )
+    assert streamed.dtype == dtype
+    assert np.array_equal(streamed, expected)
+
+
+@pytest.mark.parametrize(
+    ("audio_format", "subtype"),
+    [
+        pytest.param("wav", "PCM_16", id="memmap_wav"),
+        pytest.param("wav", "PCM_24", id="soundfile_wav"),
+        pytest.param("flac", "PCM_16", id="flac"),
+    ],
+)
+@pytest.mark.parametrize(
+    "channels",
+    [
+        pytest.param([2], id="single_channel"),
+        pytest.param([0, 3], id="channel_subset"),
+        pytest.param([3, 1, 1], id="reordered_channels"),
+        pytest.param(None, id="all_channels"),
+    ],
+)
+def test_read_channels(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    audio_format: str,
+    subtype: str,
+    channels: list[int] | None,
+) -> None:
+    path = tmp_path / f"audio.{audio_format}"
+    rng = np.random.default_rng(seed=0)
+    sf.write(
+        path,
+        rng.uniform(-1, 1, size=(1_000, 4)),
+        samplerate=1_000,
+        subtype=subtype,
+    )
+    monkeypatch.setattr(SoundFileBackend, "block_size", 64)
+
+    afm = AudioFileManager()
+    expected = sf.read(path, start=100, stop=600, dtype="float32")[0]
+    if channels is not None:
+        expected = expected[:, channels]
+
+    data = afm.read(path, start=100, stop=600, dtype=np.float32, channels=channels)
+    assert data.dtype == np.float32
+    assert np.array_equal(data, expected)
+
+    afm.seek(path, 100)
+    streamed = np.concatenate(
+        [
+            afm.stream(path, chunk_size=150, dtype=np.float32, channels=channels)
+            for _ in range(4)
+        ],
+    )
+    assert np.array_equal(streamed[:500], expected)
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 1,
+                "sample_rate": 1_000,
+                "nb_files": 1,
+            },
+            id="double_wav_file",
+        ),
+    ],
+    indirect=True,
+)
+def test_wav_memmap_backend_returns_views(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    afm = AudioFileManager()
+    audio_files, _ = audio_files
+    path = audio_files[0].path
+
+    first = afm.read(path, start=0, stop=500)
+    second = afm.read(path, start=250, stop=750)
+
+    assert np.shares_memory(first, second)
+    assert not first.flags.writeable
+    assert afm.stats["wav"]["misses"] == 1
+
+    afm.close()
+    assert afm.stats["wav"]["open"] == 0
+    assert np.array_equal(first[250:], second[:250])
+
+
+def test_wav_memmap_backend_overwritten_file(tmp_path: Path) -> None:
+    path = tmp_path / "overwritten.wav"
+    rng = np.random.default_rng(seed=0)
+    sf.write(path, rng.uniform(-1, 1, 96_000), 48_000, subtype="DOUBLE")
+
+    backend = WavMemmapBackend()
+    afm = AudioFileManager()
+    for reader in (backend, afm):
+        assert reader.info(path)[1] == 96_000
+        assert len(reader.read(path, start=90_000, stop=96_000)) == 6_000
+
+    new_data = rng.uniform(-1, 1, 48_000)
+    sf.write(path, new_data, 48_000, subtype="DOUBLE")
+
+    file_stat = path.stat()
+    backend.refresh(path, (file_stat.st_size, file_stat.st_mtime_ns))
+    assert backend.info(path)[1] == 48_000
+    assert len(backend.read(path, start=90_000, stop=96_000)) == 0
+    assert np.array_equal(backend.read(path), new_data)
+
+    assert afm.info(path)[1] == 48_000
+    assert np.array_equal(afm.read(path), new_data)
+    afm.seek(path, 40_000)
+    assert np.array_equal(afm.stream(path, chunk_size=10_000), new_data[40_000:])
+
+
+def test_wav_memmap_backend_layouts_are_bounded(tmp_path: Path) -> None:
+    rng = np.random.default_rng(seed=0)
+    paths = [tmp_path / f"audio_{index}.wav" for index in range(5)]
+    for path in paths:
+        sf.write(path, rng.uniform(-1, 1, 1_000), 1_000, subtype="DOUBLE")
+
+    backend = WavMemmapBackend(max_open_files=2)
+    for path in paths:
+        assert len(backend.read(path)) == 1_000
+
+    assert len(backend._layouts) == 2
+    assert backend.stats["open"] == 2
+
+    backend.max_open_files = 1
+    assert len(backend._layouts) == 1
+
+
+@pytest.mark.parametrize(
+    ("audio_format", "subtype"),
+    [
+        pytest.param("wav", "DOUBLE", id="memmap_wav"),
+        pytest.param("flac", "PCM_16", id="flac_through_block_cache"),
+    ],
+)
+def test_streamed_chunks_do_not_stat_the_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    audio_format: str,
+    subtype: str,
+) -> None:
+    path = tmp_path / f"audio.{audio_format}"
+    rng = np.random.default_rng(seed=0)
+    sf.write(path, rng.uniform(-1, 1, 1_000), samplerate=1_000, subtype=subtype)
+    expected = sf.read(path)[0]
+
+    stat_calls = [0]
+    path_stat = Path.stat
+
+    def count_stat(self: Path, **kwargs: dict) -> object:
+        if self == path:
+            stat_calls[0] += 1
+        return path_stat(self, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", count_stat)
+
+    afm = AudioFileManager(block_cache=BlockCache(max_bytes=10**6, block_frames=128))
+    assert np.array_equal(afm.read(path), expected)
+
+    stat_calls[0] = 0
+    afm.seek(path, 0)
+    streamed = np.concatenate([afm.stream(path, chunk_size=100) for _ in range(10)])
+    assert np.array_equal(streamed, expected)
+    assert stat_calls[0] == 1
+
+    stat_calls[0] = 0
+    assert np.array_equal(afm.read(path, start=100, stop=200), expected[100:200])
+    assert stat_calls[0] == 1
+
+
+@pytest.mark.parametrize(
+    "depth",
+    [
+        pytest.param(1, id="depth_1"),
+        pytest.param(4, id="depth_4"),
+        pytest.param(20, id="depth_larger_than_iterator"),
+    ],
+)
+def test_prefetcher(depth: int) -> None:
+    prefetcher = Prefetcher(produce=lambda: iter(range(10)), depth=depth)
+    assert list(prefetcher) == list(range(10))
+
+    stats = prefetcher.stats
+    assert stats["depth"] == depth
+    assert stats["produced"] == stats["consumed"] == 10
+    assert 1 <= stats["max_queued"] <= depth
+
+
+def test_prefetcher_errors() -> None:
+    with pytest.raises(ValueError, match="The prefetch depth must be at least 1"):
+        Prefetcher(produce=lambda: iter([]), depth=0)
+
+    def failing_produce() -> Iterator[int]:
+        yield 1
+        msg = "Unreadable chunk."
+        raise OSError(msg)
+
+    prefetcher = Prefetcher(produce=failing_produce, depth=2)
+    with pytest.raises(OSError, match="Unreadable chunk."):
+        list(prefetcher)
+
+
+def test_prefetcher_early_stop() -> None:
+    prefetcher = Prefetcher(produce=lambda: itertools.count(), depth=2)
+    stream = iter(prefetcher)
+    assert [next(stream) for _ in range(3)] == [0, 1, 2]
+    stream.close()
+
+    assert not prefetcher._thread.is_alive()
+    assert prefetcher.stats["consumed"] == 3
+    assert prefetcher.stats["produced"] <= 3 + 2
+
+
+def test_block_cache() -> None:
+    cache = BlockCache(max_bytes=3 * 800, block_frames=100)
+    decoded = []
+
+    def decode(index: int) -> np.ndarray:
+        decoded.append(index)
+        return np.full(100, index, dtype=np.float64)
+
+    for index in (0, 1, 0, 2, 3, 0):
+        block = cache.get(key=index, decode=lambda index=index: decode(index))
+        assert np.all(block == index)
+        assert not block.flags.writeable
+
+    assert decoded == [0, 1, 2, 3]
+    assert cache.stats == {
+        "hits": 2,
+        "misses": 4,
+        "evictions": 1,
+        "hit_rate": 2 / 6,
+        "blocks": 3,
+        "bytes": 3 * 800,
+        "max_bytes": 3 * 800,
+    }
+
+    cache.max_bytes = 800
+    assert len(cache) == 1
+    cache.get(key=4, decode=lambda: np.zeros(200))
+    assert cache.stats["bytes"] == 800
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="The cache size can't be negative"):
+        cache.max_bytes = -1
+    with pytest.raises(ValueError, match="A block must have at least 1 frame"):
+        BlockCache(block_frames=0)
+
+
+@pytest.mark.parametrize(
+    ("audio_format", "subtype", "cached"),
+    [
+        pytest.param("flac", "PCM_16", True, id="flac_is_cached"),
+        pytest.param("wav", "PCM_24", True, id="soundfile_wav_is_cached"),
+        pytest.param("wav", "PCM_16", False, id="memmap_wav_is_not_cached"),
+    ],
+)
+def test_read_through_block_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    audio_format: str,
+    subtype: str,
+    cached: bool,
+) -> None:
+    path = tmp_path / f"audio.{audio_format}"
+    rng = np.random.default_rng(seed=0)
+    sf.write(
+        path,
+        rng.uniform(-1, 1, size=(1_000, 2)),
+        samplerate=1_000,
+        subtype=subtype,
+    )
+    expected = sf.read(path)[0]
+
+    decoded_frames = [0]
+    sf_read = SoundFileBackend.read
+
+    def count_frames(self: SoundFileBackend, **kwargs: dict) -> np.ndarray:
+        data = sf_read(self, **kwargs)
+        decoded_frames[0] += len(data)
+        return data
+
+    monkeypatch.setattr(SoundFileBackend, "read", count_frames)
+
+    afm = AudioFileManager(block_cache=BlockCache(max_bytes=10**6, block_frames=128))
+
+    # Overlapping reads
+    assert np.array_equal(afm.read(path, start=0, stop=600), expected[:600])
+    assert np.array_equal(afm.read(path, start=300, stop=900), expected[300:900])
+    assert np.array_equal(afm.read(path, start=900), expected[900:])
+
+    afm.seek(path, 250)
+    streamed = np.concatenate([afm.stream(path, chunk_size=100) for _ in range(5)])
+    assert np.array_equal(streamed, expected[250:750])
+
+    assert np.array_equal(
+        afm.read(path, start=100, stop=200, channels=[1]),
+        expected[100:200, [1]],
+    )
+
+    cache_stats = afm.stats["cache"]
+    if cached:
+        assert decoded_frames[0] == 1_000 + 2 * 128
+        assert cache_stats["hits"] > 0
+        assert cache_stats["misses"] == 8 + 2
+    else:
+        assert cache_stats["hits"] == cache_stats["misses"] == 0
+
+
+def test_use_audio_file_manager() -> None:
+    assert get_audio_file_manager() is audio_file_manager
+
+    with use_audio_file_manager() as manager:
+        assert get_audio_file_manager() is manager
+        assert manager is not audio_file_manager
+        assert manager.block_cache is block_cache
+
+        explicit_manager = AudioFileManager()
+        with use_audio_file_manager(explicit_manager):
+            assert get_audio_file_manager() is explicit_manager
+
+        assert get_audio_file_manager() is manager
+
+    assert get_audio_file_manager() is audio_file_manager
+
+
+@pytest.mark.parametrize(
+    "explicit_managers",
+    [
+        pytest.param(False, id="thread_local_managers"),
+        pytest.param(True, id="explicit_managers"),
+    ],
+)
+def test_concurrent_streams_are_isolated(
+    tmp_path: Path,
+    explicit_managers: bool,
+) -> None:
+    path = tmp_path / "audio.flac"
+    rng = np.random.default_rng(seed=0)
+    sf.write(path, rng.uniform(-1, 1, size=(4_000, 1)), samplerate=1_000)
+    expected = sf.read(path)[0]
+
+    nb_readers, chunk_size, nb_chunks = 4, 100, 10
+    barrier = threading.Barrier(nb_readers)
+    streamed = {}
+
+    def stream_chunks(start: int) -> None:
+        # All readers seek and stream the same file in lockstep
+        manager = get_audio_file_manager()
+        manager.seek(path, start)
+        chunks = []
+        for _ in range(nb_chunks):
+            barrier.wait()
+            chunks.append(manager.stream(path, chunk_size=chunk_size))
+        streamed[start] = np.concatenate(chunks)
+
+    def reader(start: int) -> None:
+        if not explicit_managers:
+            stream_chunks(start)
+            return
+        with use_audio_file_manager():
+            stream_chunks(start)
+
+    threads = [
+        threading.Thread(target=reader, args=(start,))
+        for start in range(0, nb_readers * 1_000, 1_000)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(streamed) == nb_readers
+    for start, data in streamed.items():
+        assert np.array_equal(data, expected[start : start + chunk_size * nb_chunks])
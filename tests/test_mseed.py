@@ -7,6 +7,8 @@ import pandas as pd
 import pytest
 from pandas import Timestamp
 
+from osekit.audio_backend.audio_file_manager import AudioFileManager
+from osekit.audio_backend.mseed_backend import MSeedBackend
 from osekit.config import TIMESTAMP_FORMATS_EXPORTED_FILES
 from osekit.core.audio_data import AudioData
 from osekit.core.audio_file import AudioFile
@@ -231,3 +233,100 @@ def test_missing_dependency(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
         match="MSEED support requires the optional dependency 'obspy'",
     ):
         AudioFile(dummy_file, begin=Timestamp("2020-01-01 00:00:00"))
+
+
+@pytest.fixture
+def long_mseed_file(tmp_path: Path) -> tuple[Path, np.ndarray]:
+    rng = np.random.default_rng(seed=0)
+    traces_data = [
+        rng.integers(-1_000, 1_000, size=20_000, dtype=np.int32),
+        rng.integers(-1_000, 1_000, size=5_123, dtype=np.int32),
+    ]
+    path = tmp_path / "long.mseed"
+    obspy.Stream(
+        [
+            obspy.Trace(
+                data=data,
+                header={
+                    "sampling_rate": 100,
+                    "starttime": obspy.UTCDateTime(1_000 * idx),
+                },
+            )
+            for idx, data in enumerate(traces_data)
+        ],
+    ).write(path, format="MSEED", reclen=512)
+    return path, np.concatenate(traces_data)
+
+
+def test_mseed_record_index(long_mseed_file: tuple[Path, np.ndarray]) -> None:
+    path, full_data = long_mseed_file
+    backend = MSeedBackend()
+    index = backend.index(path)
+
+    assert len(index.offsets) > 2
+    assert index.frames == len(full_data)
+    assert backend.info(path) == (100, len(full_data), 1)
+    assert index.start_times[0] == 0.0
+    assert index.start_times[-1] >= 1_000.0
+    assert backend.index(path) is index
+
+    for start, stop in [
+        (0, 10),
+        (0, len(full_data)),
+        (123, 4_567),
+        (19_990, 20_010),
+        (len(full_data) - 5, len(full_data)),
+    ]:
+        assert np.array_equal(
+            backend.read(path, start=start, stop=stop), full_data[start:stop]
+        )
+
+
+def test_mseed_rewritten_file(long_mseed_file: tuple[Path, np.ndarray]) -> None:
+    path, full_data = long_mseed_file
+    backend = MSeedBackend()
+    afm = AudioFileManager()
+    for reader in (backend, afm):
+        assert reader.info(path)[1] == len(full_data)
+        assert np.array_equal(reader.read(path, stop=1_000), full_data[:1_000])
+
+    new_data = np.arange(30_000, dtype=np.int32)
+    obspy.Stream(
+        obspy.Trace(data=new_data, header={"sampling_rate": 100}),
+    ).write(path, format="MSEED", reclen=512)
+
+    file_stat = path.stat()
+    backend.refresh(path, (file_stat.st_size, file_stat.st_mtime_ns))
+    for reader in (backend, afm):
+        assert reader.info(path)[1] == len(new_data)
+        assert np.array_equal(reader.read(path, stop=1_000), new_data[:1_000])
+        assert np.array_equal(reader.read(path), new_data)
+
+
+def test_mseed_stream_decodes_records_once(
+    long_mseed_file: tuple[Path, np.ndarray],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path, full_data = long_mseed_file
+    backend = MSeedBackend()
+
+    decoded_records = []
+    decode = MSeedBackend._decode
+
+    def count_decoded_records(*args: list) -> np.ndarray:
+        decoded_records.append(args[3] - args[2])
+        return decode(*args)
+
+    monkeypatch.setattr(MSeedBackend, "_decode", staticmethod(count_decoded_records))
+
+    chunk_size = 1_000
+    backend.seek(path, 0)
+    streamed = [
+        backend.stream(path, chunk_size=chunk_size)
+        for _ in range(0, len(full_data), chunk_size)
+    ]
+
+    assert np.array_equal(np.concatenate(streamed), full_data)
+    nb_records = len(backend.index(path).offsets)
+    # Consecutive chunks share at most one record
+    assert sum(decoded_records) <= nb_records + len(streamed)
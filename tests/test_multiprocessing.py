@@ -1,14 +1,33 @@
+import pickle
+import threading
 import typing
+from multiprocessing import shared_memory
+from pathlib import Path
 
+import numpy as np
 import pytest
+from pandas import Timestamp
+from scipy.signal import ShortTimeFFT
+from scipy.signal.windows import hamming
 
 import osekit.utils.multiprocess as mpu
 from osekit import config
+from osekit.audio_backend.audio_file_manager import AudioFileManager
+from osekit.core import audio_file_manager, get_audio_file_manager
+from osekit.core.spectro_data import SpectroData
+from osekit.core.spectro_dataset import SpectroDataset
+from tests.helpers.audio import MockedAudioData
 
 
 class MockedPool:
-    def __init__(self, processes: int) -> None:
+    def __init__(
+        self,
+        processes: int,
+        initializer: callable,
+        initargs: tuple,
+    ) -> None:
         self.processes = processes
+        initializer(*initargs)
 
     def __enter__(self) -> typing.Self:
         return self
@@ -16,7 +35,12 @@ class MockedPool:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Override exit dunder."""
 
-    def imap(self, func: callable, iterable: list) -> typing.Generator:
+    def imap(
+        self,
+        func: callable,
+        iterable: list,
+        chunksize: int = 1,
+    ) -> typing.Generator:
         for element in iterable:
             yield func(element)
 
@@ -59,10 +83,10 @@ def test_multiprocessing(
 
     pool_call = {"called": False, "nb_processes": None}
 
-    def patch_pool(nb_processes: int):
+    def patch_pool(nb_processes: int, initializer: callable, initargs: tuple):
         pool_call["called"] = True
         pool_call["nb_processes"] = nb_processes
-        return MockedPool(nb_processes)
+        return MockedPool(nb_processes, initializer, initargs)
 
     monkeypatch.setattr(mpu.mp, "Pool", patch_pool)
 
@@ -81,3 +105,337 @@ def test_multiprocessing(
     assert tqdm_call["called"] is True
     assert pool_call["called"] is multiprocessing
     assert pool_call["nb_processes"] == (nb_processes if multiprocessing else None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(np.arange(100_000, dtype=np.float64), id="large_array"),
+        pytest.param(np.arange(10, dtype=np.int16), id="small_array_is_pickled"),
+        pytest.param(
+            (
+                "data",
+                [np.ones((512, 64), dtype=np.complex128)],
+                {"welch": np.zeros(20_000, dtype=np.float32), "name": "foo"},
+            ),
+            id="nested_arrays",
+        ),
+        pytest.param(np.array([None] * 100_000), id="object_array_is_pickled"),
+    ],
+)
+def test_shared_arrays(value: object) -> None:
+    shared = mpu.share_arrays(value)
+    handles = []
+
+    def collect_handles(shared_value: object) -> None:
+        if isinstance(shared_value, mpu.SharedArray):
+            handles.append(shared_value)
+        if isinstance(shared_value, (tuple, list)):
+            for v in shared_value:
+                collect_handles(v)
+        if isinstance(shared_value, dict):
+            for v in shared_value.values():
+                collect_handles(v)
+
+    collect_handles(shared)
+    assert all(len(pickle.dumps(handle)) < 200 for handle in handles)
+
+    restored = mpu.restore_arrays(shared)
+
+    def assert_equal(restored_value: object, expected: object) -> None:
+        if isinstance(expected, np.ndarray):
+            assert restored_value.dtype == expected.dtype
+            assert np.array_equal(restored_value, expected)
+        elif isinstance(expected, (tuple, list)):
+            assert type(restored_value) is type(expected)
+            for r, e in zip(restored_value, expected, strict=True):
+                assert_equal(r, e)
+        elif isinstance(expected, dict):
+            assert restored_value.keys() == expected.keys()
+            for key in expected:
+                assert_equal(restored_value[key], expected[key])
+        else:
+            assert restored_value == expected
+
+    assert_equal(restored, value)
+
+    for handle in handles:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.name)
+
+
+@pytest.mark.parametrize(
+    "transport",
+    [
+        pytest.param("pickle", id="pickle"),
+        pytest.param("shared_memory", id="shared_memory"),
+    ],
+)
+def test_multiprocessing_transport(
+    monkeypatch: pytest.MonkeyPatch,
+    transport: str,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "nb_processes", 2)
+    monkeypatch.setitem(config.multiprocessing, "transport", transport)
+
+    def shared_blocks() -> set[str]:
+        return {path.name for path in Path("/dev/shm").glob("psm_*")}
+
+    blocks_before = shared_blocks()
+    shapes = [(512, 512), (4,), (1_000, 100)]
+    result = mpu.multiprocess(np.ones, shapes, dtype=np.float32)
+
+    assert [r.shape for r in result] == shapes
+    assert all(r.dtype == np.float32 and np.all(r == 1) for r in result)
+    assert shared_blocks() <= blocks_before
+
+
+def _fail_on_tenth(array: np.ndarray) -> np.ndarray:
+    if array[0] == 10:  # noqa: PLR2004
+        msg = "Failing task."
+        raise ValueError(msg)
+    return array * 2
+
+
+@pytest.mark.skipif(
+    not Path("/dev/shm").is_dir(),
+    reason="Shared memory blocks are listed in /dev/shm",
+)
+def test_multiprocessing_releases_shared_memory_of_failing_tasks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "nb_processes", 2)
+    monkeypatch.setitem(config.multiprocessing, "transport", "shared_memory")
+    monkeypatch.setitem(config.multiprocessing, "chunksize", 1)
+
+    class ComputeAheadPool(MockedPool):
+        # Terminating actual worker processes while they send their results
+        # can hang the pool: the workers rather compute all tasks in-process
+        # before the results are consumed.
+        def imap(
+            self,
+            func: callable,
+            iterable: list,
+            chunksize: int = 1,
+        ) -> typing.Generator:
+            outcomes = []
+            for element in iterable:
+                try:
+                    outcomes.append((func(element), None))
+                except ValueError as e:
+                    outcomes.append((None, e))
+            for result, error in outcomes:
+                if error is not None:
+                    raise error
+                yield result
+
+    monkeypatch.setattr(mpu.mp, "Pool", ComputeAheadPool)
+
+    def shared_blocks() -> set[str]:
+        return {path.name for path in Path("/dev/shm").glob("psm_*")}
+
+    blocks_before = shared_blocks()
+    inputs = [np.full(mpu.SHARED_MEMORY_MIN_BYTES, float(i)) for i in range(40)]
+
+    with pytest.raises(ValueError, match="Failing task."):
+        mpu.multiprocess(_fail_on_tenth, inputs)
+
+    assert shared_blocks() <= blocks_before
+
+
+@pytest.mark.skipif(
+    not Path("/dev/shm").is_dir(),
+    reason="Shared memory blocks are listed in /dev/shm",
+)
+def test_multiprocessing_shares_welch_spectra(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "nb_processes", 1)
+    monkeypatch.setitem(config.multiprocessing, "transport", "shared_memory")
+    monkeypatch.setitem(config.multiprocessing, "chunksize", 20)
+    monkeypatch.setattr(mpu.mp, "Pool", MockedPool)
+
+    restored_arrays = []
+    to_array = mpu.SharedArray.to_array
+
+    def spy_to_array(self: mpu.SharedArray) -> np.ndarray:
+        restored_arrays.append(self)
+        return to_array(self)
+
+    monkeypatch.setattr(mpu.SharedArray, "to_array", spy_to_array)
+
+    rng = np.random.default_rng(seed=0)
+    sds = SpectroDataset(
+        [
+            SpectroData.from_audio_data(
+                data=MockedAudioData(
+                    mocked_value=rng.standard_normal(4_096),
+                    begin=Timestamp(year, 1, 1),
+                    end=Timestamp(year, 1, 1, 0, 0, 1),
+                    sample_rate=4_096,
+                ),
+                fft=ShortTimeFFT(hamming(1_024), hop=1_024, fs=4_096),
+            )
+            for year in range(2000, 2040)
+        ],
+    )
+    expected = sds.get_welch()
+    blocks_before = {path.name for path in Path("/dev/shm").glob("psm_*")}
+
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    welch = sds.get_welch()
+
+    # The 20 Welch spectra of 513 values of each chunk are shared at once.
+    assert len(restored_arrays) == 2  # noqa: PLR2004
+    assert {path.name for path in Path("/dev/shm").glob("psm_*")} <= blocks_before
+    assert welch.equals(expected)
+
+
+def test_multiprocessing_unknown_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "transport", "carrier_pigeon")
+
+    with pytest.raises(ValueError, match="Unknown transport: carrier_pigeon"):
+        mpu.multiprocess(np.ones, [(1,)])
+
+
+@pytest.mark.parametrize(
+    ("nb_elements", "nb_processes", "chunksize", "expected"),
+    [
+        pytest.param(100, 5, None, 5, id="about_4_chunks_per_process"),
+        pytest.param(3, 5, None, 1, id="at_least_one_element_per_chunk"),
+        pytest.param(100, 5, 32, 32, id="specified_chunksize"),
+    ],
+)
+def test_multiprocessing_chunksize(
+    monkeypatch: pytest.MonkeyPatch,
+    nb_elements: int,
+    nb_processes: int,
+    chunksize: int | None,
+    expected: int,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "nb_processes", nb_processes)
+    monkeypatch.setitem(config.multiprocessing, "chunksize", chunksize)
+
+    imap_chunksize = []
+
+    class ChunkedPool(MockedPool):
+        def imap(
+            self,
+            func: callable,
+            iterable: list,
+            chunksize: int = 1,
+        ) -> typing.Generator:
+            imap_chunksize.append(chunksize)
+            return super().imap(func, iterable, chunksize)
+
+    monkeypatch.setattr(mpu.mp, "Pool", ChunkedPool)
+
+    assert mpu.multiprocess(abs, [-1] * nb_elements) == [1] * nb_elements
+    assert imap_chunksize == [expected]
+
+
+def test_multiprocessing_tasks_do_not_carry_the_dataset(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+
+    pickled_sizes = {"initargs": 0, "tasks": []}
+
+    class PicklingPool(MockedPool):
+        def __init__(
+            self,
+            processes: int,
+            initializer: callable,
+            initargs: tuple,
+        ) -> None:
+            pickled_sizes["initargs"] = len(pickle.dumps(initargs))
+            super().__init__(processes, initializer, initargs)
+
+        def imap(
+            self,
+            func: callable,
+            iterable: list,
+            chunksize: int = 1,
+        ) -> typing.Generator:
+            for element in iterable:
+                pickled_sizes["tasks"].append(len(pickle.dumps((func, element))))
+                yield None
+
+    monkeypatch.setattr(mpu.mp, "Pool", PicklingPool)
+
+    sds = SpectroDataset(
+        [
+            SpectroData.from_audio_data(
+                data=MockedAudioData(
+                    mocked_value=np.zeros(10),
+                    begin=Timestamp(year, 1, 1),
+                    end=Timestamp(year, 1, 2),
+                ),
+                fft=ShortTimeFFT(hamming(1024), hop=1024, fs=48_000),
+            )
+            for year in range(2000, 2100)
+        ],
+    )
+    dataset_size = len(pickle.dumps(sds))
+
+    sds.save_spectrogram(tmp_path)
+
+    assert len(pickled_sizes["tasks"]) == 100
+    assert pickled_sizes["initargs"] < dataset_size / 10
+    assert max(pickled_sizes["tasks"]) < dataset_size / 10
+
+
+@pytest.mark.parametrize(
+    ("executor", "nb_processes"),
+    [
+        pytest.param("serial", 4, id="serial"),
+        pytest.param("threads", 4, id="threads"),
+        pytest.param("threads", None, id="threads_with_default_nb_processes"),
+    ],
+)
+def test_multiprocessing_executor(
+    monkeypatch: pytest.MonkeyPatch,
+    executor: str,
+    nb_processes: int | None,
+) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "nb_processes", nb_processes)
+    monkeypatch.setitem(config.multiprocessing, "executor", executor)
+
+    def patch_pool(*args: object, **kwargs: object) -> None:
+        pytest.fail("No process pool should be created.")
+
+    monkeypatch.setattr(mpu.mp, "Pool", patch_pool)
+
+    def get_file_manager(x: int) -> tuple[int, str, AudioFileManager]:
+        return x**2, threading.current_thread().name, get_audio_file_manager()
+
+    result = mpu.multiprocess(get_file_manager, list(range(20)))
+
+    assert [r[0] for r in result] == [x**2 for x in range(20)]
+
+    main_thread = threading.main_thread().name
+    if executor == "serial":
+        assert all(r[1] == main_thread for r in result)
+        assert all(r[2] is audio_file_manager for r in result)
+        return
+
+    assert all(r[1] != main_thread for r in result)
+    # Each worker thread reads the audio files through its own file manager
+    managers = {thread: manager for _, thread, manager in result}
+    assert audio_file_manager not in managers.values()
+    assert len({id(m) for m in managers.values()}) == len(managers)
+    assert all(manager is managers[thread] for _, thread, manager in result)
+
+
+def test_multiprocessing_unknown_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(config.multiprocessing, "is_active", True)
+    monkeypatch.setitem(config.multiprocessing, "executor", "fibers")
+
+    with pytest.raises(ValueError, match="Unknown executor: fibers"):
+        mpu.multiprocess(np.ones, [(1,)])
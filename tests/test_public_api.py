@@ -596,6 +596,16 @@ def test_spectral_transform_error_if_no_provided_fft(output_type: OutputType) ->
         )
 
 
+def test_transform_error_if_unknown_storage_precision() -> None:
+    with pytest.raises(ValueError, match=r"Unknown storage precision: half"):
+        Transform(
+            output_type=OutputType.SPECTRUM,
+            name="half_precision",
+            fft=ShortTimeFFT(win=hamming(512), hop=512, fs=48_000),
+            storage_precision="half",
+        )
+
+
 @pytest.mark.parametrize(
     ("transform", "expected"),
     [
@@ -774,6 +774,25 @@ def test_spectro_data_serialization_channel() -> None:
     assert SpectroData.from_dict(sd.to_dict()).audio_channel == sd.audio_channel
 
 
+def test_spectro_data_serialization_storage_precision() -> None:
+    ad = MockedAudioData(mocked_value=np.zeros(100), sample_rate=100)
+    sd = SpectroData.from_audio_data(
+        ad, fft=ShortTimeFFT(win=hamming(48), hop=48, fs=100)
+    )
+    sd.storage_precision = "uint8"
+
+    assert SpectroData.from_dict(sd.to_dict()).storage_precision == "uint8"
+
+    # Dictionaries serialized before the storage precision default to "double"
+    dictionary = sd.to_dict()
+    del dictionary["storage_precision"]
+    assert SpectroData.from_dict(dictionary).storage_precision == "double"
+
+    sds = SpectroDataset([sd])
+    sds.storage_precision = "single"
+    assert SpectroDataset.from_dict(sds.to_dict()).storage_precision == "single"
+
+
 @pytest.mark.parametrize(
     (
         "audio_files",
@@ -3,6 +3,9 @@ from __future__ import annotations
 import contextlib
 import datetime
 import gc
+import itertools
+import pickle
+import typing
 from contextlib import nullcontext
 from pathlib import Path
 
@@ -10,6 +13,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
+from matplotlib.figure import Figure
 from pandas import Timedelta, Timestamp
 from scipy.signal import ShortTimeFFT
 from scipy.signal.windows import hamming
@@ -31,7 +35,12 @@ from osekit.core.spectro_data import SpectroData
 from osekit.core.spectro_dataset import SpectroDataset
 from osekit.core.spectro_file import SpectroFile
 from osekit.core.spectro_item import SpectroItem
-from osekit.utils.audio import Normalization, generate_sample_audio
+from osekit.utils.audio import (
+    Normalization,
+    generate_sample_audio,
+    stft_batch,
+    stft_stream,
+)
 from tests.helpers.audio import MockedAudioData, MockedAudioFile
 from tests.helpers.dummy import DummyFile
 
@@ -1519,7 +1528,7 @@ def test_garbage_collection_after_save_spectrogram(
 
     monkeypatch.setattr(gc, "collect", patch_collect)
     monkeypatch.setattr(SpectroData, "plot", lambda *args, **kwargs: None)
-    monkeypatch.setattr(plt, "savefig", lambda *args, **kwargs: None)
+    monkeypatch.setattr(Figure, "savefig", lambda *args, **kwargs: None)
 
     sd.save_spectrogram(tmp_path / "output")
 
@@ -1545,6 +1554,64 @@ def test_garbage_collection_after_save_spectrogram(
     assert collect_calls[0] == 12  # noqa: PLR2004
 
 
+def test_save_spectrogram_does_not_register_pyplot_figures(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ad = MockedAudioData(
+        mocked_value=np.random.default_rng(seed=0).standard_normal(4_800),
+        sample_rate=48_000,
+    )
+    sd = SpectroData.from_audio_data(
+        ad,
+        ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate),
+    )
+
+    saved_figures = []
+    monkeypatch.setattr(
+        Figure,
+        "savefig",
+        lambda figure, *args, **kwargs: saved_figures.append(figure),
+    )
+    pyplot_figures = []
+    pyplot_figure = plt.figure
+
+    def record_pyplot_figure(*args: list, **kwargs: dict) -> Figure:
+        figure = pyplot_figure(*args, **kwargs)
+        pyplot_figures.append(figure)
+        return figure
+
+    monkeypatch.setattr(plt, "figure", record_pyplot_figure)
+
+    sd.save_spectrogram(tmp_path)
+
+    assert pyplot_figures == []
+    assert len(saved_figures) == 1
+    assert len(saved_figures[0].axes) == 1
+
+
+def test_save_spectrogram_closes_pyplot_figures(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ad = MockedAudioData(
+        mocked_value=np.random.default_rng(seed=0).standard_normal(4_800),
+        sample_rate=48_000,
+    )
+    sd = SpectroData.from_audio_data(
+        ad,
+        ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate),
+    )
+    monkeypatch.setattr(Figure, "savefig", lambda *args, **kwargs: None)
+    plt.close("all")
+
+    for _ in range(3):
+        _, ax = plt.subplots()
+        sd.save_spectrogram(tmp_path, ax=ax)
+
+    assert plt.get_fignums() == []
+
+
 def test_spectrodataset_scale(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1573,7 +1640,7 @@ def test_spectrodataset_scale(
 
     monkeypatch.setattr(SpectroData, "plot", mock_plot)
     monkeypatch.setattr(SpectroData, "write", mock_empty_method)
-    monkeypatch.setattr(plt, "savefig", mock_empty_method)
+    monkeypatch.setattr(Figure, "savefig", mock_empty_method)
     sds.save_spectrogram(tmp_path)
     sds.save_all(tmp_path, tmp_path)
 
@@ -1690,9 +1757,8 @@ def test_spectro_dataset_data_from_dict(
 def test_spectro_multichannel_audio_file(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    ad = MockedAudioData(
-        mocked_value=np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]),
-    )
+    mocked_value = np.arange(4 * 1_000).reshape(-1, 4)
+    ad = MockedAudioData(mocked_value=mocked_value)
 
     sft = ShortTimeFFT(win=hamming(512), hop=128, fs=48_000)
 
@@ -1700,16 +1766,24 @@ def test_spectro_multichannel_audio_file(
 
     treated_audio = []
 
-    def patch_stft(*args: list, **kwargs: dict) -> None:
-        treated_audio.append(kwargs["x"])
+    def patch_stft_stream(
+        fft: ShortTimeFFT,
+        chunks: typing.Iterable[np.ndarray],
+    ) -> typing.Generator[np.ndarray, None, None]:
+        chunks = list(chunks)
+        treated_audio.append(np.concatenate(chunks))
+        return stft_stream(fft=fft, chunks=chunks)
 
-    monkeypatch.setattr(ShortTimeFFT, "stft", patch_stft)
+    monkeypatch.setattr(
+        "osekit.core.spectro_data.stft_stream",
+        patch_stft_stream,
+    )
 
     sd.get_value()
 
     assert np.array_equal(
         treated_audio[0],
-        [1, 5, 9],
+        mocked_value[:, 0],
     )  # Only first channel is accounted for.
 
 
@@ -1834,6 +1908,29 @@ def test_spectro_get_value_from_items_errors(
         SpectroData([si1, si3]).get_value()
 
 
+@pytest.mark.parametrize(
+    "sx_dtype",
+    [
+        pytest.param(complex, id="complex"),
+        pytest.param(float, id="absolute"),
+    ],
+)
+def test_empty_spectro_item_value_is_not_allocated(sx_dtype: type) -> None:
+    sft = ShortTimeFFT(hamming(512), hop=128, fs=48_000)
+    item = SpectroItem(
+        begin=Timestamp("2009-02-24 00:00:00"),
+        end=Timestamp("2009-02-24 01:00:00"),
+    )
+
+    value = item.get_value(fft=sft, sx_dtype=sx_dtype)
+
+    assert value.shape == (sft.f.shape[0], sft.p_num(3_600 * 48_000))
+    assert value.dtype == sx_dtype
+    assert not value.any()
+    assert not value.flags.writeable
+    assert value.base.nbytes == np.dtype(sx_dtype).itemsize
+
+
 def test_spectro_populated_duration(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1955,14 +2052,16 @@ def test_spectro_data_with_multichannel_audio(monkeypatch: pytest.MonkeyPatch) -
     )
 
     last_fetched_audio = []
-    fft_stft = ShortTimeFFT.stft
 
-    def mock_stft(*args, **kwargs) -> np.ndarray:
-        last_fetched_audio.clear()
-        last_fetched_audio[:] = kwargs["x"]
-        return fft_stft(self=sd.fft, *args, **kwargs)
+    def mock_stft_stream(
+        fft: ShortTimeFFT,
+        chunks: typing.Iterable[np.ndarray],
+    ) -> typing.Generator[np.ndarray, None, None]:
+        chunks = list(chunks)
+        last_fetched_audio[:] = np.concatenate(chunks)
+        return stft_stream(fft=fft, chunks=chunks)
 
-    monkeypatch.setattr(sd.fft, "stft", mock_stft)
+    monkeypatch.setattr("osekit.core.spectro_data.stft_stream", mock_stft_stream)
 
     sd.get_value()
     assert np.array_equal(last_fetched_audio, [m[0] for m in mocked_audio_value])
@@ -1996,3 +2095,427 @@ def test_spectrodata_audio_channel_raises_if_not_in_audio_data_channels() -> Non
         ValueError, match=r"channel 1: AudioData only targets channels \[0, 2\]"
     ):
         sd.audio_channel = 1
+
+
+@pytest.mark.parametrize(
+    ("win_size", "hop", "mfft", "nb_samples", "chunk_size"),
+    [
+        pytest.param(512, 128, None, 10_000, 1_000, id="overlapping_windows"),
+        pytest.param(512, 512, None, 10_000, 1_000, id="no_overlap"),
+        pytest.param(513, 100, 1024, 10_001, 777, id="odd_window_and_mfft"),
+        pytest.param(512, 128, None, 10_000, 1, id="one_sample_chunks"),
+        pytest.param(512, 128, None, 10_000, 20_000, id="single_chunk"),
+        pytest.param(512, 128, None, 300, 64, id="signal_shorter_than_window"),
+    ],
+)
+def test_stft_stream(
+    win_size: int,
+    hop: int,
+    mfft: int | None,
+    nb_samples: int,
+    chunk_size: int,
+) -> None:
+    fft = ShortTimeFFT(win=hamming(win_size), hop=hop, fs=48_000, mfft=mfft)
+    x = np.random.default_rng(seed=0).standard_normal(nb_samples)
+
+    buffer_sizes = []
+    stft = fft.stft
+
+    def record_stft(**kwargs: dict) -> np.ndarray:
+        buffer_sizes.append(len(kwargs["x"]))
+        return stft(**kwargs)
+
+    fft.stft = record_stft
+
+    blocks = list(
+        stft_stream(
+            fft=fft,
+            chunks=(x[i : i + chunk_size] for i in range(0, nb_samples, chunk_size)),
+        ),
+    )
+
+    assert np.array_equal(np.hstack(blocks), stft(x=x, padding="zeros"))
+    assert max(buffer_sizes) <= min(nb_samples, chunk_size + 2 * fft.m_num)
+
+
+def test_overlapped_bins_are_computed_once_per_seam(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ad = MockedAudioData(
+        mocked_value=np.random.default_rng(seed=0).standard_normal(48_000),
+        sample_rate=48_000,
+    )
+    sd = SpectroData.from_audio_data(
+        ad,
+        ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate),
+    )
+    parts = sd.split(4)
+
+    seams = [
+        SpectroData.get_overlapped_bins(sd1, sd2)
+        for sd1, sd2 in itertools.pairwise(parts)
+    ]
+
+    split_frames_calls = []
+    split_frames = AudioData.split_frames
+
+    def count_split_frames(self: AudioData, **kwargs: dict) -> AudioData:
+        split_frames_calls.append(kwargs)
+        return split_frames(self, **kwargs)
+
+    monkeypatch.setattr(AudioData, "split_frames", count_split_frames)
+
+    values = [part.get_value() for part in parts]
+
+    # Only the end of the previous part is read again, once per seam
+    assert len(split_frames_calls) == len(seams)
+    assert all("stop_frame" not in call for call in split_frames_calls)
+
+    for value, seam in zip(values[1:], seams, strict=True):
+        assert np.array_equal(value[:, : seam.shape[1]], seam)
+    assert sum(value.shape[1] for value in values) == sd.get_value().shape[1]
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 10,
+                "sample_rate": 4_800,
+                "nb_files": 1,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            id="10_seconds_audio",
+        ),
+    ],
+    indirect=True,
+)
+def test_split_spectro_data_pickle_without_the_chain(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files)
+    sd = SpectroData.from_audio_data(
+        ad,
+        ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate),
+    )
+
+    lone_size = len(pickle.dumps(sd))
+
+    for nb_parts in (3, 100):
+        parts = sd.split(nb_parts)
+        pickled_parts = [pickle.dumps(part) for part in parts]
+
+        # Each part carries at most its two neighbour boundaries
+        assert max(len(p) for p in pickled_parts) < 4 * lone_size
+
+        unpickled_parts = [pickle.loads(p) for p in pickled_parts]  # noqa: S301
+        for part, unpickled_part in zip(parts, unpickled_parts, strict=True):
+            assert np.array_equal(part.get_value(), unpickled_part.get_value())
+            assert (part.previous_data is None) == (
+                unpickled_part.previous_data is None
+            )
+            assert (part.next_data is None) == (unpickled_part.next_data is None)
+
+
+@pytest.mark.parametrize(
+    ("fft", "nb_samples"),
+    [
+        pytest.param(
+            ShortTimeFFT(win=hamming(512), hop=128, fs=48_000),
+            10_000,
+            id="overlapping_windows",
+        ),
+        pytest.param(
+            ShortTimeFFT(win=hamming(513), hop=100, fs=48_000, mfft=1024),
+            10_001,
+            id="odd_window_and_mfft",
+        ),
+        pytest.param(
+            ShortTimeFFT(
+                win=hamming(256),
+                hop=64,
+                fs=48_000,
+                fft_mode="onesided2X",
+                scale_to="psd",
+            ),
+            10_000,
+            id="scaled_onesided2X",
+        ),
+        pytest.param(
+            ShortTimeFFT(win=hamming(64), hop=1, fs=48_000, fft_mode="centered"),
+            1_000,
+            id="centered",
+        ),
+    ],
+)
+def test_stft_batch(fft: ShortTimeFFT, nb_samples: int) -> None:
+    x = np.random.default_rng(seed=0).standard_normal((5, nb_samples))
+
+    expected = np.stack([fft.stft(x=signal, padding="zeros") for signal in x])
+
+    assert np.allclose(stft_batch(fft=fft, x=x), expected)
+    assert np.allclose(stft_batch(fft=fft, x=x, workers=2), expected)
+
+
+@pytest.mark.parametrize(
+    "audio_files",
+    [
+        pytest.param(
+            {
+                "duration": 10,
+                "sample_rate": 4_800,
+                "nb_files": 1,
+                "date_begin": pd.Timestamp("2024-01-01 12:00:00"),
+            },
+            id="10_seconds_audio",
+        ),
+    ],
+    indirect=True,
+)
+def test_spectro_dataset_get_values(
+    audio_files: tuple[list[AudioFile], pytest.fixtures.Subrequest],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    files, _ = audio_files
+    ad = AudioData.from_files(files)
+    fft = ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate)
+
+    # Equal-length data, a chain of split data and a data linked to a npz file
+    sds = SpectroDataset.from_audio_dataset(
+        AudioDataset([*ad.split(5), ad]),
+        fft=fft,
+    )
+    sds.data += SpectroData.from_audio_data(ad, fft).split(3)
+    sds.data[0].sx_dtype = float
+    sds.data[1].write(tmp_path, link=True)
+
+    batch_sizes = []
+    get_batch_values = SpectroDataset._get_batch_values
+
+    def record_batch(batch: list[SpectroData], **kwargs: dict) -> list[np.ndarray]:
+        batch_sizes.append(len(batch))
+        return get_batch_values(batch, **kwargs)
+
+    monkeypatch.setattr(SpectroDataset, "_get_batch_values", record_batch)
+
+    values = sds.get_values(batch_size=3)
+
+    assert len(values) == len(sds.data)
+    for sd, value in zip(sds.data, values, strict=True):
+        assert np.allclose(value, sd.get_value())
+    assert sum(batch_sizes) == len(sds.data) - 1
+    assert max(batch_sizes) == 3  # noqa: PLR2004
+
+    assert [
+        np.allclose(a, b)
+        for a, b in zip(sds.get_values(first=2, last=5), values[2:5], strict=True)
+    ] == [True] * 3
+
+    with pytest.raises(ValueError, match="The batch size must be at least 1"):
+        sds.get_values(batch_size=0)
+
+
+def test_spectro_dataset_get_values_with_truncated_audio() -> None:
+    rng = np.random.default_rng(seed=0)
+    afs = [
+        MockedAudioFile(
+            mocked_value=rng.standard_normal(nb_samples),
+            sample_rate=1_000,
+            begin=Timestamp("2000-01-01") + Timedelta(seconds=10 * index),
+        )
+        for index, nb_samples in enumerate((2_000, 1_500, 2_000))
+    ]
+    # The second file streams fewer samples than its duration covers
+    afs[1].end = afs[1].begin + Timedelta(seconds=2)
+
+    sds = SpectroDataset(
+        [
+            SpectroData.from_audio_data(
+                AudioData.from_files([af]),
+                ShortTimeFFT(win=hamming(128), hop=32, fs=1_000),
+            )
+            for af in afs
+        ],
+    )
+    sds.fft = sds.data[0].fft
+    assert {sd.audio_data.shape[0] for sd in sds.data} == {2_000}
+
+    values = sds.get_values(batch_size=3)
+
+    for sd, value in zip(sds.data, values, strict=True):
+        assert value.shape == sd.get_value().shape
+        assert np.allclose(value, sd.get_value())
+
+
+def test_stft_stream_multichannel() -> None:
+    fft = ShortTimeFFT(win=hamming(512), hop=128, fs=48_000)
+    x = np.random.default_rng(seed=0).standard_normal((10_000, 3))
+
+    blocks = list(
+        stft_stream(
+            fft=fft,
+            chunks=(x[i : i + 3_000] for i in range(0, len(x), 3_000)),
+        ),
+    )
+
+    assert np.array_equal(
+        np.concatenate(blocks, axis=-1),
+        np.stack([fft.stft(x=x[:, c], padding="zeros") for c in range(3)]),
+    )
+
+
+def test_spectro_data_get_channel_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    af = MockedAudioFile(
+        mocked_value=np.random.default_rng(seed=0).standard_normal((4_000, 3)),
+        sample_rate=1_000,
+    )
+    ad = AudioData.from_files(files=[af])
+    ad.channels = [0, 2]
+    sd = SpectroData.from_audio_data(
+        data=ad,
+        fft=ShortTimeFFT(win=hamming(128), hop=32, fs=ad.sample_rate),
+    )
+    sd.sx_dtype = float
+
+    for data in (sd, *sd.split(3)):
+        values = data.get_channel_values()
+        assert values.shape[0] == len(ad.channels)
+        for channel, value in zip(ad.channels, values, strict=True):
+            data.audio_channel = channel
+            assert np.allclose(value, data.get_value())
+            assert np.allclose(value, data.channel_data(channel).get_value())
+
+    assert np.array_equal(
+        sd.get_channel_values(channels=[2, 0]),
+        sd.get_channel_values()[::-1],
+    )
+
+    stream_calls = []
+    stream_value_calibrated = AudioData.stream_value_calibrated
+
+    def count_streams(self: AudioData, **kwargs: dict) -> np.ndarray:
+        stream_calls.append(kwargs)
+        return stream_value_calibrated(self, **kwargs)
+
+    monkeypatch.setattr(AudioData, "stream_value_calibrated", count_streams)
+
+    # The audio is read once for all channels
+    sd.get_channel_values()
+    assert len(stream_calls) == 1
+
+    with pytest.raises(
+        ValueError,
+        match=r"channel 1: AudioData only targets channels \[0, 2\]",
+    ):
+        sd.get_channel_values(channels=[0, 1])
+
+
+def test_spectro_dataset_save_all_channels(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    af = MockedAudioFile(
+        mocked_value=np.random.default_rng(seed=0).standard_normal((4_000, 3)),
+        sample_rate=1_000,
+    )
+    ad = AudioData.from_files(files=[af])
+    sds = SpectroDataset.from_audio_dataset(
+        AudioDataset(ad.split(2)),
+        fft=ShortTimeFFT(win=hamming(128), hop=32, fs=ad.sample_rate),
+    )
+
+    saved_spectrograms = []
+    monkeypatch.setattr(
+        Figure,
+        "savefig",
+        lambda _, fname, **kwargs: saved_spectrograms.append(Path(fname).name),
+    )
+
+    sds.save_all_channels(
+        spectrum_folder=tmp_path,
+        spectrogram_folder=tmp_path,
+        channels=[0, 2],
+    )
+
+    for sd in sds.data:
+        assert saved_spectrograms.count(f"{sd}_ch0") == 1
+        assert saved_spectrograms.count(f"{sd}_ch2") == 1
+        for channel in (0, 2):
+            sd.audio_channel = channel
+            sf = SpectroFile(path=tmp_path / f"{sd}_ch{channel}.npz", begin=sd.begin)
+            assert np.allclose(sf.read(start=sf.begin, stop=sf.end), sd.get_value())
+        assert not (tmp_path / f"{sd}_ch1.npz").exists()
+
+
+@pytest.mark.parametrize(
+    ("sx_dtype", "storage_precision", "stored_dtype", "max_db_error"),
+    [
+        pytest.param(complex, "double", np.complex128, 0.0, id="double_complex"),
+        pytest.param(float, "double", np.float64, 0.0, id="double_float"),
+        pytest.param(complex, "single", np.complex64, 1e-4, id="single_complex"),
+        pytest.param(float, "single", np.float32, 1e-4, id="single_float"),
+        pytest.param(float, "uint16", np.uint16, 1e-2, id="uint16"),
+        pytest.param(complex, "uint8", np.uint8, 1.0, id="uint8_from_complex"),
+    ],
+)
+def test_spectro_storage_precision(
+    tmp_path: Path,
+    sx_dtype: type,
+    storage_precision: str,
+    stored_dtype: np.dtype,
+    max_db_error: float,
+) -> None:
+    ad = MockedAudioData(
+        mocked_value=np.random.default_rng(seed=0).standard_normal(48_000),
+        sample_rate=48_000,
+    )
+    sd = SpectroData.from_audio_data(
+        ad,
+        ShortTimeFFT(win=hamming(512), hop=128, fs=ad.sample_rate),
+    )
+    sd.sx_dtype = sx_dtype
+    sx = sd.get_value()
+    with pytest.raises(ValueError, match="Unknown storage precision"):
+        sd.storage_precision = "half"
+    sd.storage_precision = storage_precision
+
+    sd.write(tmp_path, sx=sx, link=True)
+
+    with np.load(tmp_path / f"{sd}.npz") as data:
+        assert data["sx"].dtype == stored_dtype
+
+    # Quantized spectra are read back as power values
+    if stored_dtype in (np.uint16, np.uint8):
+        sx = abs(sx) ** 2 if sx_dtype is complex else sx
+        assert sd.sx_dtype is float
+    sf = SpectroFile(path=tmp_path / f"{sd}.npz", begin=sd.begin)
+    read_sx = sf.read(start=sf.begin, stop=sf.end)
+    assert read_sx.shape == sx.shape
+
+    def power_db(values: np.ndarray) -> np.ndarray:
+        return 10 * np.log10(abs(values) ** 2 if np.iscomplexobj(values) else values)
+
+    assert np.allclose(power_db(read_sx), power_db(sx), rtol=0, atol=max_db_error)
+    assert np.array_equal(sd.get_value(), read_sx)
+
+
+def test_spectro_quantized_storage_keeps_zeros() -> None:
+    sx = np.array([[0.0, 1e-6, 1.0], [1e3, 0.0, 1e-3]])
+
+    encoded = SpectroFile.encode_sx(sx, precision="uint8")
+    sx_read = SpectroFile._dequantize(
+        encoded["sx"],
+        scale=encoded["sx_scale"][0],
+        offset=encoded["sx_offset"][0],
+    )
+
+    assert np.array_equal(sx_read == 0, sx == 0)
+    assert np.allclose(sx_read[sx > 0], sx[sx > 0], rtol=0.05)
+
+    with pytest.raises(TypeError, match="Complex sx values can't be quantized"):
+        SpectroFile.encode_sx(sx.astype(complex), precision="uint8")
+    with pytest.raises(ValueError, match="Unknown storage precision"):
+        SpectroFile.encode_sx(sx, precision="half")
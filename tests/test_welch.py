@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 from pandas import Timestamp
-from scipy.signal import ShortTimeFFT
+from scipy.signal import ShortTimeFFT, welch
 from scipy.signal.windows import hamming
 
 from osekit.core.audio_data import AudioData
@@ -142,6 +142,61 @@ def test_welch_spectrodataset(
         assert np.array_equal(pxs[i], sd.get_welch())
 
 
+@pytest.mark.parametrize(
+    ("audio_files", "sft", "average"),
+    [
+        pytest.param(
+            {"duration": 3, "sample_rate": 48_000, "series_type": "noise"},
+            ShortTimeFFT(win=hamming(2048), fs=48_000, hop=1000),
+            "mean",
+            id="streamed_mean",
+        ),
+        pytest.param(
+            {"duration": 3, "sample_rate": 48_000, "series_type": "noise"},
+            ShortTimeFFT(win=hamming(2048), fs=48_000, hop=2048),
+            "mean",
+            id="streamed_mean_halved_overlap",
+        ),
+        pytest.param(
+            {"duration": 3, "sample_rate": 48_000, "series_type": "noise"},
+            ShortTimeFFT(win=hamming(2048), fs=48_000, hop=1000),
+            "median",
+            id="median",
+        ),
+        pytest.param(
+            {"duration": 0.01, "sample_rate": 48_000, "series_type": "noise"},
+            ShortTimeFFT(win=hamming(256), fs=48_000, hop=128),
+            "mean",
+            id="single_chunk",
+        ),
+    ],
+    indirect=["audio_files"],
+)
+def test_welch_is_streamed(
+    audio_files: pytest.fixture,
+    sft: ShortTimeFFT,
+    average: str,
+) -> None:
+    afs, _ = audio_files
+    ad = AudioData.from_files(
+        files=afs,
+        instrument=Instrument(end_to_end_db=150.0),
+    )
+    sd = SpectroData.from_audio_data(data=ad, fft=sft)
+
+    noverlap = sft.hop if sft.hop != len(sft.win) else sft.hop // 2
+    _, expected = welch(
+        ad.get_value_calibrated()[:, 0],
+        fs=ad.sample_rate,
+        window=sft.win,
+        noverlap=noverlap,
+        nfft=sft.mfft,
+        average=average,
+    )
+
+    assert np.allclose(sd.get_welch(average=average), expected)
+
+
 def test_welch_provided_pxs(
     monkeypatch: pytest.MonkeyPatch,
     audio_files: pytest.fixture,
@@ -156,7 +211,7 @@ def test_welch_provided_pxs(
     get_welch_method = SpectroDataset._get_welch
     pxs_computation_count = [0]
 
-    def patch_get_welch(*args: list, **kwargs: dict) -> tuple[SpectroData, np.ndarray]:
+    def patch_get_welch(*args: list, **kwargs: dict) -> np.ndarray:
         pxs_computation_count[0] += 1
         return get_welch_method(*args, **kwargs)
 